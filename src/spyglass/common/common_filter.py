@@ -1,6 +1,6 @@
 # code to define filters that can be applied to continuous time data
 import warnings
-from typing import Union
+from typing import Iterable, Optional, Tuple, Union
 
 import datajoint as dj
 import matplotlib.pyplot as plt
@@ -8,6 +8,7 @@ import numpy as np
 import psutil
 import pynwb
 import scipy.signal as signal
+from hdmf.data_utils import GenericDataChunkIterator
 
 from spyglass.utils import SpyglassMixin, logger
 from spyglass.utils.nwb_helper_fn import get_electrode_indices
@@ -562,6 +563,79 @@ class FirFilterParameters(SpyglassMixin, dj.Manual):
 
         return filtered_data, new_timestamps
 
+    def filter_data_iterator(
+        self,
+        timestamps,
+        data,
+        filter_coeff,
+        valid_times,
+        electrodes,
+        decimation,
+        reference_electrodes=None,
+        start_index: int = 0,
+        **iterator_kwargs,
+    ):
+        """Streaming counterpart of filter_data for data left on disk.
+
+        Filtering happens in time blocks as the returned iterator is written,
+        e.g., as the data of an ElectricalSeries, so neither the input nor the
+        output is held in memory. Time must be the first axis of data.
+
+        Parameters
+        ----------
+        timestamps: numpy array
+            Timestamps for rows start_index to start_index + len(timestamps)
+            of data. Data outside these rows are treated as zero, as in
+            filter_data.
+        data:
+            original data array, e.g. an h5py dataset
+        filter_coeff: numpy array
+            Filter coefficients for FIR filter
+        valid_times: 2D numpy array
+            Start and stop times of intervals to be filtered
+        electrodes: list
+            Electrodes (column indices of data) to filter
+        decimation:
+            decimation factor
+        reference_electrodes: list, optional
+            Column index of the reference for each electrode, or -1 for no
+            reference. References are subtracted before filtering.
+        start_index: int, optional
+            Row of data corresponding to timestamps[0]. Default 0.
+        iterator_kwargs: dict
+            Passed to FirFilterDataChunkIterator, e.g. buffer_gb.
+
+        Return
+        ------
+        filtered_data_iterator, timestamps
+        """
+        n_samples = len(timestamps)
+
+        indices = []
+        new_timestamps = []
+        for a_start, a_stop in valid_times:
+            frm, to = self._time_bound_check(
+                a_start, a_stop, timestamps, n_samples
+            )
+            if np.isclose(frm, to, rtol=0, atol=1e-8):
+                continue
+            indices.append((start_index + frm, start_index + to))
+            new_timestamps.append(timestamps[frm:to:decimation])
+
+        data_iterator = FirFilterDataChunkIterator(
+            data,
+            filter_coeff,
+            index_bounds=indices,
+            decimation=decimation,
+            electrodes=electrodes,
+            reference_electrodes=reference_electrodes,
+            data_bounds=(start_index, start_index + n_samples),
+            **iterator_kwargs,
+        )
+        return data_iterator, np.concatenate(
+            [np.empty(0, dtype=np.asarray(timestamps).dtype), *new_timestamps]
+        )
+
     def calc_filter_delay(self, filter_coeff):
         """
         Parameters
@@ -593,3 +667,135 @@ class FirFilterParameters(SpyglassMixin, dj.Manual):
             [400, 425],
             "standard LFP filter for 30 KHz data",
         )
+
+
+class FirFilterDataChunkIterator(GenericDataChunkIterator):
+    """Filter and decimate data on disk one buffer of output samples at a time.
+
+    Each buffer reads only the rows it needs, plus the filter length on either
+    side, and only the filtered and reference channels. Output matches
+    FirFilterParameters.filter_data on the same data.
+    """
+
+    def __init__(
+        self,
+        data,
+        filter_coeff: np.ndarray,
+        index_bounds: Iterable[Tuple[int, int]],
+        decimation: int,
+        electrodes: Iterable[int],
+        reference_electrodes: Optional[Iterable[int]] = None,
+        data_bounds: Optional[Tuple[int, int]] = None,
+        **kwargs,
+    ):
+        """
+        Parameters
+        ----------
+        data : array-like
+            Data with time as the first axis, e.g. an h5py dataset.
+        filter_coeff : np.ndarray
+            Filter coefficients for FIR filter.
+        index_bounds : list of tuple
+            Start (inclusive) and stop (exclusive) rows of data to filter.
+        decimation : int
+            Decimation factor.
+        electrodes : list of int
+            Column indices of data to filter.
+        reference_electrodes : list of int, optional
+            Column index of the reference for each electrode, or -1 for no
+            reference. Default no reference.
+        data_bounds : tuple of int, optional
+            Rows of data that may be read. Data outside are treated as zero.
+            Default all rows.
+        kwargs : dict
+            Passed to GenericDataChunkIterator, e.g. buffer_gb or chunk_mb.
+        """
+        self.data = data
+        self.filter_coeff = np.asarray(filter_coeff)
+        self.decimation = int(decimation)
+        self.electrodes = np.asarray(electrodes, dtype=int)
+        self.reference_electrodes = (
+            np.full_like(self.electrodes, -1)
+            if reference_electrodes is None
+            else np.asarray(reference_electrodes, dtype=int)
+        )
+        self.index_bounds = np.array(index_bounds, dtype=int).reshape(-1, 2)
+        self.data_bounds = data_bounds or (0, data.shape[0])
+
+        n_output = -(-np.diff(self.index_bounds, axis=1)[:, 0] // decimation)
+        self.output_offsets = np.r_[0, np.cumsum(n_output)].astype(int)
+        super().__init__(**kwargs)
+
+    def _get_data(self, selection: Tuple[slice]) -> np.ndarray:
+        rows, channels = selection[0], selection[1]
+        electrodes = self.electrodes[channels]
+        references = self.reference_electrodes[channels]
+
+        out = np.empty((rows.stop - rows.start, len(electrodes)), self.dtype)
+        offsets = self.output_offsets
+        overlap = (offsets[:-1] < rows.stop) & (offsets[1:] > rows.start)
+        for ii in np.flatnonzero(overlap):
+            first = max(rows.start, offsets[ii])
+            last = min(rows.stop, offsets[ii + 1])
+            start = self.index_bounds[ii, 0] - offsets[ii] * self.decimation
+            out[first - rows.start : last - rows.start] = self._filter_block(
+                start + first * self.decimation,
+                start + (last - 1) * self.decimation,
+                electrodes,
+                references,
+            )
+        return out
+
+    def _filter_block(self, first, last, electrodes, references):
+        """Filter output samples centered on rows first to last, inclusive."""
+        gsp = _import_ghostipy()
+
+        n_taps = len(self.filter_coeff)
+        filter_delay = (n_taps - 1) // 2
+        pad = n_taps - 1 - filter_delay
+        n_input = last - first + 1
+
+        # the block holds every row the kernel touches, plus one row that
+        # ghostipy checks past the input bounds
+        block = self._read_block(
+            first - pad, last + filter_delay + 2, electrodes, references
+        )
+        out = np.empty(
+            (-(-n_input // self.decimation), len(electrodes)), self.dtype
+        )
+        gsp.filter_data_fir(
+            block,
+            self.filter_coeff,
+            axis=0,
+            input_index_bounds=[pad, pad + n_input],
+            output_index_bounds=[filter_delay, filter_delay + n_input],
+            ds=self.decimation,
+            outarray=out,
+        )
+        return out
+
+    def _read_block(self, start, stop, electrodes, references):
+        """Read referenced rows start to stop, zero outside data_bounds."""
+        block = np.zeros((stop - start, len(electrodes)), self.dtype)
+        read_start = max(start, self.data_bounds[0])
+        read_stop = min(stop, self.data_bounds[1])
+        if read_start >= read_stop:
+            return block
+
+        # h5py requires increasing column indices
+        has_ref = references != -1
+        columns = np.unique(np.r_[electrodes, references[has_ref]])
+        raw = np.asarray(self.data[read_start:read_stop, columns.tolist()])
+
+        referenced = block[read_start - start : read_stop - start]
+        referenced[:] = raw[:, np.searchsorted(columns, electrodes)]
+        referenced[:, has_ref] -= raw[
+            :, np.searchsorted(columns, references[has_ref])
+        ]
+        return block
+
+    def _get_dtype(self):
+        return np.dtype(self.data.dtype)
+
+    def _get_maxshape(self):
+        return (int(self.output_offsets[-1]), len(self.electrodes))
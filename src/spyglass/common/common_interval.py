@@ -570,16 +570,20 @@ class Interval:
         padding : int, optional
             If True, pad the first and last timestamps by val. Defaults to None.
         """
-        ind = []
-        for interval in self.times:
-            ind += np.ravel(
-                np.argwhere(
-                    np.logical_and(
-                        timestamps >= interval[0], timestamps <= interval[1]
-                    )
-                )
-            ).tolist()
-        ret = np.asarray(ind) if as_indices else timestamps[ind]
+        timestamps = np.asarray(timestamps)
+        times = np.atleast_2d(self.times)
+        if not times.size:
+            ind = np.array([], dtype=int)
+        else:
+            lo, hi, order = self._searchsorted_bounds(times, timestamps)
+            ind = self._concat_ranges(lo, hi)
+            if (
+                order is not None
+            ):  # map back to original, ascending per interval
+                ind = order[ind]
+                interval_ids = np.repeat(np.arange(len(lo)), hi - lo)
+                ind = ind[np.lexsort((ind, interval_ids))]
+        ret = ind if as_indices else timestamps[ind]
 
         if padding:
             if ret[0] > 0:
@@ -598,10 +602,40 @@ class Interval:
         ----------
         timestamps : array_like
         """
-        contained_times = self.contains(timestamps, as_indices=as_indices)
+        timestamps = np.asarray(timestamps)
+        excluded = np.ones(len(timestamps), dtype=bool)
+        excluded[self.contains(timestamps, as_indices=True)] = False
         if as_indices:
-            timestamps = np.arange(len(timestamps))
-        return np.setdiff1d(timestamps, contained_times)
+            return np.flatnonzero(excluded)
+        return np.unique(timestamps[excluded])
+
+    @staticmethod
+    def _searchsorted_bounds(
+        times: np.ndarray, timestamps: np.ndarray
+    ) -> Tuple[np.ndarray, np.ndarray, Union[np.ndarray, None]]:
+        """Index bounds [lo, hi) of the timestamps within each interval.
+
+        Unsorted timestamps are sorted first. In that case, the sort order is
+        returned to map positions in the sorted array back to the input.
+        """
+        order = None
+        if not np.all(timestamps[1:] >= timestamps[:-1]):
+            order = np.argsort(timestamps, kind="stable")
+            timestamps = timestamps[order]
+        lo = np.searchsorted(timestamps, times[:, 0], side="left")
+        hi = np.searchsorted(timestamps, times[:, 1], side="right")
+        return lo, np.maximum(lo, hi), order
+
+    @staticmethod
+    def _concat_ranges(lo: np.ndarray, hi: np.ndarray) -> np.ndarray:
+        """Concatenate integer ranges [lo, hi) without a Python loop."""
+        lengths = hi - lo
+        keep = lengths > 0
+        lo, lengths = lo[keep], lengths[keep]
+        if not lengths.size:
+            return np.array([], dtype=int)
+        offsets = np.repeat(lo - np.cumsum(lengths) + lengths, lengths)
+        return np.arange(lengths.sum()) + offsets
 
     @staticmethod
     def _expand_1d(interval_list: np.ndarray) -> np.ndarray:
@@ -623,8 +657,13 @@ class Interval:
             interval_list = np.asarray(interval_list)
         if interval_list.ndim == 1:
             return self._expand_1d(interval_list)
+        if not len(interval_list):
+            return interval_list
 
         interval_list = interval_list[np.argsort(interval_list[:, 0])]
+        if np.all(interval_list[:, 1] > interval_list[:, 0]):
+            return self._sweep_consolidate(interval_list)
+        # zero-length intervals are never merged by _union_concat
         interval_list = self._union_consolidate(interval_list).times
 
         # reduce may convert to 1D, so check and expand
@@ -633,6 +672,22 @@ class Interval:
     def consolidate(self) -> T:
         return Interval(self._consolidate(self.times), **self.kwargs)
 
+    @staticmethod
+    def _sweep_consolidate(interval_list: np.ndarray) -> np.ndarray:
+        """Merge start-sorted, positive-length intervals in a single pass.
+
+        Matches _union_concat: an interval joins the current group only if it
+        starts strictly before the group's running stop.
+        """
+        stops = np.maximum.accumulate(interval_list[:, 1])
+        new_group = np.ones(len(interval_list), dtype=bool)
+        new_group[1:] = interval_list[1:, 0] >= stops[:-1]
+        group_starts = np.flatnonzero(new_group)
+        group_stops = np.append(group_starts[1:], len(interval_list)) - 1
+        return np.column_stack(
+            (interval_list[group_starts, 0], stops[group_stops])
+        )
+
     @staticmethod
     def _set_intersect(
         interval1: IntervalLike, interval2: IntervalLike
@@ -650,24 +705,41 @@ class Interval:
     ) -> T:
         """Finds the intersection of two interval lists."""
 
-        # Consolidate interval lists to disjoint by sorting & applying union
-        interval_list1 = self._consolidate(interval1)
-        interval_list2 = self._consolidate(interval2)
-
-        # then do pairwise comparison and collect intersections
-        intersection = [
-            self._set_intersect(i2, i1)
-            for i2 in interval_list2
-            for i1 in interval_list1
-            if self._set_intersect(i1, i2) is not None
+        # Zero-length intervals cannot intersect anything (end > start), so
+        # drop them and consolidate to sorted, disjoint lists
+        interval_list1, interval_list2 = [
+            self._consolidate(x[x[:, 1] > x[:, 0]]) if x.ndim == 2 else x
+            for x in (
+                self._expand_1d(np.asarray(interval1)),
+                self._expand_1d(np.asarray(interval2)),
+            )
         ]
+        if not (interval_list1.size and interval_list2.size):
+            return []
+
+        # Partners of each interval in list1 are a contiguous run of list2:
+        # those ending after it starts and starting before it ends
+        lo = np.searchsorted(
+            interval_list2[:, 1], interval_list1[:, 0], "right"
+        )
+        hi = np.searchsorted(interval_list2[:, 0], interval_list1[:, 1], "left")
+        hi = np.maximum(lo, hi)
+        ind1 = np.repeat(np.arange(len(interval_list1)), hi - lo)
+        ind2 = self._concat_ranges(lo, hi)
 
         # if no intersection, then return an empty list
-        if not intersection:
+        if not ind1.size:
             return []
 
-        intersection = np.asarray(intersection)
-        intersection = intersection[np.argsort(intersection[:, 0])]
+        intersection = np.column_stack(
+            (
+                np.maximum(interval_list1[ind1, 0], interval_list2[ind2, 0]),
+                np.minimum(interval_list1[ind1, 1], interval_list2[ind2, 1]),
+            )
+        )
+        intersection = intersection[intersection[:, 1] > intersection[:, 0]]
+        if not intersection.size:
+            return []
 
         return self._by_length(intersection, min_length=min_length)
 
@@ -24,7 +24,11 @@ from spyglass.common.common_nwbfile import AnalysisNwbfile
 from spyglass.settings import raw_dir, test_mode, video_dir
 from spyglass.utils import SpyglassMixin, logger
 from spyglass.utils.dj_helper_fn import deprecated_factory
-from spyglass.utils.position import convert_to_pixels, fill_nan
+from spyglass.utils.position import (
+    convert_to_pixels,
+    fill_nan,
+    interpolate_to_new_time,
+)
 
 try:
     from position_tools import get_centroid
@@ -310,14 +314,8 @@ class IntervalPositionInfo(SpyglassMixin, dj.Computed):
         new_time = np.linspace(
             upsampling_start_time, upsampling_end_time, n_samples
         )
-        new_index = pd.Index(
-            np.unique(np.concatenate((position_df.index, new_time))),
-            name="time",
-        )
-        position_df = (
-            position_df.reindex(index=new_index)
-            .interpolate(method=upsampling_interpolation_method)
-            .reindex(index=new_time)
+        position_df = interpolate_to_new_time(
+            position_df, new_time, upsampling_interpolation_method
         )
 
         time = np.asarray(position_df.index)
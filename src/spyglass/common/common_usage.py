@@ -119,7 +119,11 @@ class ExportSelection(SpyglassMixin, dj.Manual):
             """Override insert to auto-increment table_id."""
             if not isinstance(keys[0], dict):
                 raise TypeError("Pass Table Keys as list of dict")
-            keys = [self._auto_increment(k, pk="table_id") for k in keys]
+            next_id = self._auto_increment(dict(), pk="table_id")["table_id"]
+            keys = [
+                k if k.get("table_id") else dict(k, table_id=next_id + i)
+                for i, k in enumerate(keys)
+            ]
             super().insert(keys, **kwargs)
 
     class File(SpyglassMixin, dj.Part):
@@ -1,13 +1,19 @@
+import multiprocessing as mp
 import os
 import stat
 import warnings
+from concurrent.futures import ProcessPoolExecutor
+from functools import partial
 from pathlib import Path
-from typing import List, Union
+from time import perf_counter
+from typing import List, Tuple, Union
 
+import datajoint as dj
 import pynwb
 
 from spyglass.common import Nwbfile, get_raw_eseries, populate_all_common
 from spyglass.common.common_nwbfile import schema as nwbfile_schema
+from spyglass.common.errors import PopulateException
 from spyglass.settings import debug_mode, raw_dir, test_mode
 from spyglass.utils import logger
 from spyglass.utils.nwb_helper_fn import get_nwb_copy_filename
@@ -18,6 +24,7 @@ def insert_sessions(
     rollback_on_fail: bool = False,
     raise_err: bool = False,
     reinsert: bool = False,
+    n_jobs: int = 1,
 ):
     """Populate the database with new sessions.
 
@@ -35,37 +42,28 @@ def insert_sessions(
     reinsert : bool, optional
         If True and the nwb file already exists in the Nwbfile table,
         reinsert the data. Default is False.
+    n_jobs : int, optional
+        Number of sessions to copy and populate at once, each in its own
+        process with its own database connection and transactions. Workers
+        are spawned fresh, so they read the DataJoint config from the config
+        file or environment. Workers cannot prompt, e.g. to add a device not
+        yet in the database, and fail the session instead. Default 1,
+        inserting sessions in this process.
+
+    Returns
+    -------
+    List
+        A list of keys for InsertError entries if any errors occurred.
     """
 
     if not isinstance(nwb_file_names, list):
         nwb_file_names = [nwb_file_names]
 
+    sessions = dict()  # raw file name -> copy file name
     for nwb_file_name in nwb_file_names:
-        nwb_file_name = str(nwb_file_name)  # in case it's a Path object
-
-        if "/" in nwb_file_name:
-            nwb_file_name = nwb_file_name.split("/")[-1]
-
-        nwb_file_abs_path = Path(
-            Nwbfile.get_abs_path(nwb_file_name, new_file=True)
-        )
-
-        if not nwb_file_abs_path.exists():
-            possible_matches = sorted(Path(raw_dir).glob(f"*{nwb_file_name}*"))
-
-            if len(possible_matches) == 1:
-                nwb_file_abs_path = possible_matches[0]
-                nwb_file_name = nwb_file_abs_path.name
-
-            else:
-                raise FileNotFoundError(
-                    f"File not found: {nwb_file_abs_path}\n\t"
-                    + f"{len(possible_matches)} possible matches:"
-                    + f"{possible_matches}"
-                )
-
-        # file name for the copied raw data
-        out_nwb_file_name = get_nwb_copy_filename(nwb_file_abs_path.name)
+        nwb_file_name, out_nwb_file_name = _resolve_nwb_file(nwb_file_name)
+        if nwb_file_name in sessions:
+            continue
 
         # Check whether the file already exists in the Nwbfile table
         query = Nwbfile() & {"nwb_file_name": out_nwb_file_name}
@@ -82,16 +80,137 @@ def insert_sessions(
             )
             query.delete(safemode=False)
 
+        sessions[nwb_file_name] = out_nwb_file_name
+
+    if not sessions:
+        return None
+
+    insert = partial(
+        _insert_session, rollback_on_fail=rollback_on_fail, raise_err=raise_err
+    )
+    n_jobs = min(max(n_jobs, 1), len(sessions))
+    if n_jobs == 1:
+        summaries = [insert(*session) for session in sessions.items()]
+    else:
+        with ProcessPoolExecutor(
+            max_workers=n_jobs,
+            mp_context=mp.get_context("spawn"),
+            initializer=_init_insert_worker,
+        ) as pool:
+            futures = [
+                pool.submit(insert, *session) for session in sessions.items()
+            ]
+            summaries = [future.result() for future in futures]
+
+    _log_insert_summary(summaries)
+
+    errors = [key for summary in summaries for key in summary["errors"]]
+    return errors or None
+
+
+def _resolve_nwb_file(nwb_file_name: Union[str, Path]) -> Tuple[str, str]:
+    """Return the raw file name in the raw directory and its copy name."""
+    nwb_file_name = str(nwb_file_name)  # in case it's a Path object
+
+    if "/" in nwb_file_name:
+        nwb_file_name = nwb_file_name.split("/")[-1]
+
+    nwb_file_abs_path = Path(Nwbfile.get_abs_path(nwb_file_name, new_file=True))
+
+    if not nwb_file_abs_path.exists():
+        possible_matches = sorted(Path(raw_dir).glob(f"*{nwb_file_name}*"))
+
+        if len(possible_matches) == 1:
+            nwb_file_abs_path = possible_matches[0]
+            nwb_file_name = nwb_file_abs_path.name
+
+        else:
+            raise FileNotFoundError(
+                f"File not found: {nwb_file_abs_path}\n\t"
+                + f"{len(possible_matches)} possible matches:"
+                + f"{possible_matches}"
+            )
+
+    # file name for the copied raw data
+    return nwb_file_name, get_nwb_copy_filename(nwb_file_abs_path.name)
+
+
+def _init_insert_worker() -> None:
+    """Raise instead of prompting for input in a worker process.
+
+    Spawned workers have no stdin, so a prompt, e.g. from
+    common_device.prompt_insert, would fail with an unclear EOFError.
+    """
+
+    def no_prompt(prompt: str, *args, **kwargs):
+        raise PopulateException(
+            "Cannot prompt in an insert_sessions worker process: "
+            + f"{prompt}\nRun insert_sessions with n_jobs=1 to answer, or "
+            + "insert the missing entries first."
+        )
+
+    dj.utils.user_choice = no_prompt
+
+
+def _insert_session(
+    nwb_file_name: str,
+    out_nwb_file_name: str,
+    rollback_on_fail: bool = False,
+    raise_err: bool = False,
+) -> dict:
+    """Copy, link and populate one session, timing each step.
+
+    Returns a summary dict with the copy file name, seconds spent copying
+    and populating, InsertError keys and the error message of any
+    exception not raised.
+    """
+    summary = dict(
+        nwb_file_name=out_nwb_file_name,
+        copy_time=0.0,
+        populate_time=0.0,
+        errors=[],
+        exception=None,
+    )
+    try:
         # Make a copy of the NWB file that ends with '_'.
         # This has everything except the raw data but has a link to
         # the raw data in the original file
+        start = perf_counter()
         copy_nwb_link_raw_ephys(nwb_file_name, out_nwb_file_name)
         Nwbfile().insert_from_relative_file_name(out_nwb_file_name)
-        return populate_all_common(
+        summary["copy_time"] = perf_counter() - start
+
+        start = perf_counter()
+        errors = populate_all_common(
             out_nwb_file_name,
             rollback_on_fail=rollback_on_fail,
             raise_err=raise_err,
         )
+        summary["populate_time"] = perf_counter() - start
+        summary["errors"] = list(errors or [])
+    except Exception as e:
+        if raise_err:
+            raise
+        logger.error(f"Failed to insert {out_nwb_file_name}: {e}")
+        summary["exception"] = f"{type(e).__name__}: {e}"
+    return summary
+
+
+def _log_insert_summary(summaries: List[dict]) -> None:
+    """Log the timing and errors of each inserted session."""
+    lines = []
+    for summary in summaries:
+        status = summary["exception"] or f"{len(summary['errors'])} errors"
+        lines.append(
+            f"{summary['nwb_file_name']}: "
+            + f"copy {summary['copy_time']:.1f} s, "
+            + f"populate {summary['populate_time']:.1f} s, {status}"
+        )
+    n_failed = sum(bool(s["exception"] or s["errors"]) for s in summaries)
+    logger.info(
+        f"Inserted {len(summaries)} sessions, {n_failed} with errors:\n\t"
+        + "\n\t".join(lines)
+    )
 
 
 def copy_nwb_link_raw_ephys(
@@ -71,9 +71,16 @@ class DecodingOutput(_Merge, SpyglassMixin):
                         logger.warning(f"Unable to remove {path}, skipping")
 
     @classmethod
-    def fetch_results(cls, key):
-        """Fetch the decoding results for a given key."""
-        return cls().merge_restrict_class(key).fetch_results()
+    def fetch_results(cls, key, time_slice=None, variables=None):
+        """Fetch the decoding results for a given key.
+
+        See the parent table's fetch_results for time_slice and variables.
+        """
+        return (
+            cls()
+            .merge_restrict_class(key)
+            .fetch_results(time_slice=time_slice, variables=variables)
+        )
 
     @classmethod
     def fetch_model(cls, key):
@@ -131,7 +138,7 @@ class DecodingOutput(_Merge, SpyglassMixin):
         view
             Figurl visualization view (1D or 2D depending on decoder)
         """
-        results = cls.fetch_results(key)
+        results = cls.fetch_results(key, variables="acausal_posterior")
 
         # Filter to specific interval if requested
         if interval_idx is not None:
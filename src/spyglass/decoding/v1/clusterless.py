@@ -29,6 +29,9 @@ from spyglass.decoding.v1.utils import (
     concatenate_interval_results,
     create_interval_labels,
     get_valid_kwargs,
+    predict_intervals,
+    save_decoding_results,
+    select_decoding_results,
 )
 from spyglass.decoding.v1.waveform_features import (
     UnitWaveformFeatures,
@@ -36,7 +39,11 @@ from spyglass.decoding.v1.waveform_features import (
 from spyglass.position.position_merge import PositionOutput  # noqa: F401
 from spyglass.settings import config
 from spyglass.utils import SpyglassMixin, SpyglassMixinPart, logger
-from spyglass.utils.spikesorting import firing_rate_from_spike_indicator
+from spyglass.utils.spikesorting import (
+    firing_rate_from_spike_indicator,
+    multiunit_count_from_times,
+    spike_indicator_from_times,
+)
 
 schema = dj.schema("decoding_clusterless_v1")
 
@@ -238,7 +245,9 @@ class ClusterlessDecodingV1(SpyglassMixin, dj.Computed):
         decoding_params : dict
             Parameters for ClusterlessDetector initialization
         decoding_kwargs : dict
-            Additional kwargs for fit/predict
+            Additional kwargs for fit/predict. May include interval_n_jobs and
+            interval_executor to predict intervals in parallel, see
+            predict_intervals.
         position_info : pd.DataFrame
             Position data with time index
         position_variable_names : list[str]
@@ -284,6 +293,11 @@ class ClusterlessDecodingV1(SpyglassMixin, dj.Computed):
         ValueError
             If all decoding intervals are empty (no valid time points)
         """
+        # Options to predict decoding intervals in parallel, not passed on
+        decoding_kwargs = dict(decoding_kwargs)
+        interval_n_jobs = decoding_kwargs.pop("interval_n_jobs", 1)
+        interval_executor = decoding_kwargs.pop("interval_executor", "thread")
+
         classifier = ClusterlessDetector(**decoding_params)
 
         if key["estimate_decoding_params"]:
@@ -344,28 +358,18 @@ class ClusterlessDecodingV1(SpyglassMixin, dj.Computed):
             )
 
             # We treat each decoding interval as a separate sequence
-            interval_results = []
-            for interval_start, interval_end in decoding_interval:
-                interval_time = position_info.loc[
-                    interval_start:interval_end
-                ].index.to_numpy()
-
-                if interval_time.size == 0:
-                    logger.warning(
-                        f"Interval {interval_start}:{interval_end} is empty"
-                    )
-                    continue
-                interval_result = classifier.predict(
-                    position_time=interval_time,
-                    position=position_info.loc[interval_start:interval_end][
-                        position_variable_names
-                    ].to_numpy(),
-                    spike_times=spike_times,
-                    spike_waveform_features=spike_waveform_features,
-                    time=interval_time,
-                    **predict_kwargs,
-                )
-                interval_results.append(interval_result)
+            interval_results = predict_intervals(
+                classifier,
+                position_info,
+                position_variable_names,
+                decoding_interval,
+                predict_kwargs,
+                logger,
+                n_jobs=interval_n_jobs,
+                executor=interval_executor,
+                spike_times=spike_times,
+                spike_waveform_features=spike_waveform_features,
+            )
 
             # Validate that at least one interval had valid time points
             if not interval_results:
@@ -443,16 +447,26 @@ class ClusterlessDecodingV1(SpyglassMixin, dj.Computed):
             path_exists = results_path.exists()
 
         # Save results and model to disk
-        classifier.save_results(results, results_path)
+        save_decoding_results(results, results_path)
 
         classifier_path = results_path.with_suffix(".pkl")
         classifier.save_model(classifier_path)
 
         return results_path, classifier_path
 
-    def fetch_results(self) -> xr.Dataset:
+    def fetch_results(self, time_slice=None, variables=None) -> xr.Dataset:
         """Retrieve the decoding results.
 
+        Results are opened lazily, so only the selected variables and time
+        window are read from disk.
+
+        Parameters
+        ----------
+        time_slice : Union[slice, list[float]], optional
+            Start and stop times to select, inclusive. Default all times.
+        variables : Union[str, list[str]], optional
+            Data variables to select, e.g., "acausal_posterior". Default all.
+
         Returns
         -------
         xr.Dataset
@@ -465,7 +479,11 @@ class ClusterlessDecodingV1(SpyglassMixin, dj.Computed):
         coordinate instead of separate ``intervals`` dimension. See CHANGELOG.md
         for migration guide.
         """
-        return ClusterlessDetector.load_results(self.fetch1("results_path"))
+        return select_decoding_results(
+            ClusterlessDetector.load_results(self.fetch1("results_path")),
+            time_slice=time_slice,
+            variables=variables,
+        )
 
     def fetch_model(self):
         """Retrieve the decoding model"""
@@ -659,7 +677,9 @@ class ClusterlessDecodingV1(SpyglassMixin, dj.Computed):
         return new_spike_times, new_waveform_features
 
     @classmethod
-    def get_spike_indicator(cls, key, time):
+    def get_spike_indicator(
+        cls, key, time, sparse: bool = False, dtype: np.dtype = np.float64
+    ):
         """get spike indicator matrix for the group
 
         Parameters
@@ -668,25 +688,42 @@ class ClusterlessDecodingV1(SpyglassMixin, dj.Computed):
             key to identify the group
         time : np.ndarray
             time vector for which to calculate the spike indicator matrix
+        sparse : bool, optional
+            if True, return a scipy.sparse CSR matrix. Default False
+        dtype : np.dtype, optional
+            data type of the spike counts. Default float64. Use an integer
+            type (e.g., np.uint16) for a smaller dense matrix.
 
         Returns
         -------
-        np.ndarray
+        np.ndarray or scipy.sparse.csr_matrix
             spike indicator matrix with shape (len(time), n_units)
         """
-        time = np.asarray(time)
-        min_time, max_time = time[[0, -1]]
         spike_times = cls.fetch_spike_data(key)[0]
-        spike_indicator = np.zeros((len(time), len(spike_times)))
+        return spike_indicator_from_times(
+            spike_times, time, sparse=sparse, dtype=dtype
+        )
 
-        for ind, times in enumerate(spike_times):
-            times = times[np.logical_and(times >= min_time, times <= max_time)]
-            spike_indicator[:, ind] = np.bincount(
-                np.digitize(times, time[1:-1]),
-                minlength=time.shape[0],
-            )
+    @classmethod
+    def get_multiunit_spike_count(cls, key, time) -> np.ndarray:
+        """get spike counts summed across all units in the group
+
+        Never builds the per-unit spike indicator matrix.
+
+        Parameters
+        ----------
+        key : dict
+            key to identify the group
+        time : np.ndarray
+            time vector for which to count spikes
 
-        return spike_indicator
+        Returns
+        -------
+        np.ndarray
+            integer spike counts with shape (len(time), 1)
+        """
+        spike_times = cls.fetch_spike_data(key)[0]
+        return multiunit_count_from_times(spike_times, time)
 
     @classmethod
     def get_firing_rate(
@@ -717,8 +754,13 @@ class ClusterlessDecodingV1(SpyglassMixin, dj.Computed):
         np.ndarray
             time-dependent firing rate with shape (len(time), n_units)
         """
+        spike_indicator = (
+            cls.get_multiunit_spike_count(key, time)
+            if multiunit
+            else cls.get_spike_indicator(key, time, sparse=True)
+        )
         return firing_rate_from_spike_indicator(
-            spike_indicator=cls.get_spike_indicator(key, time),
+            spike_indicator=spike_indicator,
             time=time,
             multiunit=multiunit,
             smoothing_sigma=smoothing_sigma,
@@ -746,9 +788,10 @@ class ClusterlessDecodingV1(SpyglassMixin, dj.Computed):
 
         classifier = self.fetch_model()
         posterior = (
-            self.fetch_results()
-            .acausal_posterior.sel(time=time_slice)
-            .squeeze()
+            self.fetch_results(
+                time_slice=time_slice, variables="acausal_posterior"
+            )
+            .acausal_posterior.squeeze()
             .unstack("state_bins")
             .sum("state")
         )
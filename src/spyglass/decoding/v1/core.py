@@ -16,6 +16,7 @@ from spyglass.decoding.v1.dj_decoder_conversion import (
 )
 from spyglass.position.position_merge import PositionOutput  # noqa: F401
 from spyglass.utils import SpyglassMixin, SpyglassMixinPart, logger
+from spyglass.utils.position import interpolate_to_new_time
 
 schema = dj.schema("decoding_core_v1")
 
@@ -279,37 +280,12 @@ class PositionGroup(SpyglassMixin, dj.Manual):
         new_time = np.linspace(
             upsampling_start_time, upsampling_end_time, n_samples
         )
-        new_index = pd.Index(
-            np.unique(np.concatenate((position_df.index, new_time))),
-            name="time",
-        )
-
-        # Find NaN intervals
-        nan_intervals = {}
         if position_variable_names is None:
             position_variable_names = position_df.columns
-        for column in position_variable_names:
-            is_nan = position_df[column].isna().to_numpy().astype(int)
-            st = np.where(np.diff(is_nan) == 1)[0] + 1
-            en = np.where(np.diff(is_nan) == -1)[0]
-            if is_nan[0]:
-                st = np.insert(st, 0, 0)
-            if is_nan[-1]:
-                en = np.append(en, len(is_nan) - 1)
-            st = position_df.index[st].to_numpy()
-            en = position_df.index[en].to_numpy()
-            nan_intervals[column] = list(zip(st, en))
-
-        # upsample and interpolate
-        position_df = (
-            position_df.reindex(index=new_index)
-            .interpolate(method=upsampling_interpolation_method)
-            .reindex(index=new_time)
-        )
 
-        # Fill NaN intervals
-        for column, intervals in nan_intervals.items():
-            for st, en in intervals:
-                position_df[column][st:en] = np.nan
-
-        return position_df
+        return interpolate_to_new_time(
+            position_df,
+            new_time,
+            upsampling_interpolation_method,
+            nan_columns=position_variable_names,
+        )
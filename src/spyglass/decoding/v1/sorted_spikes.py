@@ -32,6 +32,9 @@ from spyglass.decoding.v1.utils import (
     concatenate_interval_results,
     create_interval_labels,
     get_valid_kwargs,
+    predict_intervals,
+    save_decoding_results,
+    select_decoding_results,
 )
 from spyglass.position.position_merge import PositionOutput  # noqa: F401
 from spyglass.settings import config
@@ -187,7 +190,9 @@ class SortedSpikesDecodingV1(SpyglassMixin, dj.Computed):
         decoding_params : dict
             Parameters for SortedSpikesDetector initialization
         decoding_kwargs : dict
-            Additional kwargs for fit/predict
+            Additional kwargs for fit/predict. May include interval_n_jobs and
+            interval_executor to predict intervals in parallel, see
+            predict_intervals.
         position_info : pd.DataFrame
             Position data with time index
         position_variable_names : list[str]
@@ -231,6 +236,11 @@ class SortedSpikesDecodingV1(SpyglassMixin, dj.Computed):
         ValueError
             If all decoding intervals are empty (no valid time points)
         """
+        # Options to predict decoding intervals in parallel, not passed on
+        decoding_kwargs = dict(decoding_kwargs)
+        interval_n_jobs = decoding_kwargs.pop("interval_n_jobs", 1)
+        interval_executor = decoding_kwargs.pop("interval_executor", "thread")
+
         classifier = SortedSpikesDetector(**decoding_params)
 
         if key["estimate_decoding_params"]:
@@ -289,27 +299,17 @@ class SortedSpikesDecodingV1(SpyglassMixin, dj.Computed):
             )
 
             # We treat each decoding interval as a separate sequence
-            interval_results = []
-            for interval_start, interval_end in decoding_interval:
-                interval_time = position_info.loc[
-                    interval_start:interval_end
-                ].index.to_numpy()
-
-                if interval_time.size == 0:
-                    logger.warning(
-                        f"Interval {interval_start}:{interval_end} is empty"
-                    )
-                    continue
-                interval_result = classifier.predict(
-                    position_time=interval_time,
-                    position=position_info.loc[interval_start:interval_end][
-                        position_variable_names
-                    ].to_numpy(),
-                    spike_times=spike_times,
-                    time=interval_time,
-                    **predict_kwargs,
-                )
-                interval_results.append(interval_result)
+            interval_results = predict_intervals(
+                classifier,
+                position_info,
+                position_variable_names,
+                decoding_interval,
+                predict_kwargs,
+                logger,
+                n_jobs=interval_n_jobs,
+                executor=interval_executor,
+                spike_times=spike_times,
+            )
 
             # Validate that at least one interval had valid time points
             if not interval_results:
@@ -386,16 +386,26 @@ class SortedSpikesDecodingV1(SpyglassMixin, dj.Computed):
             path_exists = results_path.exists()
 
         # Save results and model to disk
-        classifier.save_results(results, results_path)
+        save_decoding_results(results, results_path)
 
         classifier_path = results_path.with_suffix(".pkl")
         classifier.save_model(classifier_path)
 
         return results_path, classifier_path
 
-    def fetch_results(self) -> xr.Dataset:
+    def fetch_results(self, time_slice=None, variables=None) -> xr.Dataset:
         """Retrieve the decoding results.
 
+        Results are opened lazily, so only the selected variables and time
+        window are read from disk.
+
+        Parameters
+        ----------
+        time_slice : Union[slice, list[float]], optional
+            Start and stop times to select, inclusive. Default all times.
+        variables : Union[str, list[str]], optional
+            Data variables to select, e.g., "acausal_posterior". Default all.
+
         Returns
         -------
         xr.Dataset
@@ -408,7 +418,11 @@ class SortedSpikesDecodingV1(SpyglassMixin, dj.Computed):
         coordinate instead of separate ``intervals`` dimension. See CHANGELOG.md
         for migration guide.
         """
-        return SortedSpikesDetector.load_results(self.fetch1("results_path"))
+        return select_decoding_results(
+            SortedSpikesDetector.load_results(self.fetch1("results_path")),
+            time_slice=time_slice,
+            variables=variables,
+        )
 
     def fetch_model(self):
         """Retrieve the decoding model"""
@@ -663,9 +677,10 @@ class SortedSpikesDecodingV1(SpyglassMixin, dj.Computed):
 
         classifier = self.fetch_model()
         posterior = (
-            self.fetch_results()
-            .acausal_posterior.sel(time=time_slice)
-            .squeeze()
+            self.fetch_results(
+                time_slice=time_slice, variables="acausal_posterior"
+            )
+            .acausal_posterior.squeeze()
             .unstack("state_bins")
             .sum("state")
         )
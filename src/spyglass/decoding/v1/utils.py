@@ -1,12 +1,26 @@
+import importlib.util
 import inspect
 import logging
-from typing import List
+import multiprocessing as mp
+import sys
+from concurrent.futures import ProcessPoolExecutor, ThreadPoolExecutor
+from functools import partial
+from time import perf_counter
+from typing import List, Optional, Union
 
 import numpy as np
 import numpy.typing as npt
+import pandas as pd
 import xarray as xr
 from scipy.ndimage import label
 
+INTERVAL_EXECUTORS = ("thread", "process")
+RESULTS_CHUNK_BYTES = 2**24  # target size of a compressed results chunk
+RESULTS_COMPLEVEL = 4  # zlib compression level of saved results
+
+# Fitted classifier and spike data, set once per process-pool worker
+_predict_worker_state = {}
+
 
 def create_interval_labels(
     is_missing: npt.NDArray[np.bool_],
@@ -100,6 +114,259 @@ def concatenate_interval_results(
     return concatenated.assign_coords(interval_labels=("time", interval_labels))
 
 
+def _peak_memory() -> int:
+    """Peak resident memory of this process in bytes."""
+    try:
+        import resource
+    except ImportError:  # Windows
+        import psutil
+
+        return psutil.Process().memory_info().peak_wset
+    peak = resource.getrusage(resource.RUSAGE_SELF).ru_maxrss
+    return peak if sys.platform == "darwin" else peak * 1024  # linux in KiB
+
+
+def _init_predict_worker(classifier, spike_data: dict) -> None:
+    """Store the fitted classifier once in each process-pool worker."""
+    _predict_worker_state.update(classifier=classifier, spike_data=spike_data)
+
+
+def _predict_interval(
+    position_time: np.ndarray,
+    position: np.ndarray,
+    predict_kwargs: dict,
+    classifier=None,
+    spike_data: dict = None,
+) -> tuple[xr.Dataset, float, int]:
+    """Predict one interval, returning the result, wall time and peak memory.
+
+    Uses the classifier and spike data of the process-pool worker if not
+    passed.
+    """
+    if classifier is None:
+        classifier = _predict_worker_state["classifier"]
+        spike_data = _predict_worker_state["spike_data"]
+    start = perf_counter()
+    result = classifier.predict(
+        position_time=position_time,
+        position=position,
+        time=position_time,
+        **spike_data,
+        **predict_kwargs,
+    )
+    return result, perf_counter() - start, _peak_memory()
+
+
+def predict_intervals(
+    classifier,
+    position_info: pd.DataFrame,
+    position_variable_names: list[str],
+    decoding_interval: np.ndarray,
+    predict_kwargs: dict,
+    logger: logging.Logger,
+    n_jobs: int = 1,
+    executor: str = "thread",
+    **spike_data,
+) -> List[xr.Dataset]:
+    """Predict each decoding interval with a fitted classifier.
+
+    Intervals are independent sequences, so they may be predicted in a pool
+    of threads or processes. All workers share the fitted classifier, which
+    is sent to each process once. Wall time and peak memory of each interval
+    are logged. Peak memory is that of the process that ran the interval,
+    which includes concurrent intervals when using threads.
+
+    Parameters
+    ----------
+    classifier : object
+        Fitted classifier with a predict method.
+    position_info : pd.DataFrame
+        Position data with time index.
+    position_variable_names : list[str]
+        Names of position columns to use.
+    decoding_interval : np.ndarray
+        Time intervals for decoding, shape (n_intervals, 2).
+    predict_kwargs : dict
+        Kwargs for classifier.predict.
+    logger : logging.Logger
+        Logger for empty intervals and timing.
+    n_jobs : int, optional
+        Number of intervals to predict at once, by default 1 (serial).
+    executor : str, optional
+        "thread" or "process", by default "thread". Threads run serially if
+        predict_kwargs sets cache_likelihood, which writes to the classifier.
+        Processes are started with spawn, which is safe with JAX.
+    **spike_data
+        Spike data for classifier.predict, e.g., spike_times.
+
+    Returns
+    -------
+    List[xr.Dataset]
+        Results of non-empty intervals, in the order of decoding_interval.
+    """
+    if executor not in INTERVAL_EXECUTORS:
+        raise ValueError(
+            f"Unknown interval executor {executor}. "
+            + f"Use one of {INTERVAL_EXECUTORS}"
+        )
+
+    interval_inputs = []
+    for interval_start, interval_end in decoding_interval:
+        interval_info = position_info.loc[interval_start:interval_end]
+        if interval_info.index.size == 0:
+            logger.warning(f"Interval {interval_start}:{interval_end} is empty")
+            continue
+        interval_inputs.append(
+            (
+                interval_info.index.to_numpy(),
+                interval_info[position_variable_names].to_numpy(),
+            )
+        )
+
+    n_jobs = min(max(n_jobs, 1), max(len(interval_inputs), 1))
+    if executor == "thread" and predict_kwargs.get("cache_likelihood"):
+        n_jobs = 1
+
+    if n_jobs == 1:
+        outputs = [
+            _predict_interval(
+                *inputs, predict_kwargs, classifier, spike_data=spike_data
+            )
+            for inputs in interval_inputs
+        ]
+    elif executor == "thread":
+        predict = partial(
+            _predict_interval,
+            predict_kwargs=predict_kwargs,
+            classifier=classifier,
+            spike_data=spike_data,
+        )
+        with ThreadPoolExecutor(max_workers=n_jobs) as pool:
+            outputs = list(
+                pool.map(lambda inputs: predict(*inputs), interval_inputs)
+            )
+    else:
+        with ProcessPoolExecutor(
+            max_workers=n_jobs,
+            mp_context=mp.get_context("spawn"),
+            initializer=_init_predict_worker,
+            initargs=(classifier, spike_data),
+        ) as pool:
+            outputs = list(
+                pool.map(
+                    partial(_predict_interval, predict_kwargs=predict_kwargs),
+                    *zip(*interval_inputs),
+                )
+            )
+
+    for ind, (_, wall_time, peak_memory) in enumerate(outputs):
+        logger.info(
+            f"Predicted interval {ind} in {wall_time:.2f} s, "
+            + f"peak memory {peak_memory / 1024**3:.2f} GiB"
+        )
+
+    return [result for result, _, _ in outputs]
+
+
+def _netcdf_engine() -> Optional[str]:
+    """Return an installed netCDF engine that supports compression."""
+    for engine, module in (("netcdf4", "netCDF4"), ("h5netcdf", "h5netcdf")):
+        if importlib.util.find_spec(module) is not None:
+            return engine
+    return None
+
+
+def save_decoding_results(
+    results: xr.Dataset,
+    filename: str,
+    chunk_bytes: int = RESULTS_CHUNK_BYTES,
+    complevel: int = RESULTS_COMPLEVEL,
+) -> None:
+    """Save decoding results to netCDF, chunked along time and compressed.
+
+    Readable by the detector's load_results. Each numeric variable with a
+    time dimension is stored in chunks of whole time points, about
+    chunk_bytes in size, so that a time window can be read without reading
+    the full array. Saved uncompressed if neither netCDF4 nor h5netcdf is
+    installed.
+
+    Parameters
+    ----------
+    results : xr.Dataset
+        Decoding results with a state_bins multiindex.
+    filename : str
+        Path of the netCDF file.
+    chunk_bytes : int, optional
+        Approximate uncompressed size of each chunk. Default 16 MiB.
+    complevel : int, optional
+        zlib compression level, 0-9. Default 4.
+    """
+    # state_bins is a multiindex, which is not supported by netcdf
+    results = results.reset_index("state_bins")
+
+    engine = _netcdf_engine()
+    if engine is None:
+        results.to_netcdf(filename)
+        return
+
+    encoding = {}
+    for name, variable in results.data_vars.items():
+        if "time" not in variable.dims or variable.dtype.kind not in "fiu":
+            continue
+        time_axis = variable.dims.index("time")
+        chunks = list(variable.shape)
+        if 0 in chunks:
+            continue
+        row_bytes = variable.dtype.itemsize * (
+            int(np.prod(chunks)) // chunks[time_axis]
+        )
+        chunks[time_axis] = int(
+            np.clip(chunk_bytes // row_bytes, 1, chunks[time_axis])
+        )
+        encoding[name] = dict(
+            zlib=True, complevel=complevel, chunksizes=tuple(chunks)
+        )
+
+    results.to_netcdf(filename, engine=engine, encoding=encoding)
+
+
+def select_decoding_results(
+    results: xr.Dataset,
+    time_slice: Union[slice, list[float], None] = None,
+    variables: Union[str, list[str], None] = None,
+) -> xr.Dataset:
+    """Select variables and a time window of lazily loaded decoding results.
+
+    Results opened with the detector's load_results are read from disk only
+    when used, so only the selected variables and window are read.
+
+    Parameters
+    ----------
+    results : xr.Dataset
+        Decoding results.
+    time_slice : Union[slice, list[float]], optional
+        Start and stop times to select, inclusive. Default all times.
+    variables : Union[str, list[str]], optional
+        Data variables to select, e.g., "acausal_posterior". Default all.
+
+    Returns
+    -------
+    xr.Dataset
+        Selected decoding results.
+    """
+    if variables is not None:
+        if isinstance(variables, str):
+            variables = [variables]
+        results = results[list(variables)]
+
+    if time_slice is not None:
+        if isinstance(time_slice, (list, tuple)):
+            time_slice = slice(*time_slice)
+        results = results.sel(time=time_slice)
+
+    return results
+
+
 def _get_interval_range(key: dict) -> tuple[float, float]:
     """Return maximum range of model times in encoding/decoding intervals.
 
@@ -1,4 +1,3 @@
-import os
 from itertools import chain
 
 import datajoint as dj
@@ -8,11 +7,10 @@ import pynwb
 import spikeinterface as si
 
 from spyglass.common.common_nwbfile import AnalysisNwbfile
-from spyglass.settings import temp_dir
 from spyglass.spikesorting.spikesorting_merge import SpikeSortingOutput
 from spyglass.spikesorting.v1 import SpikeSortingSelection
 from spyglass.utils import SpyglassMixin
-from spyglass.utils.waveforms import _get_peak_amplitude
+from spyglass.utils.waveforms import _get_peak_amplitude, get_waveform_store
 
 schema = dj.schema("decoding_waveform_features")
 
@@ -139,10 +137,6 @@ class UnitWaveformFeatures(SpyglassMixin, dj.Computed):
             )
 
         merge_key = {"merge_id": key["spikesorting_merge_id"]}
-        waveform_extractor = self._fetch_waveform(
-            merge_key, params["waveform_extraction_params"]
-        )
-
         source_key = SpikeSortingOutput().merge_get_parent(merge_key).fetch1()
         # v0 pipeline
         if "sorter" in source_key and "nwb_file_name" in source_key:
@@ -159,34 +153,40 @@ class UnitWaveformFeatures(SpyglassMixin, dj.Computed):
             ).fetch1("sorter", "nwb_file_name")
             analysis_nwb_key = "object_id"
 
-        waveform_features = {}
+        waveform_extractor = self._fetch_waveform(
+            merge_key, params["waveform_extraction_params"]
+        )
+        try:
+            waveform_features = {}
+
+            for feature, feature_params in params[
+                "waveform_features_params"
+            ].items():
+                waveform_features[feature] = self._compute_waveform_features(
+                    waveform_extractor,
+                    feature,
+                    feature_params,
+                    sorter,
+                )
 
-        for feature, feature_params in params[
-            "waveform_features_params"
-        ].items():
-            waveform_features[feature] = self._compute_waveform_features(
-                waveform_extractor,
-                feature,
-                feature_params,
-                sorter,
+            nwb = SpikeSortingOutput().fetch_nwb(merge_key)[0]
+            spike_times = (
+                nwb[analysis_nwb_key]["spike_times"]
+                if analysis_nwb_key in nwb
+                else pd.DataFrame()
             )
 
-        nwb = SpikeSortingOutput().fetch_nwb(merge_key)[0]
-        spike_times = (
-            nwb[analysis_nwb_key]["spike_times"]
-            if analysis_nwb_key in nwb
-            else pd.DataFrame()
-        )
-
-        (
-            key["analysis_file_name"],
-            key["object_id"],
-        ) = _write_waveform_features_to_nwb(
-            nwb_file_name,
-            waveform_extractor,
-            spike_times,
-            waveform_features,
-        )
+            (
+                key["analysis_file_name"],
+                key["object_id"],
+            ) = _write_waveform_features_to_nwb(
+                nwb_file_name,
+                waveform_extractor,
+                spike_times,
+                waveform_features,
+            )
+        finally:  # unpin the store entry even if feature computation fails
+            get_waveform_store().release(waveform_extractor)
 
         AnalysisNwbfile().add(
             nwb_file_name,
@@ -206,15 +206,9 @@ class UnitWaveformFeatures(SpyglassMixin, dj.Computed):
         # get the sorting from the parent table
         sorting = SpikeSortingOutput().get_sorting(merge_key)
 
-        waveforms_temp_dir = temp_dir + "/" + str(merge_key["merge_id"])
-        os.makedirs(waveforms_temp_dir, exist_ok=True)
-
-        return si.extract_waveforms(
-            recording=recording,
-            sorting=sorting,
-            folder=waveforms_temp_dir,
-            overwrite=True,
-            **waveform_extraction_params,
+        # shared with other tables extracting the same waveforms
+        return get_waveform_store().get(
+            recording, sorting, waveform_extraction_params
         )
 
     @staticmethod
@@ -3,6 +3,7 @@ from typing import Optional, Union
 import datajoint as dj
 import numpy as np
 import pandas as pd
+import psutil
 import pynwb
 from scipy.signal import hilbert
 
@@ -296,6 +297,12 @@ class LFPBandV1(SpyglassMixin, dj.Computed):
     lfp_band_object_id: varchar(40)  # the NWB object ID for loading this object from the file
     """
 
+    # Filter in time blocks, reading from and writing to disk, if True. If
+    # None, stream only when filtering in memory would exceed _mem_use_limit
+    # of available RAM.
+    _stream_filtering = None
+    _mem_use_limit = 0.9
+
     def _fetch_and_sort_electrodes(self, key: dict) -> tuple:
         """Fetch and sort electrode IDs and reference IDs
 
@@ -438,6 +445,99 @@ class LFPBandV1(SpyglassMixin, dj.Computed):
 
         return timestamps, lfp_data, lfp_band_elect_index
 
+    def _use_streaming(
+        self, lfp_object: pynwb.ecephys.ElectricalSeries, n_electrodes: int
+    ) -> bool:
+        """Whether to filter in time blocks rather than in memory
+
+        Parameters
+        ----------
+        lfp_object : pynwb.ecephys.ElectricalSeries
+            The LFP electrical series object
+        n_electrodes : int
+            Number of electrodes to be filtered
+
+        Returns
+        -------
+        bool
+            True if in-memory filtering would exceed the memory limit
+        """
+        if self._stream_filtering is not None:
+            return self._stream_filtering
+
+        # loaded data, its copy for referencing, and the filtered output
+        n_samples, n_channels = lfp_object.data.shape
+        req_mem = (
+            n_samples
+            * (2 * n_channels + n_electrodes)
+            * lfp_object.data.dtype.itemsize
+        )
+        available = psutil.virtual_memory().available
+        return req_mem >= self._mem_use_limit * available
+
+    def _stream_filtered_data(
+        self,
+        lfp_object: pynwb.ecephys.ElectricalSeries,
+        lfp_band_elect_id: np.ndarray,
+        lfp_band_ref_id: np.ndarray,
+        lfp_band_valid_times,
+        filter_coeff: np.ndarray,
+        decimation: int,
+    ) -> tuple:
+        """Prepare referencing and filtering of LFP data in time blocks
+
+        Reads only the selected and reference channels, so the LFP data are
+        never fully loaded. Output matches _load_lfp_data_with_referencing
+        followed by FirFilterParameters.filter_data.
+
+        Parameters
+        ----------
+        lfp_object : pynwb.ecephys.ElectricalSeries
+            The LFP electrical series object
+        lfp_band_elect_id : np.ndarray
+            Array of electrode IDs to be filtered
+        lfp_band_ref_id : np.ndarray
+            Array of reference electrode IDs
+        lfp_band_valid_times
+            The valid time intervals
+        filter_coeff : np.ndarray
+            Filter coefficients
+        decimation : int
+            Decimation factor
+
+        Returns
+        -------
+        tuple
+            (filtered_data_iterator, new_timestamps)
+        """
+        timestamps = np.asarray(lfp_object.timestamps)
+        included_indices = lfp_band_valid_times.contains(
+            timestamps, as_indices=True, padding=1
+        )
+        start, stop = included_indices[0], included_indices[-1]
+
+        lfp_band_elect_index = get_electrode_indices(
+            lfp_object, lfp_band_elect_id
+        )
+        lfp_band_ref_index = [
+            -1 if ref_id == -1 else ref_index
+            for ref_id, ref_index in zip(
+                lfp_band_ref_id,
+                get_electrode_indices(lfp_object, lfp_band_ref_id),
+            )
+        ]
+
+        return FirFilterParameters().filter_data_iterator(
+            timestamps[start:stop],
+            lfp_object.data,
+            filter_coeff,
+            lfp_band_valid_times.times,
+            lfp_band_elect_index,
+            decimation,
+            reference_electrodes=lfp_band_ref_index,
+            start_index=start,
+        )
+
     def _fetch_filter_coefficients(
         self, filter_name: str, filter_sampling_rate: int
     ) -> np.ndarray:
@@ -517,16 +617,6 @@ class LFPBandV1(SpyglassMixin, dj.Computed):
             decimation,
         ) = self._compute_interval_times(key, lfp_key)
 
-        # load LFP data with referencing applied
-        timestamps, lfp_data, lfp_band_elect_index = (
-            self._load_lfp_data_with_referencing(
-                lfp_object,
-                lfp_band_elect_id,
-                lfp_band_ref_id,
-                lfp_band_valid_times,
-            )
-        )
-
         # fetch filter parameters
         filter_name, filter_sampling_rate = (LFPBandSelection() & key).fetch1(
             "filter_name", "filter_sampling_rate"
@@ -541,15 +631,37 @@ class LFPBandV1(SpyglassMixin, dj.Computed):
         lfp_band_file_abspath = AnalysisNwbfile().get_abs_path(
             lfp_band_file_name
         )
-        # filter the data and write to an the nwb file
-        filtered_data, new_timestamps = FirFilterParameters().filter_data(
-            timestamps,
-            lfp_data,
-            filter_coeff,
-            lfp_band_valid_times.times,
-            lfp_band_elect_index,
-            decimation,
-        )
+
+        if self._use_streaming(lfp_object, len(lfp_band_elect_id)):
+            # filtered in blocks as the electrical series is written
+            logger.info("LFPBand: filtering data in time blocks")
+            filtered_data, new_timestamps = self._stream_filtered_data(
+                lfp_object,
+                lfp_band_elect_id,
+                lfp_band_ref_id,
+                lfp_band_valid_times,
+                filter_coeff,
+                decimation,
+            )
+        else:
+            # load LFP data with referencing applied
+            timestamps, lfp_data, lfp_band_elect_index = (
+                self._load_lfp_data_with_referencing(
+                    lfp_object,
+                    lfp_band_elect_id,
+                    lfp_band_ref_id,
+                    lfp_band_valid_times,
+                )
+            )
+            # filter the data
+            filtered_data, new_timestamps = FirFilterParameters().filter_data(
+                timestamps,
+                lfp_data,
+                filter_coeff,
+                lfp_band_valid_times.times,
+                lfp_band_elect_index,
+                decimation,
+            )
 
         # now that the LFP is filtered, we create an electrical series for it
         # and add it to the file
@@ -194,7 +194,8 @@ class LFPArtifactDetection(SpyglassMixin, dj.Computed):
         if "referencing" in artifact_params:
             ref = artifact_params["referencing"]["ref_on"] if is_diff else None
             lfp_band_ref_id = artifact_params["referencing"]["reference_list"]
-            if artifact_params["referencing"]["ref_on"]:
+            # MAD detection has always scaled unreferenced LFPs
+            if artifact_params["referencing"]["ref_on"] and is_diff:
                 lfp_band_ref_index = get_electrode_indices(
                     lfp_eseries, lfp_band_ref_id
                 )
@@ -215,6 +216,8 @@ class LFPArtifactDetection(SpyglassMixin, dj.Computed):
             ref = False if is_diff else None
 
         data = lfp_data if is_diff else lfp_eseries
+        # MAD reads the loaded array, not strided columns of the h5py dataset
+        extra = dict() if is_diff else dict(lfp_data=lfp_data)
 
         (
             artifact_removed_valid_times,
@@ -225,6 +228,7 @@ class LFPArtifactDetection(SpyglassMixin, dj.Computed):
             sampling_frequency=sampling_frequency,
             timestamps=lfp_eseries.timestamps if is_diff else None,
             referencing=ref,
+            **extra,
         )
 
         key.update(
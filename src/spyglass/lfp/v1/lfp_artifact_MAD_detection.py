@@ -1,6 +1,11 @@
+from typing import Optional
+
 import numpy as np
-from scipy.ndimage import find_objects, label
-from scipy.stats import median_abs_deviation
+from scipy.ndimage import binary_dilation
+from scipy.special import ndtri
+
+MAD_NORMAL_SCALE = ndtri(0.75)  # as scipy median_abs_deviation(scale="normal")
+MAD_CHUNK_BYTES = 2**28  # float64 bytes per block of electrodes, 256 MB
 
 
 def mad_artifact_detector(
@@ -10,6 +15,7 @@ def mad_artifact_detector(
     removal_window_ms: float = 10.0,
     sampling_frequency: float = 1000.0,
     *args,
+    lfp_data: Optional[np.ndarray] = None,
     **kwargs,
 ) -> tuple[np.ndarray, np.ndarray]:
     """Detect LFP artifacts using the median absolute deviation method.
@@ -28,6 +34,9 @@ def mad_artifact_detector(
         (window/2 removed on each side of threshold crossing), defaults to 1 ms
     sampling_frequency : float, optional
         Sampling frequency of the recording extractor, defaults to 1000.0
+    lfp_data : np.ndarray, optional
+        LFPs already loaded from recording.data, shape (n_samples,
+        n_electrodes). Defaults to reading recording.data.
 
     Returns
     -------
@@ -40,13 +49,11 @@ def mad_artifact_detector(
     """
 
     timestamps = np.asarray(recording.timestamps)
-    lfps = np.asarray(recording.data)
+    lfps = recording.data if lfp_data is None else lfp_data
+    n_electrodes = lfps.shape[1]
 
-    mad = median_abs_deviation(lfps, axis=0, nan_policy="omit", scale="normal")
-    mad = np.where(np.isclose(mad, 0.0) | ~np.isfinite(mad), 1.0, mad)
-    is_artifact = _is_above_proportion_thresh(
-        _mad_scale_lfps(lfps, mad), mad_thresh, proportion_above_thresh
-    )
+    thresholded_count = _count_above_mad_thresh(lfps, mad_thresh)
+    is_artifact = thresholded_count > (proportion_above_thresh * n_electrodes)
 
     MILLISECONDS_PER_SECOND = 1000.0
     half_removal_window_s = (removal_window_ms / MILLISECONDS_PER_SECOND) * 0.5
@@ -64,49 +71,47 @@ def mad_artifact_detector(
     return valid_times, artifact_intervals_s
 
 
-def _mad_scale_lfps(lfps: np.ndarray, mad: np.ndarray) -> np.ndarray:
-    """Scale LFPs by median absolute deviation.
+def _count_above_mad_thresh(
+    lfps, mad_thresh: float, chunk_bytes: int = MAD_CHUNK_BYTES
+) -> np.ndarray:
+    """Count electrodes above threshold on MAD scaled LFPs for each sample.
+
+    Electrodes are scaled in blocks of about chunk_bytes, so only one float64
+    working copy is held in memory at a time.
 
     Parameters
     ----------
     lfps : np.ndarray, shape (n_samples, n_electrodes)
-        LFPs to scale
-    mad : np.ndarray, shape (n_electrodes,)
-        Median absolute deviation of LFPs
+        LFPs to scale, already in memory. Column slices of an h5py.Dataset
+        are strided reads; load the data first.
+    mad_thresh : float
+        Threshold on the median absolute deviation scaled LFPs
+    chunk_bytes : int, optional
+        Approximate size of each float64 block, defaults to MAD_CHUNK_BYTES
 
     Returns
     -------
-    mad_scaled_lfps : np.ndarray, shape (n_samples, n_electrodes)
-
+    thresholded_count : np.ndarray, shape (n_samples,)
+        Number of electrodes above the threshold for each sample
     """
-    return np.abs(lfps - np.nanmedian(lfps, axis=0)) / mad
+    n_samples, n_electrodes = lfps.shape
+    n_per_chunk = max(1, chunk_bytes // (8 * max(n_samples, 1)))
 
+    thresholded_count = np.zeros(n_samples, dtype=int)
+    for start in range(0, n_electrodes, n_per_chunk):
+        deviation = np.array(
+            lfps[:, start : start + n_per_chunk], dtype=np.float64
+        )
+        deviation -= np.nanmedian(deviation, axis=0)
+        np.abs(deviation, out=deviation)
 
-def _is_above_proportion_thresh(
-    mad_scaled_lfps: np.ndarray,
-    mad_thresh: np.ndarray,
-    proportion_above_thresh: float = 1.0,
-) -> np.ndarray:
-    """Return array of bools for samples > thresh on proportion of electodes.
+        mad = np.nanmedian(deviation, axis=0) / MAD_NORMAL_SCALE
+        mad = np.where(np.isclose(mad, 0.0) | ~np.isfinite(mad), 1.0, mad)
 
-    Parameters
-    ----------
-    mad_scaled_lfps : np.ndarray, shape (n_samples, n_electrodes)
-        LFPs scaled by median absolute deviation
-    mad_thresh : float
-        Threshold on the median absolute deviation scaled LFPs
-    proportion_above_thresh : float
-        Proportion of electrodes that need to be above the threshold
+        deviation /= mad
+        thresholded_count += np.sum(deviation > mad_thresh, axis=1)
 
-    Returns
-    -------
-    is_above_thresh : np.ndarray, shape (n_samples,)
-        Whether each sample is above the threshold on the proportion of
-        electrodes
-    """
-    n_electrodes = mad_scaled_lfps.shape[1]
-    thresholded_count = np.sum(mad_scaled_lfps > mad_thresh, axis=1)
-    return thresholded_count > (proportion_above_thresh * n_electrodes)
+    return thresholded_count
 
 
 def _get_time_intervals_from_bool_array(
@@ -126,15 +131,12 @@ def _get_time_intervals_from_bool_array(
     time_intervals : list[list[float]]
         Time intervals corresponding to the boolean array
     """
-    labels, n_labels = label(bool_array)
+    bool_array = np.asarray(bool_array, dtype=bool)
+    edges = np.diff(np.concatenate(([False], bool_array, [False])).astype(int))
+    starts = np.flatnonzero(edges == 1)
+    stops = np.flatnonzero(edges == -1) - 1
 
-    try:
-        return [
-            timestamps[labels == label_id][[0, -1]]
-            for label_id in range(1, n_labels + 1)
-        ]
-    except IndexError:
-        return []
+    return np.asarray(timestamps)[np.stack([starts, stops], axis=1)].tolist()
 
 
 def _extend_array_by_window(
@@ -154,23 +156,9 @@ def _extend_array_by_window(
     new_bool_array : np.ndarray, shape (n_samples,)
         Boolean array extended by the window size on each side
     """
-    labels, _ = label(bool_array)
-
-    n_samples = len(bool_array)
-
-    new_bool_array = np.zeros_like(bool_array)
+    if window_size <= 0:
+        return np.asarray(bool_array, dtype=bool).copy()
 
-    for loc in find_objects(labels):
-        start_ind, stop_ind = loc[0].start, loc[0].stop
-
-        # extend the interval by window_size on each side
-        start_ind -= window_size
-        stop_ind += window_size
-
-        # make sure the interval is within the array
-        start_ind = 0 if start_ind < 0 else start_ind
-        stop_ind = n_samples if stop_ind >= n_samples else stop_ind
-
-        new_bool_array[start_ind:stop_ind] = True
-
-    return new_bool_array
+    return binary_dilation(
+        bool_array, structure=np.ones(2 * window_size + 1, dtype=bool)
+    )
@@ -3,11 +3,14 @@ from typing import Union
 
 import numpy as np
 import scipy.signal
+from numpy.lib.stride_tricks import sliding_window_view
 
 from spyglass.common.common_interval import Interval
 from spyglass.utils import logger
 from spyglass.utils.nwb_helper_fn import get_valid_intervals
 
+LOCAL_RANGE_CHUNK_BYTES = 2**27  # bytes of windows gathered at once, 128 MB
+
 
 def difference_artifact_detector(
     recording: None,
@@ -128,38 +131,13 @@ def difference_artifact_detector(
         # second, find artifacts with large baseline change
         logger.info("thresh", amplitude_thresh_2nd, "window", local_window)
 
-        big_artifacts = np.zeros(
-            (recording.shape[1], above_thresh_1st.shape[0])
+        big_artifacts = _local_range_above_thresh(
+            recording, above_thresh_1st, local_window, amplitude_thresh_2nd
         )
-        for art_count in np.arange(above_thresh_1st.shape[0]):
-            if above_thresh_1st[art_count] <= local_window:
-                local_min = local_max = above_thresh_1st[art_count]
-            else:
-                local_max = np.max(
-                    recording[
-                        above_thresh_1st[art_count]
-                        - local_window : above_thresh_1st[art_count]
-                        + local_window,
-                        :,
-                    ],
-                    axis=0,
-                )
-                local_min = np.min(
-                    recording[
-                        above_thresh_1st[art_count]
-                        - local_window : above_thresh_1st[art_count]
-                        + local_window,
-                        :,
-                    ],
-                    axis=0,
-                )
-            big_artifacts[:, art_count] = (
-                np.abs(local_max - local_min) > amplitude_thresh_2nd
-            )
 
-        # sum columns in big artficat, then compare to nelect_above_2nd
+        # sum electrodes in big artifacts, then compare to nelect_above_2nd
         above_thresh = above_thresh_1st[
-            np.sum(big_artifacts, axis=0) >= nelect_above_2nd
+            np.sum(big_artifacts, axis=1) >= nelect_above_2nd
         ]
 
     artifact_frames = above_thresh.copy()
@@ -191,17 +169,147 @@ def difference_artifact_detector(
 
     starts = np.searchsorted(valid_timestamps, artifact_valid_times[:, 0])
     ends = np.searchsorted(valid_timestamps, artifact_valid_times[:, 1])
-    list_triggers = [np.arange(start, end) for start, end in zip(starts, ends)]
+    kept_inds = Interval(
+        [[0, len(valid_timestamps)]], no_duplicates=False, warn=False
+    ).subtract(np.stack([starts, ends], axis=1))
+
+    artifact_removed_valid_times = _valid_times_from_kept_inds(
+        valid_timestamps, kept_inds.times, sampling_frequency, 1.5, 0.000001
+    )
+
+    return artifact_removed_valid_times, artifact_intervals_s.times
+
+
+def _local_range_above_thresh(
+    recording: np.ndarray,
+    frames: np.ndarray,
+    local_window: int,
+    thresh: float,
+    chunk_bytes: int = LOCAL_RANGE_CHUNK_BYTES,
+) -> np.ndarray:
+    """Whether the local range of each electrode exceeds thresh at frames.
+
+    The range is max - min over recording[frame - local_window : frame +
+    local_window]. Frames at or before local_window have a range of zero.
+    Windows are gathered from a strided view of recording, only at frames.
+
+    Parameters
+    ----------
+    recording : np.ndarray, shape (n_samples, n_electrodes)
+        LFP data
+    frames : np.ndarray, shape (n_frames,)
+        Sorted sample indices at which to evaluate the local range
+    local_window : int
+        Half width of the window in samples
+    thresh : float
+        Threshold on the local range
+    chunk_bytes : int, optional
+        Approximate size of gathered windows, defaults to
+        LOCAL_RANGE_CHUNK_BYTES
+
+    Returns
+    -------
+    above_thresh : np.ndarray, shape (n_frames, n_electrodes)
+        Whether the local range exceeds thresh
+    """
+    frames = np.asarray(frames, dtype=int)
+    n_samples, n_electrodes = recording.shape
+    above = np.zeros((len(frames), n_electrodes), dtype=bool)
+
+    # windows that would run past the end are clipped, as when slicing
+    full = (frames > local_window) & (frames + local_window <= n_samples)
+    clipped = np.flatnonzero((frames > local_window) & ~full)
+
+    full = np.flatnonzero(full)
+    if len(full):
+        windows = sliding_window_view(recording, 2 * local_window, axis=0)
+        window_bytes = recording.itemsize * n_electrodes * 2 * local_window
+        n_per_chunk = max(1, chunk_bytes // max(window_bytes, 1))
+        for start in range(0, len(full), n_per_chunk):
+            inds = full[start : start + n_per_chunk]
+            local = windows[frames[inds] - local_window]
+            above[inds] = (
+                np.abs(local.max(axis=-1) - local.min(axis=-1)) > thresh
+            )
 
-    new_array = np.array(np.concatenate(list_triggers))
+    for ind in clipped:
+        local = recording[frames[ind] - local_window :]
+        above[ind] = np.abs(local.max(axis=0) - local.min(axis=0)) > thresh
 
-    new_timestamps = np.delete(valid_timestamps, new_array)
+    return above
 
-    artifact_removed_valid_times = get_valid_intervals(
-        new_timestamps, sampling_frequency, 1.5, 0.000001
+
+def _valid_times_from_kept_inds(
+    timestamps: np.ndarray,
+    kept_inds: np.ndarray,
+    sampling_rate: float,
+    gap_proportion: float = 2.5,
+    min_valid_len: float = 0,
+) -> np.ndarray:
+    """Valid intervals of the timestamps within the kept index intervals.
+
+    Equivalent to get_valid_intervals on the concatenated kept timestamps,
+    without building that array.
+
+    Parameters
+    ----------
+    timestamps : np.ndarray, shape (n_samples,)
+        Timestamps of the recording
+    kept_inds : np.ndarray, shape (n_intervals, 2)
+        Sorted, non-overlapping [start, stop) index intervals to keep
+    sampling_rate : float
+        Sampling rate of the data
+    gap_proportion : float, optional
+        Gap threshold in samples, see get_valid_intervals. Default 2.5
+    min_valid_len : float, optional
+        Length of smallest valid interval, see get_valid_intervals. Default 0
+
+    Returns
+    -------
+    valid_times : np.ndarray, shape (N, 2)
+        Start and stop times of valid data.
+    """
+    eps = 0.0000001
+    timestamps = np.asarray(timestamps)
+    kept_inds = np.asarray(kept_inds, dtype=int).reshape(-1, 2)
+    if not len(kept_inds):
+        return np.empty((0, 2))
+    kept_starts, kept_stops = kept_inds[:, 0], kept_inds[:, 1] - 1
+
+    total_time = timestamps[kept_stops[-1]] - timestamps[kept_starts[0]]
+    if total_time < min_valid_len:
+        min_valid_len = total_time / 2
+        logger.warning(f"Setting minimum valid interval to {min_valid_len:.4f}")
+
+    gap_thresh = 1.0 / sampling_rate * gap_proportion
+
+    # gaps between samples inside a kept interval
+    gap_ind = np.flatnonzero(np.diff(timestamps) > gap_thresh)
+    interval_ind = np.searchsorted(kept_starts, gap_ind, side="right") - 1
+    inside = (interval_ind >= 0) & (
+        gap_ind + 1 <= kept_stops[np.maximum(interval_ind, 0)]
     )
+    gap_ind = gap_ind[inside]
 
-    return artifact_removed_valid_times, artifact_intervals_s.times
+    # gaps across removed samples, between consecutive kept intervals
+    across = (
+        timestamps[kept_starts[1:]] - timestamps[kept_stops[:-1]] > gap_thresh
+    )
+
+    valid_start = np.sort(
+        np.concatenate([kept_starts[:1], gap_ind + 1, kept_starts[1:][across]])
+    )
+    valid_end = np.sort(
+        np.concatenate([gap_ind, kept_stops[:-1][across], kept_stops[-1:]])
+    )
+
+    valid_times = timestamps[np.stack([valid_start, valid_end], axis=1)]
+    valid_times[:, 0] = valid_times[:, 0] - eps
+    valid_times[:, 1] = valid_times[:, 1] + eps
+
+    valid_intervals = (valid_times[:, 1] - valid_times[:, 0]) > min_valid_len
+
+    return valid_times[valid_intervals, :]
 
 
 def _check_artifact_thresholds(
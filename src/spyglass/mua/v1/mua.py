@@ -86,8 +86,7 @@ class MuaEventsV1(SpyglassMixin, dj.Computed):
         time = speed.index.to_numpy()
         speed = speed.to_numpy()
 
-        spike_indicator = SortedSpikesGroup.get_spike_indicator(key, time)
-        spike_indicator = spike_indicator.sum(axis=1, keepdims=True)
+        spike_indicator = SortedSpikesGroup.get_multiunit_spike_count(key, time)
 
         sampling_frequency = 1 / np.median(np.diff(time))
 
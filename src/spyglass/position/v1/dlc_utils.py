@@ -8,8 +8,7 @@ import subprocess
 import sys
 from collections.abc import Sequence
 from functools import reduce
-from itertools import combinations, groupby
-from operator import itemgetter
+from itertools import combinations
 from pathlib import Path, PosixPath
 from typing import Iterable, Union
 
@@ -582,11 +581,13 @@ def get_gpu_memory():  # pragma: no cover
 
 def get_span_start_stop(indices):
     """Get start and stop indices of spans of consecutive indices"""
-    span_inds = []
-    for k, g in groupby(enumerate(indices), lambda x: x[1] - x[0]):
-        group = list(map(itemgetter(1), g))
-        span_inds.append((group[0], group[-1]))
-    return span_inds
+    indices = np.asarray(indices)
+    if not indices.size:
+        return []
+    breaks = np.flatnonzero(np.diff(indices) != 1)
+    starts = indices[np.r_[0, breaks + 1]]
+    stops = indices[np.r_[breaks, len(indices) - 1]]
+    return list(zip(starts.tolist(), stops.tolist()))
 
 
 def interp_pos(dlc_df, spans_to_interp, **kwargs):
@@ -143,6 +143,33 @@ class DLCPoseEstimationSelection(SpyglassMixin, dj.Manual):
         )
 
 
+POSE_COLUMNS = ("video_frame_ind", "x", "y", "likelihood")
+
+
+def _pose_timestamps(nwb_data: dict) -> np.ndarray:
+    """Timestamps of a fetched pose estimation BodyPart."""
+    return np.asarray(
+        nwb_data["dlc_pose_estimation_position"].get_spatial_series().timestamps
+    )
+
+
+def _read_pose_columns(nwb_data: dict, columns: list, out: np.ndarray) -> None:
+    """Read pose columns of a fetched BodyPart into the columns of out.
+
+    Position columns are read as slices of the spatial series, so unused
+    columns are not read from the file.
+    """
+    likelihood = nwb_data["dlc_pose_estimation_likelihood"].time_series
+    position = nwb_data["dlc_pose_estimation_position"].get_spatial_series()
+    for ind, column in enumerate(columns):
+        if column in ("x", "y"):
+            out[:, ind] = position.data[:, "xy".index(column)]
+        elif column == "video_frame_ind":  # stored as int, cast as before
+            out[:, ind] = np.asarray(likelihood[column].data, dtype=int)
+        else:
+            out[:, ind] = likelihood[column].data[:]
+
+
 @schema
 class DLCPoseEstimation(SpyglassMixin, dj.Computed):
     definition = """
@@ -169,44 +196,15 @@ class DLCPoseEstimation(SpyglassMixin, dj.Computed):
             """Fetch a single bodypart dataframe."""
             _ = self.ensure_single_entry()
             nwb_data = self.fetch_nwb()[0]
-            index = pd.Index(
-                np.asarray(
-                    nwb_data["dlc_pose_estimation_position"]
-                    .get_spatial_series()
-                    .timestamps
-                ),
-                name="time",
-            )
-            COLUMNS = [
-                "video_frame_ind",
-                "x",
-                "y",
-                "likelihood",
-            ]
+            timestamps = _pose_timestamps(nwb_data)
+            columns = list(POSE_COLUMNS)
+            data = np.empty((len(timestamps), len(columns)))
+            _read_pose_columns(nwb_data, columns, data)
             return pd.DataFrame(
-                np.concatenate(
-                    (
-                        np.asarray(
-                            nwb_data["dlc_pose_estimation_likelihood"]
-                            .time_series["video_frame_ind"]
-                            .data,
-                            dtype=int,
-                        )[:, np.newaxis],
-                        np.asarray(
-                            nwb_data["dlc_pose_estimation_position"]
-                            .get_spatial_series()
-                            .data
-                        ),
-                        np.asarray(
-                            nwb_data["dlc_pose_estimation_likelihood"]
-                            .time_series["likelihood"]
-                            .data
-                        )[:, np.newaxis],
-                    ),
-                    axis=1,
-                ),
-                columns=COLUMNS,
-                index=index,
+                data,
+                columns=columns,
+                index=pd.Index(timestamps, name="time"),
+                copy=False,
             )
 
     def make(self, key):
@@ -356,60 +354,55 @@ class DLCPoseEstimation(SpyglassMixin, dj.Computed):
             )
             self.BodyPart.insert1(key)
 
-    def fetch_dataframe(self, *attrs, **kwargs) -> pd.DataFrame:
-        """Fetch a concatenated dataframe of all bodyparts."""
-        entries = (self.BodyPart & self).fetch("KEY", log_export=False)
-        nwb_data_dict = {
-            entry["bodypart"]: (self.BodyPart() & entry).fetch_nwb()[0]
-            for entry in entries
-        }
-        index = pd.Index(
-            np.asarray(
-                nwb_data_dict[entries[0]["bodypart"]][
-                    "dlc_pose_estimation_position"
-                ]
-                .get_spatial_series()
-                .timestamps
-            ),
-            name="time",
-        )
-        COLUMNS = ["video_frame_ind", "x", "y", "likelihood"]
-        return pd.concat(
-            {
-                entry["bodypart"]: pd.DataFrame(
-                    np.concatenate(
-                        (
-                            np.asarray(
-                                nwb_data_dict[entry["bodypart"]][
-                                    "dlc_pose_estimation_likelihood"
-                                ]
-                                .time_series["video_frame_ind"]
-                                .data,
-                                dtype=int,
-                            )[:, np.newaxis],
-                            np.asarray(
-                                nwb_data_dict[entry["bodypart"]][
-                                    "dlc_pose_estimation_position"
-                                ]
-                                .get_spatial_series()
-                                .data
-                            ),
-                            np.asarray(
-                                nwb_data_dict[entry["bodypart"]][
-                                    "dlc_pose_estimation_likelihood"
-                                ]
-                                .time_series["likelihood"]
-                                .data
-                            )[:, np.newaxis],
-                        ),
-                        axis=1,
-                    ),
-                    columns=COLUMNS,
-                    index=index,
-                )
-                for entry in entries
-            },
-            axis=1,
+    def fetch_dataframe(
+        self, *attrs, bodyparts=None, columns=None, **kwargs
+    ) -> pd.DataFrame:
+        """Fetch a concatenated dataframe of all bodyparts.
+
+        BodyPart entries are fetched in one query, and only the requested
+        columns are read from the analysis file, each into its slot of one
+        preallocated array.
+
+        Parameters
+        ----------
+        bodyparts : list of str, optional
+            Bodyparts to load, in order. Default all bodyparts.
+        columns : list of str, optional
+            Columns to load for each bodypart, any of "video_frame_ind", "x",
+            "y" and "likelihood". Default all.
+
+        Returns
+        -------
+        pd.DataFrame
+            Pose data indexed by time, with (bodypart, column) columns.
+        """
+        columns = list(POSE_COLUMNS if columns is None else columns)
+        if invalid := set(columns) - set(POSE_COLUMNS):
+            raise ValueError(f"Unknown pose columns: {sorted(invalid)}")
+
+        query = self.BodyPart & self
+        if bodyparts is not None:
+            query &= [{"bodypart": bodypart} for bodypart in bodyparts]
+        nwb_data = {entry["bodypart"]: entry for entry in query.fetch_nwb()}
+        if bodyparts is None:
+            bodyparts = list(nwb_data)
+        if missing := set(bodyparts) - set(nwb_data):
+            raise ValueError(f"No pose estimation for: {sorted(missing)}")
+
+        timestamps = _pose_timestamps(nwb_data[bodyparts[0]])
+        data = np.empty((len(timestamps), len(bodyparts) * len(columns)))
+        for ind, bodypart in enumerate(bodyparts):
+            _read_pose_columns(
+                nwb_data[bodypart],
+                columns,
+                data[:, ind * len(columns) : (ind + 1) * len(columns)],
+            )
+
+        return pd.DataFrame(
+            data,
+            columns=pd.MultiIndex.from_product([bodyparts, columns]),
+            index=pd.Index(timestamps, name="time"),
+            copy=False,
         )
 
     def fetch_video_path(self, key: dict = True) -> str:
@@ -356,8 +356,8 @@ def nan_inds(
     dlc_df.loc[idx[df_subthresh_indices], idx[("x", "y")]] = np.nan
 
     # To further determine which indices are the original point and which are
-    # jump points. There could be a more efficient method of doing this screen
-    # inds for jumps to baseline
+    # jump points, walk outward from the middle of each good span, comparing
+    # each point to the last good point seen along the way
 
     subthresh_inds_mask = np.zeros(len(dlc_df), dtype=bool)
     subthresh_inds_mask[subthresh_inds] = True
@@ -371,70 +371,71 @@ def nan_inds(
         # TODO: instead of raise, insert empty dataframe
         raise ValueError("No good spans found in the data")
 
+    x = dlc_df["x"].to_numpy(dtype=float, copy=True)
+    y = dlc_df["y"].to_numpy(dtype=float, copy=True)
+
     for span in good_spans[::-1]:
-        if np.sum(np.isnan(dlc_df.iloc[span[0] : span[-1]].x)) > 0:
-            nan_mask = np.isnan(dlc_df.iloc[span[0] : span[-1]].x)
+        nan_mask = np.isnan(x[span[0] : span[-1]])
+        if np.any(nan_mask):
             good_start = np.arange(span[0], span[1])[~nan_mask]
             start_point = good_start[int(len(good_start) // 2)]
         else:
             start_point = span[0] + int(span_length(span) // 2)
 
-        for ind in range(start_point, span[0], -1):
-            if subthresh_inds_mask[ind]:
-                continue  # pragma: no cover
-            previous_good_inds = np.where(
-                np.logical_and(
-                    ~np.isnan(dlc_df.iloc[ind + 1 : start_point].x),
-                    ~jump_inds_mask[ind + 1 : start_point],
-                    ~subthresh_inds_mask[ind + 1 : start_point],
-                )
-            )[0]
-            last_good_ind = (
-                ind + 1 + np.min(previous_good_inds)
-                if len(previous_good_inds) > 0
-                else start_point
+        for stop, step in ((span[0], -1), (span[-1], 1)):
+            _screen_jumps(
+                x,
+                y,
+                subthresh_inds_mask,
+                jump_inds_mask,
+                start_point,
+                stop,
+                step,
+                max_dist_between,
             )
-            good_x, good_y = dlc_df.loc[
-                idx[dlc_df.index[last_good_ind]], ["x", "y"]
-            ]
-            if (
-                (dlc_df.y.iloc[ind] < int(good_y - max_dist_between))
-                | (dlc_df.y.iloc[ind] > int(good_y + max_dist_between))
-            ) | (
-                (dlc_df.x.iloc[ind] < int(good_x - max_dist_between))
-                | (dlc_df.x.iloc[ind] > int(good_x + max_dist_between))
-            ):
-                jump_inds_mask[ind] = True
-        for ind in range(start_point, span[-1], 1):
-            if subthresh_inds_mask[ind]:
-                continue  # pragma: no cover
-            previous_good_inds = np.where(
-                np.logical_and(
-                    ~np.isnan(dlc_df.iloc[start_point:ind].x),
-                    ~jump_inds_mask[start_point:ind],
-                    ~subthresh_inds_mask[start_point:ind],
-                )
-            )[0]
-            if len(previous_good_inds) >= 1:
-                last_good_ind = start_point + np.max(previous_good_inds)
-            else:
-                last_good_ind = start_point
-            good_x, good_y = dlc_df.loc[
-                idx[dlc_df.index[last_good_ind]], ["x", "y"]
-            ]
-            if (
-                (dlc_df.y.iloc[ind] < int(good_y - max_dist_between))
-                | (dlc_df.y.iloc[ind] > int(good_y + max_dist_between))
-            ) | (
-                (dlc_df.x.iloc[ind] < int(good_x - max_dist_between))
-                | (dlc_df.x.iloc[ind] > int(good_x + max_dist_between))
-            ):
-                jump_inds_mask[ind] = True
-        bad_inds_mask = np.logical_or(jump_inds_mask, subthresh_inds_mask)
-        dlc_df.loc[bad_inds_mask, idx[("x", "y")]] = np.nan
+        # NaN this span's jumps so later (earlier in time) spans see them
+        span_bad = jump_inds_mask[span[0] : span[-1] + 1]
+        x[span[0] : span[-1] + 1][span_bad] = np.nan
+        y[span[0] : span[-1] + 1][span_bad] = np.nan
+
+    bad_inds_mask = np.logical_or(jump_inds_mask, subthresh_inds_mask)
+    dlc_df.loc[bad_inds_mask, idx[("x", "y")]] = np.nan
     return dlc_df, bad_inds_mask
 
 
+def _screen_jumps(
+    x: np.ndarray,
+    y: np.ndarray,
+    subthresh_inds_mask: np.ndarray,
+    jump_inds_mask: np.ndarray,
+    start_point: int,
+    stop: int,
+    step: int,
+    max_dist_between: float,
+) -> None:
+    """Mark jumps from start_point toward stop (exclusive) in place.
+
+    Each point is compared to the nearest good point (not NaN, subthresh, or
+    jump) between it and start_point, or start_point itself if there is none.
+    The last good point is carried along the walk, so each pass is linear.
+    """
+    last_good_ind = start_point
+    for ind in range(start_point, stop, step):
+        if subthresh_inds_mask[ind]:
+            continue  # pragma: no cover
+        good_x, good_y = x[last_good_ind], y[last_good_ind]
+        if (
+            (y[ind] < np.trunc(good_y - max_dist_between))
+            | (y[ind] > np.trunc(good_y + max_dist_between))
+        ) | (
+            (x[ind] < np.trunc(good_x - max_dist_between))
+            | (x[ind] > np.trunc(good_x + max_dist_between))
+        ):
+            jump_inds_mask[ind] = True
+        elif not np.isnan(x[ind]):
+            last_good_ind = ind
+
+
 def get_good_spans(bad_inds_mask, inds_to_span: int = 50):
     """
     This function takes in a boolean mask of good and bad indices and
@@ -468,26 +469,15 @@ def get_good_spans(bad_inds_mask, inds_to_span: int = 50):
     elif len(good) == 1:  # if all good, no need to modify
         return good, good
 
-    modified_spans = []
-    for (start1, stop1), (start2, stop2) in zip(good[:-1], good[1:]):
-        check_existing = [
-            entry
-            for entry in modified_spans
-            if start1 in range(entry[0] - inds_to_span, entry[1] + inds_to_span)
-        ]
-        if len(check_existing) > 0:
-            modify_ind = modified_spans.index(check_existing[0])
-            if (start2 - stop1) <= inds_to_span:
-                modified_spans[modify_ind] = (check_existing[0][0], stop2)
-            else:
-                modified_spans[modify_ind] = (check_existing[0][0], stop1)
-                modified_spans.append((start2, stop2))
-            continue
-        if (start2 - stop1) <= inds_to_span:
-            modified_spans.append((start1, stop2))
-        else:
-            modified_spans.append((start1, stop1))
-            modified_spans.append((start2, stop2))
+    # Neighboring spans separated by at most inds_to_span are merged
+    starts, stops = np.array(good).T
+    breaks = np.flatnonzero((starts[1:] - stops[:-1]) > inds_to_span)
+    modified_spans = list(
+        zip(
+            starts[np.r_[0, breaks + 1]].tolist(),
+            stops[np.r_[breaks, len(good) - 1]].tolist(),
+        )
+    )
     return good, modified_spans
 
 
@@ -517,14 +507,9 @@ def get_subthresh_inds(
     sub_thresh_percent: float, optional
         Percentage of subthresh points
     """
-    df_filter = dlc_df["likelihood"] < likelihood_thresh
-    sub_thresh_inds = np.where(
-        ~np.isnan(dlc_df["likelihood"].where(df_filter))
-    )[0]
-    nand_inds = np.where(np.isnan(dlc_df["x"]))[0]
-    all_nan_inds = list(set(sub_thresh_inds).union(set(nand_inds)))
-    all_nan_inds.sort()
-    sub_thresh_percent = (len(sub_thresh_inds) / len(dlc_df)) * 100
+    sub_thresh_mask = (dlc_df["likelihood"] < likelihood_thresh).to_numpy()
+    all_nan_inds = np.flatnonzero(sub_thresh_mask | np.isnan(dlc_df["x"]))
+    sub_thresh_percent = (sub_thresh_mask.sum() / len(dlc_df)) * 100
 
     if ret_sub_thresh:
         return all_nan_inds, sub_thresh_percent
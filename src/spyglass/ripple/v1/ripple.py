@@ -1,4 +1,5 @@
-from typing import List
+from functools import partial
+from typing import Iterator, List
 
 import datajoint as dj
 import matplotlib.pyplot as plt
@@ -16,7 +17,8 @@ from spyglass.lfp.analysis.v1.lfp_band import LFPBandSelection, LFPBandV1
 from spyglass.lfp.lfp_merge import LFPOutput
 from spyglass.position import PositionOutput
 from spyglass.utils import SpyglassMixin, logger
-from spyglass.utils.nwb_helper_fn import get_electrode_indices
+from spyglass.utils.nwb_helper_fn import LRUCache, get_electrode_indices
+from spyglass.utils.position import interpolate_to_new_time
 
 schema = dj.schema("ripple_v1")
 
@@ -25,6 +27,9 @@ RIPPLE_DETECTION_ALGORITHMS = {
     "Karlsson_ripple_detector": Karlsson_ripple_detector,
 }
 
+# Number of keys whose ripple inputs are memoized, see RippleInputs
+RIPPLE_INPUTS_CACHE_ITEMS = 2
+
 # Do we need this anymore given that LFPBand is no longer a merge table?
 UPSTREAM_ACCEPTED_VERSIONS = ["LFPBandV1"]
 
@@ -133,6 +138,10 @@ class RippleParameters(SpyglassMixin, dj.Lookup):
                 Smoothing sigma for ripple detection (sec)
             close_ripple_threshold : float
                 Close ripple threshold for ripple detection (sec)
+        detect_per_interval : bool, optional
+            If True, detect ripples in each valid interval separately, holding
+            one interval of LFPs in memory at a time. Z-scores are then
+            relative to each interval. Default False.
     """
 
     definition = """
@@ -178,6 +187,94 @@ class RippleParameters(SpyglassMixin, dj.Lookup):
         )
 
 
+class RippleInputs:
+    """Ripple detection inputs for one RippleTimesV1 key.
+
+    Holds the parameters, the LFP band columns of the selected electrodes,
+    the sampling rate and speed within valid times. LFPs are read from the
+    LFPBandV1 file per interval on each use, and are not kept, so memoized
+    inputs stay small.
+
+    Parameters
+    ----------
+    key : dict
+        RippleTimesV1 key.
+    ripple_params : dict
+        RippleParameters ripple_param_dict.
+    electrode_columns : np.ndarray
+        Sorted column indices of the selected electrodes in the LFP band.
+    sampling_frequency : float
+        Sampling rate of the LFP band.
+    speed : pd.DataFrame
+        Speed within the valid times, at position timestamps.
+    valid_times : np.ndarray, shape (n_intervals, 2)
+        Valid times within the position data.
+    """
+
+    def __init__(
+        self,
+        key: dict,
+        ripple_params: dict,
+        electrode_columns: np.ndarray,
+        sampling_frequency: float,
+        speed: pd.DataFrame,
+        valid_times: np.ndarray,
+    ):
+        self.key = key
+        self.ripple_params = ripple_params
+        self.electrode_columns = electrode_columns
+        self.sampling_frequency = sampling_frequency
+        self.speed = speed
+        self.valid_times = valid_times
+
+    @property
+    def lfp_band(self):
+        """LFP band series, fetched per use as files are cached when open."""
+        return (LFPBandV1 & self.key).fetch_nwb()[0]["lfp_band"]
+
+    def iter_intervals(self) -> Iterator[tuple]:
+        """Yield time, ripple LFPs and speed for each valid interval.
+
+        Only the selected columns within the interval are read from the
+        series, and speed is interpolated onto the LFP timestamps, so memory
+        scales with the selected electrodes and the interval length.
+        """
+        lfp_band = self.lfp_band
+        timestamps = np.asarray(lfp_band.timestamps)
+        for start_time, end_time in self.valid_times:
+            start = np.searchsorted(timestamps, start_time, side="left")
+            stop = np.searchsorted(timestamps, end_time, side="right")
+            if stop <= start:
+                continue
+            time = timestamps[start:stop]
+            yield (
+                time,
+                np.asarray(lfp_band.data[start:stop, self.electrode_columns]),
+                interpolate_to_new_time(self.speed, time).iloc[:, 0].to_numpy(),
+            )
+
+    def join(self) -> tuple:
+        """Speed and ripple LFPs joined across valid intervals.
+
+        Returns
+        -------
+        speed : pd.Series
+            Speed at the LFP timestamps.
+        ripple_lfps : pd.DataFrame
+            LFPs of the selected electrodes, indexed by time.
+        """
+        time, lfps, speed = (
+            np.concatenate(arrays) for arrays in zip(*self.iter_intervals())
+        )
+        index = pd.Index(time, name="time")
+        return (
+            pd.Series(
+                speed, index=index, name=self.ripple_params["speed_name"]
+            ),
+            pd.DataFrame(lfps, index=index, columns=self.electrode_columns),
+        )
+
+
 @schema
 class RippleTimesV1(SpyglassMixin, dj.Computed):
     definition = """
@@ -189,40 +286,48 @@ class RippleTimesV1(SpyglassMixin, dj.Computed):
     ripple_times_object_id : varchar(40)
      """
 
+    # Memoized RippleInputs by upstream hash, see get_ripple_inputs
+    _inputs_cache = LRUCache(max_items=RIPPLE_INPUTS_CACHE_ITEMS)
+
     def make(self, key):
         """Populate RippleTimesV1 table.
 
         Fetches...
             - Nwb file name from LFPBandV1
-            - Parameters for ripple detection from RippleParameters
-            - Ripple LFPs and position info from PositionOutput and LFPBandV1
+            - Ripple inputs from get_ripple_inputs, reused if cached
         Runs she specified ripple detection algorithm (Karlsson or Kay from
         ripple_detection package), inserts the results into the analysis nwb
-        file, and inserts the key into the RippleTimesV1 table.
+        file, and inserts the key into the RippleTimesV1 table. Detection runs
+        per interval if detect_per_interval is set.
 
         """
         nwb_file_name = (LFPBandV1 & key).fetch1("nwb_file_name")
 
         logger.info(f"Computing ripple times for: {key}")
-        ripple_params = (
-            RippleParameters & {"ripple_param_name": key["ripple_param_name"]}
-        ).fetch1("ripple_param_dict")
-
-        ripple_detection_algorithm = ripple_params["ripple_detection_algorithm"]
-        ripple_detection_params = ripple_params["ripple_detection_params"]
+        inputs = self.get_ripple_inputs(key)
+        ripple_params = inputs.ripple_params
 
-        (
-            speed,
-            interval_ripple_lfps,
-            sampling_frequency,
-        ) = self.get_ripple_lfps_and_position_info(key)
-        ripple_times = RIPPLE_DETECTION_ALGORITHMS[ripple_detection_algorithm](
-            time=np.asarray(interval_ripple_lfps.index),
-            filtered_lfps=np.asarray(interval_ripple_lfps),
-            speed=np.asarray(speed),
-            sampling_frequency=sampling_frequency,
-            **ripple_detection_params,
+        detect_ripples = partial(
+            RIPPLE_DETECTION_ALGORITHMS[
+                ripple_params["ripple_detection_algorithm"]
+            ],
+            sampling_frequency=inputs.sampling_frequency,
+            **ripple_params["ripple_detection_params"],
         )
+        if ripple_params.get("detect_per_interval", False):
+            ripple_times = _concat_event_times(
+                [
+                    detect_ripples(time=time, filtered_lfps=lfps, speed=speed)
+                    for time, lfps, speed in inputs.iter_intervals()
+                ]
+            )
+        else:
+            speed, ripple_lfps = inputs.join()
+            ripple_times = detect_ripples(
+                time=ripple_lfps.index.to_numpy(),
+                filtered_lfps=ripple_lfps.to_numpy(),
+                speed=speed.to_numpy(),
+            )
         # Insert into analysis nwb file
         nwb_analysis_file = AnalysisNwbfile()
         key["analysis_file_name"] = nwb_analysis_file.create(nwb_file_name)
@@ -247,43 +352,85 @@ class RippleTimesV1(SpyglassMixin, dj.Computed):
         return [data["ripple_times"] for data in self.fetch_nwb()]
 
     @staticmethod
-    def get_ripple_lfps_and_position_info(key) -> tuple:
-        """Return the ripple LFPs and position info for the specified key.
+    def _upstream_hash(key: dict, ripple_params: dict) -> str:
+        """Hash of the key and the upstream rows its ripple inputs use.
 
-        Fetches...
-            - Ripple parameters from RippleParameters
-            - Electrode keys from RippleLFPSelection
-            - LFP data from LFPBandV1
-            - Position data from PositionOutput merge table
-        Interpolates the position data to the LFP timestamps.
+        Recomputed upstream rows get new analysis files, so a changed hash
+        invalidates cached inputs.
+        """
+        position_parent = PositionOutput().merge_get_parent(
+            {"merge_id": key["pos_merge_id"]}
+        )
+        valid_times = (
+            IntervalList
+            & {
+                "nwb_file_name": key["nwb_file_name"],
+                "interval_list_name": key["target_interval_list_name"],
+            }
+        ).fetch1("valid_times")
+        return dj.hash.key_hash(
+            dict(
+                key,
+                ripple_param_dict=ripple_params,
+                electrode_ids=sorted(
+                    (RippleLFPSelection.RippleLFPElectrode() & key).fetch(
+                        "electrode_id"
+                    )
+                ),
+                lfp_band_file=(LFPBandV1 & key).fetch1("analysis_file_name"),
+                position_row=position_parent.fetch1(),
+                valid_times=np.asarray(valid_times).tobytes(),
+            )
+        )
+
+    @classmethod
+    def get_ripple_inputs(cls, key: dict) -> RippleInputs:
+        """Return the ripple detection inputs for key, memoized.
+
+        Inputs are reused within a populate and by create_figurl and
+        get_ripple_lfps_and_position_info. They are reloaded if the key's
+        parameters, electrodes, valid times, LFP band or position change.
+
+        Parameters
+        ----------
+        key : dict
+            RippleTimesV1 key.
+
+        Returns
+        -------
+        RippleInputs
         """
-        # TODO: Pass parameters from make func, instead of fetching again
+        key = {name: key[name] for name in cls().primary_key}
         ripple_params = (
             RippleParameters & {"ripple_param_name": key["ripple_param_name"]}
         ).fetch1("ripple_param_dict")
 
-        speed_name = ripple_params["speed_name"]
+        cache_key = cls._upstream_hash(key, ripple_params)
+        if cached := cls._inputs_cache.get(cache_key):
+            return cached
+
+        inputs = cls._load_ripple_inputs(key, ripple_params)
+        cls._inputs_cache[cache_key] = inputs
+        return inputs
 
+    @classmethod
+    def _load_ripple_inputs(
+        cls, key: dict, ripple_params: dict
+    ) -> RippleInputs:
+        """Load the ripple detection inputs for key. See get_ripple_inputs."""
         electrode_keys = (RippleLFPSelection.RippleLFPElectrode() & key).fetch(
             "electrode_id"
         )
 
         # warn/validate that there is only one wire per electrode
         ripple_lfp_nwb = (LFPBandV1 & key).fetch_nwb()[0]
-        ripple_lfp_electrodes = ripple_lfp_nwb["lfp_band"].electrodes.data[:]
+        lfp_band = ripple_lfp_nwb["lfp_band"]
+        ripple_lfp_electrodes = lfp_band.electrodes.data[:]
         elec_mask = np.zeros_like(ripple_lfp_electrodes, dtype=bool)
         valid_elecs = [
             elec for elec in electrode_keys if elec in ripple_lfp_electrodes
         ]
-        lfp_indexed_elec_ids = get_electrode_indices(
-            ripple_lfp_nwb["lfp_band"], valid_elecs
-        )
-        elec_mask[lfp_indexed_elec_ids] = True
-        ripple_lfp = pd.DataFrame(
-            ripple_lfp_nwb["lfp_band"].data,
-            index=pd.Index(ripple_lfp_nwb["lfp_band"].timestamps, name="time"),
-        ).loc[:, elec_mask]
-        sampling_frequency = ripple_lfp_nwb["lfp_band_sampling_rate"]
+        elec_mask[get_electrode_indices(lfp_band, valid_elecs)] = True
 
         position_valid_times = (
             IntervalList
@@ -300,34 +447,43 @@ class RippleTimesV1(SpyglassMixin, dj.Computed):
         valid_times_interval = np.array(
             [position_info.index[0], position_info.index[-1]]
         )
-        position_valid_times = position_valid_times.intersect(
-            valid_times_interval
-        ).times
+        valid_times = position_valid_times.intersect(valid_times_interval).times
+        if len(valid_times) == 0:
+            raise ValueError(f"No valid times with position data for {key}")
 
-        position_info = pd.concat(
-            [
-                position_info.loc[slice(valid_time[0], valid_time[1])]
-                for valid_time in position_valid_times
-            ],
-            axis=0,
-        )
-        interval_ripple_lfps = pd.concat(
+        speed_name = ripple_params["speed_name"]
+        speed = pd.concat(
             [
-                ripple_lfp.loc[slice(valid_time[0], valid_time[1])]
-                for valid_time in position_valid_times
+                position_info.loc[slice(*valid_time), [speed_name]]
+                for valid_time in valid_times
             ],
             axis=0,
         )
 
-        position_info = interpolate_to_new_time(
-            position_info, interval_ripple_lfps.index
+        return RippleInputs(
+            key=key,
+            ripple_params=ripple_params,
+            electrode_columns=np.flatnonzero(elec_mask),
+            sampling_frequency=ripple_lfp_nwb["lfp_band_sampling_rate"],
+            speed=speed,
+            valid_times=valid_times,
         )
 
-        return (
-            position_info[speed_name],
-            interval_ripple_lfps,
-            sampling_frequency,
-        )
+    @classmethod
+    def get_ripple_lfps_and_position_info(cls, key) -> tuple:
+        """Return the ripple LFPs and position info for the specified key.
+
+        Fetches...
+            - Ripple parameters from RippleParameters
+            - Electrode keys from RippleLFPSelection
+            - LFP data from LFPBandV1
+            - Position data from PositionOutput merge table
+        Interpolates the position data to the LFP timestamps. Reuses inputs
+        memoized by get_ripple_inputs.
+        """
+        inputs = cls.get_ripple_inputs(key)
+        speed, ripple_lfps = inputs.join()
+        return speed, ripple_lfps, inputs.sampling_frequency
 
     @staticmethod
     def get_Kay_ripple_consensus_trace(
@@ -452,13 +608,10 @@ class RippleTimesV1(SpyglassMixin, dj.Computed):
             )
 
         key = self.fetch1("KEY")
-        (
-            speed,
-            ripple_filtered_lfps,
-            sampling_frequency,
-        ) = self.get_ripple_lfps_and_position_info(key)
+        inputs = self.get_ripple_inputs(key)
+        speed, ripple_filtered_lfps = inputs.join()
         ripple_consensus_trace = self.get_Kay_ripple_consensus_trace(
-            ripple_filtered_lfps, sampling_frequency
+            ripple_filtered_lfps, inputs.sampling_frequency
         )
 
         if zscore_ripple:
@@ -476,14 +629,9 @@ class RippleTimesV1(SpyglassMixin, dj.Computed):
             width=1,
         )
         if zscore_ripple:
-            ripple_params = (
-                RippleParameters
-                & {"ripple_param_name": key["ripple_param_name"]}
-            ).fetch1("ripple_param_dict")
-
-            zscore_threshold = ripple_params["ripple_detection_params"].get(
-                "zscore_threshold"
-            )
+            zscore_threshold = inputs.ripple_params[
+                "ripple_detection_params"
+            ].get("zscore_threshold")
             if zscore_threshold is not None:
                 consensus_view.add_line_series(
                     name="Z-Score Threshold",
@@ -553,16 +701,10 @@ class RippleTimesV1(SpyglassMixin, dj.Computed):
         return view.url(label="Ripple Detection")
 
 
-def interpolate_to_new_time(
-    df, new_time, upsampling_interpolation_method="linear"
-):
-    """Upsample a dataframe to a new time index"""
-    old_time = df.index
-    new_index = pd.Index(
-        np.unique(np.concatenate((old_time, new_time))), name="time"
-    )
-    return (
-        df.reindex(index=new_index)
-        .interpolate(method=upsampling_interpolation_method)
-        .reindex(index=new_time)
+def _concat_event_times(event_times: List[pd.DataFrame]) -> pd.DataFrame:
+    """Concatenate event times detected per interval, renumbering from 1."""
+    event_times = pd.concat(event_times, axis=0)
+    event_times.index = pd.RangeIndex(
+        1, len(event_times) + 1, name=event_times.index.name
     )
+    return event_times
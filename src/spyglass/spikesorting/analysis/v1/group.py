@@ -1,5 +1,5 @@
 from itertools import compress
-from typing import Optional, Union
+from typing import Iterator, Optional, Tuple, Union
 
 import datajoint as dj
 import numpy as np
@@ -9,7 +9,12 @@ from spyglass.settings import test_mode
 from spyglass.spikesorting.spikesorting_merge import SpikeSortingOutput
 from spyglass.utils import logger
 from spyglass.utils.dj_mixin import SpyglassMixin, SpyglassMixinPart
-from spyglass.utils.spikesorting import firing_rate_from_spike_indicator
+from spyglass.utils.spikesorting import (
+    firing_rate_from_spike_indicator,
+    iter_firing_rate,
+    multiunit_count_from_times,
+    spike_indicator_from_times,
+)
 
 schema = dj.schema("spikesorting_group_v1")
 
@@ -254,6 +259,8 @@ class SortedSpikesGroup(SpyglassMixin, dj.Manual):
         key: dict,
         time: np.ndarray,
         return_unit_ids: bool = False,
+        sparse: bool = False,
+        dtype: np.dtype = np.float64,
     ) -> np.ndarray:
         """Get spike indicator matrix for the group
 
@@ -267,34 +274,50 @@ class SortedSpikesGroup(SpyglassMixin, dj.Manual):
             if True, return the unit ids along with the spike indicator matrix,
             by default False. Unit ids defined as a list of dictionaries with
             keys 'spikesorting_merge_id' and 'unit_number'
+        sparse : bool, optional
+            if True, return a scipy.sparse CSR matrix, by default False
+        dtype : np.dtype, optional
+            data type of the spike counts, by default float64. Use an integer
+            type (e.g., np.uint16) for a smaller dense matrix.
 
         Returns
         -------
-        np.ndarray
+        np.ndarray or scipy.sparse.csr_matrix
             spike indicator matrix with shape (len(time), n_units)
         list of dict, optional
             if return_unit_ids is True, returns a list of dictionaries with
             keys 'spikesorting_merge_id' and 'unit_number' for each unit
         """
-        time = np.asarray(time)
-        min_time, max_time = time[[0, -1]]
         spike_times, unit_ids = cls.fetch_spike_data(key, return_unit_ids=True)
-
-        spike_indicator = np.zeros((len(time), len(spike_times)))
-
-        for ind, times in enumerate(spike_times):
-            times = times[np.logical_and(times >= min_time, times <= max_time)]
-            spike_indicator[:, ind] = np.bincount(
-                np.digitize(times, time[1:-1]),
-                minlength=time.shape[0],
-            )
-
-        if spike_indicator.ndim == 1:
-            spike_indicator = spike_indicator[:, np.newaxis]
+        spike_indicator = spike_indicator_from_times(
+            spike_times, time, sparse=sparse, dtype=dtype
+        )
         if return_unit_ids:
             return spike_indicator, unit_ids
         return spike_indicator
 
+    @classmethod
+    def get_multiunit_spike_count(
+        cls, key: dict, time: np.ndarray
+    ) -> np.ndarray:
+        """Get spike counts summed across all units in the group
+
+        Never builds the per-unit spike indicator matrix.
+
+        Parameters
+        ----------
+        key : dict
+            key to identify the group
+        time : np.ndarray
+            time vector for which to count spikes
+
+        Returns
+        -------
+        np.ndarray
+            integer spike counts with shape (len(time), 1)
+        """
+        return multiunit_count_from_times(cls.fetch_spike_data(key), time)
+
     @classmethod
     def get_firing_rate(
         cls,
@@ -331,8 +354,8 @@ class SortedSpikesGroup(SpyglassMixin, dj.Manual):
             if return_unit_ids is True, returns a list of dictionaries with
             keys 'spikesorting_merge_id' and 'unit_number' for each unit
         """
-        spike_indicator, unit_ids = cls.get_spike_indicator(
-            key, time, return_unit_ids=True
+        spike_indicator, unit_ids = cls._get_rate_indicator(
+            key, time, multiunit
         )
         firing_rate = firing_rate_from_spike_indicator(
             spike_indicator=spike_indicator,
@@ -344,6 +367,66 @@ class SortedSpikesGroup(SpyglassMixin, dj.Manual):
             return firing_rate, unit_ids
         return firing_rate
 
+    @classmethod
+    def iter_firing_rate(
+        cls,
+        key: dict,
+        time: np.ndarray,
+        chunk_size: int = 100_000,
+        multiunit: bool = False,
+        smoothing_sigma: float = 0.015,
+    ) -> Iterator[Tuple[np.ndarray, np.ndarray]]:
+        """Yield the firing rate for units in the group in blocks of time
+
+        Blocks overlap by the width of the smoothing kernel, so concatenated
+        blocks match get_firing_rate while only one block is held in memory.
+
+        Parameters
+        ----------
+        key : dict
+            key to identify the group
+        time : np.ndarray
+            time vector for which to calculate the firing rate
+        chunk_size : int, optional
+            number of time samples per block, by default 100_000
+        multiunit : bool, optional
+            if True, return the multiunit firing rate for units in the group,
+            by default False
+        smoothing_sigma : float, optional
+            standard deviation of gaussian filter to smooth firing rates in
+            seconds, by default 0.015
+
+        Yields
+        ------
+        np.ndarray
+            time vector of the block
+        np.ndarray
+            firing rate of the block with shape (n_block, n_units)
+        """
+        time = np.asarray(time)
+        spike_indicator, _ = cls._get_rate_indicator(key, time, multiunit)
+        for time_slice, firing_rate in iter_firing_rate(
+            spike_indicator,
+            time,
+            chunk_size=chunk_size,
+            multiunit=multiunit,
+            smoothing_sigma=smoothing_sigma,
+        ):
+            yield time[time_slice], firing_rate
+
+    @classmethod
+    def _get_rate_indicator(
+        cls, key: dict, time: np.ndarray, multiunit: bool
+    ) -> Tuple[np.ndarray, list]:
+        """Multiunit counts or sparse per-unit indicator for firing rates"""
+        spike_times, unit_ids = cls.fetch_spike_data(key, return_unit_ids=True)
+        if multiunit:
+            return multiunit_count_from_times(spike_times, time), unit_ids
+        return (
+            spike_indicator_from_times(spike_times, time, sparse=True),
+            unit_ids,
+        )
+
 
 def _get_spike_obj_name(nwb_file, allow_empty=False):
     nwb_field_name = (
@@ -19,7 +19,10 @@ from spyglass.spikesorting.v1 import (
 from spyglass.utils.dj_merge_tables import _Merge
 from spyglass.utils.dj_mixin import SpyglassMixin
 from spyglass.utils.logging import logger
-from spyglass.utils.spikesorting import firing_rate_from_spike_indicator
+from spyglass.utils.spikesorting import (
+    firing_rate_from_spike_indicator,
+    spike_indicator_from_times,
+)
 
 schema = dj.schema("spikesorting_merge")
 
@@ -229,22 +232,8 @@ class SpikeSortingOutput(_Merge, SpyglassMixin):
         np.ndarray
             spike indicator matrix with shape (len(time), n_units)
         """
-        time = np.asarray(time)
-        min_time, max_time = time[[0, -1]]
         spike_times = (cls & key).get_spike_times(key)
-        spike_indicator = np.zeros((len(time), len(spike_times)))
-
-        for ind, times in enumerate(spike_times):
-            times = times[np.logical_and(times >= min_time, times <= max_time)]
-            spike_indicator[:, ind] = np.bincount(
-                np.digitize(times, time[1:-1]),
-                minlength=time.shape[0],
-            )
-
-        if spike_indicator.ndim == 1:
-            spike_indicator = spike_indicator[:, np.newaxis]
-
-        return spike_indicator
+        return spike_indicator_from_times(spike_times, time)
 
     @classmethod
     def get_firing_rate(
@@ -1,10 +1,14 @@
-from typing import Dict, List, Tuple, Union
+from typing import Any, Dict, List, Tuple, Union
 
 import matplotlib.pyplot as plt
 import numpy as np
 from datajoint.expression import QueryExpression
 
 from spyglass.utils import logger
+from spyglass.utils.nwb_helper_fn import LRUCache
+
+BURST_CACHE_MAX_ITEMS = 16  # sort groups kept in each BurstPair cache
+BURST_CACHE_MAX_BYTES = 2 * 1024**3  # approximate size of each BurstPair cache
 
 
 def validate_pairs(
@@ -285,3 +289,122 @@ def calculate_isi_violation(
     num_spikes = len(spike_train)
     num_violations = np.sum(isis < (isi_threshold_s * 1e-3))
     return num_violations / num_spikes
+
+
+def _array_bytes(value: Any) -> int:
+    """Approximate size of arrays nested in tuples, lists and dicts."""
+    if isinstance(value, np.ndarray):
+        return value.nbytes
+    if isinstance(value, dict):
+        return sum(_array_bytes(v) for v in value.values())
+    if isinstance(value, (tuple, list)):
+        return sum(_array_bytes(v) for v in value)
+    return 0
+
+
+def burst_cache(max_items: int = BURST_CACHE_MAX_ITEMS) -> LRUCache:
+    """Return an LRU cache for per-key BurstPair results."""
+    return LRUCache(
+        max_items=max_items,
+        max_bytes=BURST_CACHE_MAX_BYTES,
+        size_func=_array_bytes,
+    )
+
+
+def waveform_similarity_matrix(waves_mean: np.ndarray) -> np.ndarray:
+    """Pearson correlation between the mean waveforms of all units.
+
+    Equivalent to scipy.stats.pearsonr for each pair, as one matrix product.
+
+    Parameters
+    ----------
+    waves_mean : np.ndarray
+        Flattened mean waveform of each unit, shape (n_units, n_samples).
+
+    Returns
+    -------
+    np.ndarray
+        Correlation matrix, shape (n_units, n_units). NaN for units with a
+        constant waveform.
+    """
+    centered = waves_mean - waves_mean.mean(axis=1, keepdims=True)
+    norms = np.linalg.norm(centered, axis=1)
+    with np.errstate(divide="ignore", invalid="ignore"):
+        normalized = centered / norms[:, np.newaxis]
+    return np.clip(normalized @ normalized.T, -1.0, 1.0)
+
+
+def isi_violation_matrix(
+    spike_times: List[np.ndarray], isi_threshold_s: float = 1.5
+) -> np.ndarray:
+    """Calculate isi violation between all pairs of spike trains.
+
+    Equivalent to calculate_isi_violation for each pair. Each train is
+    sorted once, and each pair is merged by position rather than re-sorted.
+
+    Parameters
+    ----------
+    spike_times : list of np.ndarray
+        Spike times of each unit in seconds.
+    isi_threshold_s : float, optional
+        ISI threshold in ms, by default 1.5.
+
+    Returns
+    -------
+    np.ndarray
+        Symmetric matrix of violations over total spikes, shape
+        (n_units, n_units). The diagonal is not computed and left as NaN.
+    """
+    sorted_times = [np.sort(np.asarray(t, dtype=float)) for t in spike_times]
+    threshold = isi_threshold_s * 1e-3
+
+    n_units = len(sorted_times)
+    violations = np.full((n_units, n_units), np.nan)
+    for ind1 in range(n_units):
+        times1 = sorted_times[ind1]
+        for ind2 in range(ind1 + 1, n_units):
+            times2 = sorted_times[ind2]
+            num_spikes = len(times1) + len(times2)
+
+            # position of each spike of times2 in the merged train
+            inds2 = np.searchsorted(times1, times2, side="right")
+            inds2 += np.arange(len(times2))
+            merged = np.empty(num_spikes)
+            is_times2 = np.zeros(num_spikes, dtype=bool)
+            is_times2[inds2] = True
+            merged[is_times2] = times2
+            merged[~is_times2] = times1
+
+            num_violations = np.count_nonzero(np.diff(merged) < threshold)
+            with np.errstate(divide="ignore", invalid="ignore"):
+                violations[ind1, ind2] = np.divide(num_violations, num_spikes)
+            violations[ind2, ind1] = violations[ind1, ind2]
+    return violations
+
+
+def correlogram_asymmetry_matrix(
+    bins: np.ndarray, ccgs: np.ndarray
+) -> np.ndarray:
+    """Calculate Correlogram Asymmetry (CA) for all pairs of units.
+
+    Equivalent to calculate_ca for each pair.
+
+    Parameters
+    ----------
+    bins : np.ndarray
+        array of bin edges, shape (n_bins,)
+    ccgs : np.ndarray
+        Correlograms with shape (n_units, n_units, n_bins)
+
+    Returns
+    -------
+    np.ndarray
+        Asymmetry of each pair of units, shape (n_units, n_units).
+    """
+    if not len(bins) == ccgs.shape[-1]:
+        raise ValueError("Mismatch in lengths for correl asymmetry")
+    right = ccgs[..., bins > 0].sum(axis=-1)
+    left = ccgs[..., bins < 0].sum(axis=-1)
+    total = right + left
+    with np.errstate(divide="ignore", invalid="ignore"):
+        return np.where(total == 0, 0, (right - left) / total)
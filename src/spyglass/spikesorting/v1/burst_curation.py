@@ -4,21 +4,22 @@ from typing import Dict, List, Tuple, Union
 import datajoint as dj
 import matplotlib.pyplot as plt
 import numpy as np
-from scipy import stats
 from spikeinterface.postprocessing.correlograms import (
     WaveformExtractor,
     compute_correlograms,
 )
 
 from spyglass.spikesorting.utils_burst import (
-    calculate_ca,
-    calculate_isi_violation,
+    burst_cache,
+    correlogram_asymmetry_matrix,
+    isi_violation_matrix,
     plot_burst_by_sort_group,
     plot_burst_metrics,
     plot_burst_pair_peaks,
     plot_burst_peak_over_time,
     plot_burst_xcorrel,
     validate_pairs,
+    waveform_similarity_matrix,
 )
 from spyglass.spikesorting.v1.metric_curation import (
     CurationV1,
@@ -120,8 +121,8 @@ class BurstPair(SpyglassMixin, dj.Computed):
         """
 
     # TODO: Should these be caches or master table blobs?
-    _peak_amp_cache = {}
-    _xcorrel_cache = {}
+    _peak_amp_cache = burst_cache()
+    _xcorrel_cache = burst_cache()
 
     def _null_insert(self, key, msg="No units found for") -> None:
         """Insert a null entry with a warning message"""
@@ -267,35 +268,37 @@ class BurstPair(SpyglassMixin, dj.Computed):
 
         # mean waveforms in a dict: each one is of spike number x 4
         waves = METRIC_TBL.get_waveforms(key)
-        waves_mean_1d = {
-            u: np.reshape(
-                np.mean(waves.get_waveforms(u), axis=0).T,
-                (1, -1),
-            ).ravel()
-            for u in units
-        }
+        waves_mean_1d = np.stack(
+            [
+                np.reshape(
+                    np.mean(waves.get_waveforms(u), axis=0).T,
+                    (1, -1),
+                ).ravel()
+                for u in units
+            ]
+        )
 
         # calculate cross-correlogram and asymmetry
         ccgs, bins = self._compute_correlograms(key, params)
 
-        unit_pairs = []
-        for u1, u2 in permutations(units, 2):
-            unit_pairs.append(
-                {
-                    **key,
-                    "unit1": u1,
-                    "unit2": u2,
-                    "wf_similarity": stats.pearsonr(
-                        waves_mean_1d[u1], waves_mean_1d[u2]
-                    ).statistic,
-                    "isi_violation": calculate_isi_violation(
-                        peak_timestamps[u1], peak_timestamps[u2]
-                    ),
-                    "xcorrel_asymm": calculate_ca(
-                        bins[1:], ccgs[u1 - 1, u2 - 1, :]
-                    ),
-                }
-            )
+        # symmetric metrics for all pairs at once, indexed by unit position
+        wf_similarity = waveform_similarity_matrix(waves_mean_1d)
+        isi_violation = isi_violation_matrix(
+            [peak_timestamps[u] for u in units]
+        )
+        xcorrel_asymm = correlogram_asymmetry_matrix(bins[1:], ccgs)
+
+        unit_pairs = [
+            {
+                **key,
+                "unit1": u1,
+                "unit2": u2,
+                "wf_similarity": wf_similarity[ind1, ind2],
+                "isi_violation": isi_violation[ind1, ind2],
+                "xcorrel_asymm": xcorrel_asymm[u1 - 1, u2 - 1],
+            }
+            for (ind1, u1), (ind2, u2) in permutations(enumerate(units), 2)
+        ]
 
         self.insert1(key)
         self.BurstPairUnit.insert(unit_pairs)
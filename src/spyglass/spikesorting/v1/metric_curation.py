@@ -1,5 +1,6 @@
 import uuid
-from pathlib import Path
+from concurrent.futures import ThreadPoolExecutor
+from time import time
 from typing import Any, Dict, List, Union
 
 import datajoint as dj
@@ -8,35 +9,39 @@ import pynwb
 import spikeinterface as si
 import spikeinterface.preprocessing as sp
 import spikeinterface.qualitymetrics as sq
+from spikeinterface.core.job_tools import fix_job_kwargs
 
 from spyglass.common.common_nwbfile import AnalysisNwbfile
-from spyglass.settings import temp_dir
 from spyglass.spikesorting.v1.curation import (
     CurationV1,
     _list_to_merge_dict,
     _merge_dict_to_list,
 )
 from spyglass.spikesorting.v1.metric_utils import (
-    compute_isi_violation_fractions,
-    get_num_spikes,
+    get_all_num_spikes,
+    get_isi_violation_fractions,
     get_peak_channel,
     get_peak_offset,
 )
 from spyglass.spikesorting.v1.sorting import SpikeSortingSelection
 from spyglass.utils import SpyglassMixin, logger
+from spyglass.utils.nwb_helper_fn import LRUCache
+from spyglass.utils.waveforms import get_waveform_store
 
 schema = dj.schema("spikesorting_v1_metric_curation")
 
 
 _metric_name_to_func = {
     "snr": sq.compute_snrs,
-    "isi_violation": compute_isi_violation_fractions,
+    "isi_violation": get_isi_violation_fractions,
     "nn_isolation": sq.nearest_neighbors_isolation,
     "nn_noise_overlap": sq.nearest_neighbors_noise_overlap,
     "peak_offset": get_peak_offset,
     "peak_channel": get_peak_channel,
-    "num_spikes": get_num_spikes,
+    "num_spikes": get_all_num_spikes,
 }
+# Metrics computed one unit per call, run as separate parallel work items
+_per_unit_metrics = ("nn_isolation", "nn_noise_overlap")
 
 _comparison_to_function = {
     "<": np.less,
@@ -236,7 +241,11 @@ class MetricCuration(SpyglassMixin, dj.Computed):
     object_id: varchar(40) # Object ID for the metrics in NWB file
     """
 
-    _waves_cache = {}  # Cache waveforms for burst merge
+    # Cache waveforms for burst merge, releasing store references on eviction
+    _waves_cache = LRUCache(
+        max_items=8,
+        on_evict=lambda _, waves: get_waveform_store().release(waves),
+    )
 
     def make_fetch(self, key):
         """Populate MetricCuration table.
@@ -293,13 +302,15 @@ class MetricCuration(SpyglassMixin, dj.Computed):
         self._info_msg("Extracting waveforms...")
         waveforms = self.get_waveforms(key)
 
-        # compute metrics
+        # compute metrics, with n_jobs of the waveform parameters
         self._info_msg("Computing metrics...")
-        metrics = {}
-        for metric_name, metric_param_dict in metric_params.items():
-            metrics[metric_name] = self._compute_metric(
-                waveforms, metric_name, **metric_param_dict
-            )
+        n_jobs = upstream["waveform_params"].get("n_jobs")
+        job_kwargs = fix_job_kwargs(
+            {} if n_jobs is None else {"n_jobs": n_jobs}
+        )
+        metrics = self._compute_metrics(
+            waveforms, metric_params, n_jobs=job_kwargs["n_jobs"]
+        )
         if metrics["nn_isolation"]:
             metrics["nn_isolation"] = {
                 unit_id: value[0]
@@ -329,22 +340,26 @@ class MetricCuration(SpyglassMixin, dj.Computed):
         )
 
     def get_waveforms(
-        self, key: dict, overwrite: bool = True, fetch_all: bool = False
+        self, key: dict, overwrite: bool = False, fetch_all: bool = False
     ):
         """Returns waveforms identified by metric curation.
 
+        Waveforms are loaded from the shared waveform store, and only
+        extracted if no table has extracted the same recording, sorting and
+        parameters before.
+
         Parameters
         ----------
         key : dict
             primary key to MetricCuration
         overwrite : bool, optional
-            whether to overwrite existing waveforms, by default True
+            whether to extract again if stored, by default False
         fetch_all : bool, optional
             fetch all spikes for units, by default False. Overrides
             max_spikes_per_unit in waveform_params
         """
-        key_hash = dj.hash.key_hash(key)
-        if cached := self._waves_cache.get(key_hash):
+        cache_key = (dj.hash.key_hash(key), fetch_all)
+        if cached := self._waves_cache.get(cache_key):
             return cached
 
         query = (MetricCurationSelection & key) * WaveformParameters
@@ -361,34 +376,17 @@ class MetricCuration(SpyglassMixin, dj.Computed):
             if waveform_params.pop("whiten"):
                 recording = sp.whiten(recording, dtype=np.float64)
 
-        waveforms_dir = temp_dir + "/" + str(key["metric_curation_id"])
-        wf_dir_obj = Path(waveforms_dir)
-        wf_dir_obj.mkdir(parents=True, exist_ok=True)
-        if not any(wf_dir_obj.iterdir()):  # if the directory is empty
-            overwrite = True
-
         if fetch_all:
             waveform_params["max_spikes_per_unit"] = None
-            waveforms_dir += "_all"
 
         # Extract non-sparse waveforms by default
         waveform_params.setdefault("sparse", False)
-        dir_empty = not Path(waveforms_dir).exists() or not any(
-            Path(waveforms_dir).iterdir()
-        )
 
-        if overwrite or dir_empty:
-            waveforms = si.extract_waveforms(
-                recording=recording,
-                sorting=sorting,
-                folder=waveforms_dir,
-                overwrite=overwrite,
-                **waveform_params,
-            )
-        else:
-            waveforms = si.load_waveforms(waveforms_dir)
+        waveforms = get_waveform_store().get(
+            recording, sorting, waveform_params, overwrite=overwrite
+        )
 
-        self._waves_cache[key_hash] = waveforms
+        self._waves_cache[cache_key] = waveforms
 
         return waveforms
 
@@ -473,8 +471,75 @@ class MetricCuration(SpyglassMixin, dj.Computed):
 
         return _merge_dict_to_list(merge_group_dict)
 
+    def _compute_metrics(
+        self,
+        waveform_extractor: si.WaveformExtractor,
+        metric_params: Dict[str, dict],
+        n_jobs: int = 1,
+    ) -> Dict[str, dict]:
+        """Compute all metrics in parallel over (metric, unit) work items.
+
+        Metrics in _per_unit_metrics are split into one work item per unit.
+        Other metrics compute all units in one work item. Templates are
+        computed once before work items share the waveform extractor.
+
+        Parameters
+        ----------
+        waveform_extractor : si.WaveformExtractor
+            Waveforms to compute metrics from.
+        metric_params : Dict[str, dict]
+            Parameters of each metric, as in MetricParameters.
+        n_jobs : int, optional
+            Number of threads, by default 1.
+
+        Returns
+        -------
+        Dict[str, dict]
+            Values of each metric, keyed by unit id.
+        """
+        unit_ids = waveform_extractor.sorting.get_unit_ids()
+        work_items = []
+        for metric_name, metric_param_dict in metric_params.items():
+            item_units = (
+                unit_ids if metric_name in _per_unit_metrics else [None]
+            )
+            work_items.extend(
+                (metric_name, unit_id, metric_param_dict)
+                for unit_id in item_units
+            )
+
+        def compute_item(item):
+            metric_name, unit_id, metric_param_dict = item
+            start = time()
+            values = self._compute_metric(
+                waveform_extractor, metric_name, unit_id, **metric_param_dict
+            )
+            return metric_name, values, time() - start
+
+        _ = waveform_extractor.get_all_templates()  # shared by all metrics
+
+        with ThreadPoolExecutor(max_workers=max(n_jobs, 1)) as pool:
+            results = list(pool.map(compute_item, work_items))
+
+        metrics = {metric_name: {} for metric_name in metric_params}
+        durations = dict.fromkeys(metric_params, 0.0)
+        for metric_name, values, duration in results:
+            metrics[metric_name].update(values)
+            durations[metric_name] += duration
+
+        for metric_name, duration in durations.items():
+            self._info_msg(f"Computed {metric_name} in {duration:.2f} s")
+
+        return metrics
+
     @staticmethod
-    def _compute_metric(waveform_extractor, metric_name, **metric_params):
+    def _compute_metric(
+        waveform_extractor, metric_name, unit_id=None, **metric_params
+    ):
+        """Compute a metric for one unit, or all units if unit_id is None.
+
+        Returns a dict of metric values keyed by unit id.
+        """
         metric_func = _metric_name_to_func[metric_name]
 
         peak_sign_metrics = ["snr", "peak_offset", "peak_channel"]
@@ -490,9 +555,17 @@ class MetricCuration(SpyglassMixin, dj.Computed):
                 **metric_params,
             )
 
+        if metric_name not in _per_unit_metrics:
+            return metric_func(waveform_extractor)
+
+        unit_ids = (
+            waveform_extractor.sorting.get_unit_ids()
+            if unit_id is None
+            else [unit_id]
+        )
         return {
             unit_id: metric_func(waveform_extractor, this_unit_id=unit_id)
-            for unit_id in waveform_extractor.sorting.get_unit_ids()
+            for unit_id in unit_ids
         }
 
     @staticmethod
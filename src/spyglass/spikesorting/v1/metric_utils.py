@@ -28,6 +28,33 @@ def compute_isi_violation_fractions(
     return isi_violation_counts[this_unit_id] / (num_spikes[this_unit_id] - 1)
 
 
+def get_isi_violation_fractions(
+    waveform_extractor: si.WaveformExtractor,
+    isi_threshold_ms: float = 2.0,
+    min_isi_ms: float = 0.0,
+) -> dict:
+    """Computes the fraction of interspike interval violations of all units.
+
+    Equivalent to compute_isi_violation_fractions for each unit, from one
+    call to the underlying spikeinterface metrics.
+
+    Parameters
+    ----------
+    waveform_extractor: si.WaveformExtractor
+        The extractor object for the recording.
+    """
+    _, isi_violation_counts = sq.compute_isi_violations(
+        waveform_extractor,
+        isi_threshold_ms=isi_threshold_ms,
+        min_isi_ms=min_isi_ms,
+    )
+    num_spikes = sq.compute_num_spikes(waveform_extractor)
+    return {
+        unit_id: isi_violation_counts[unit_id] / (num_spikes[unit_id] - 1)
+        for unit_id in waveform_extractor.sorting.get_unit_ids()
+    }
+
+
 def get_peak_offset(
     waveform_extractor: si.WaveformExtractor, peak_sign: str, **metric_params
 ):
@@ -67,3 +94,12 @@ def get_peak_channel(
 def get_num_spikes(waveform_extractor: si.WaveformExtractor, this_unit_id: str):
     """Computes the number of spikes for each unit."""
     return sq.compute_num_spikes(waveform_extractor)[this_unit_id]
+
+
+def get_all_num_spikes(waveform_extractor: si.WaveformExtractor) -> dict:
+    """Computes the number of spikes of all units."""
+    num_spikes = sq.compute_num_spikes(waveform_extractor)
+    return {
+        unit_id: num_spikes[unit_id]
+        for unit_id in waveform_extractor.sorting.get_unit_ids()
+    }
@@ -40,7 +40,11 @@ from spyglass.spikesorting.v1.recording import (
 )
 from spyglass.utils import SpyglassMixin, logger
 from spyglass.utils.dj_helper_fn import bytes_to_human_readable
-from spyglass.utils.nwb_hash import NwbfileHasher, get_file_namespaces
+from spyglass.utils.nwb_hash import (
+    DEFAULT_HASH_VERSION,
+    NwbfileHasher,
+    get_file_namespaces,
+)
 from spyglass.utils.recompute_helper_fn import H5pyComparator, sort_dict
 
 schema = dj.schema("spikesorting_v1_recompute")
@@ -564,6 +568,7 @@ class RecordingRecompute(SpyglassMixin, dj.Computed):
 
             return H5pyComparator(*self.get_objs(key, name=name))
 
+    hash_version = DEFAULT_HASH_VERSION  # NwbfileHasher version for compare
     _key_cache = dict()
     _hasher_cache = dict()
     _files_cache = dict()
@@ -607,7 +612,7 @@ class RecordingRecompute(SpyglassMixin, dj.Computed):
 
     def _hash_one(self, path, precision) -> NwbfileHasher:
         """Return the hasher for a given path. Store in cache."""
-        cache_val = f"{path}_{precision}"
+        cache_val = f"{path}_{precision}_v{self.hash_version}"
         if cache_val in self._hasher_cache:
             return self._hasher_cache[cache_val]
         hasher = NwbfileHasher(
@@ -616,6 +621,7 @@ class RecordingRecompute(SpyglassMixin, dj.Computed):
             keep_obj_hash=True,
             keep_file_open=True,
             precision_lookup=precision,
+            hash_version=self.hash_version,
         )
         self._hasher_cache[cache_val] = hasher
         return hasher
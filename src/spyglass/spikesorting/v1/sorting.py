@@ -367,39 +367,21 @@ class SpikeSorting(SpyglassMixin, dj.Computed):
             artifact_removed_intervals, timestamps
         )
 
-        # Remove artifacts if needed (spikeinterface)
+        # Remove artifacts if needed: zero frames outside the valid intervals
         if (
             (len(artifact_removed_intervals_ind) > 1)
             or (artifact_removed_intervals_ind[0][0] > 0)
             or (artifact_removed_intervals_ind[-1][1] < len(timestamps))
         ):
-            # set the artifact intervals to zero
-            list_triggers = []
-            if artifact_removed_intervals_ind[0][0] > 0:
-                list_triggers.append(
-                    np.arange(0, artifact_removed_intervals_ind[0][0])
-                )
-            for interval_ind in range(len(artifact_removed_intervals_ind) - 1):
-                list_triggers.append(
-                    np.arange(
-                        (artifact_removed_intervals_ind[interval_ind][1] + 1),
-                        artifact_removed_intervals_ind[interval_ind + 1][0],
-                    )
-                )
-            if artifact_removed_intervals_ind[-1][1] < len(timestamps):
-                list_triggers.append(
-                    np.arange(
-                        artifact_removed_intervals_ind[-1][1],
-                        len(timestamps) - 1,
-                    )
-                )
-
-            list_triggers = [list(np.concatenate(list_triggers))]
-            recording = sip.remove_artifacts(
-                recording=recording,
-                list_triggers=list_triggers,
-                ms_before=None,
-                ms_after=None,
+            # Zeroed lazily by frame range. Uses a spikeinterface preprocessor
+            # so containerized sorters can reload the recording.
+            recording = sip.silence_periods(
+                recording,
+                list_periods=[
+                    _artifact_zero_ranges(
+                        artifact_removed_intervals_ind, len(timestamps)
+                    ).tolist()
+                ],
                 mode="zeros",
             )
 
@@ -607,3 +589,30 @@ def _write_sorting_to_nwb(
         units_object_id = nwbf.units.object_id
         io.write(nwbf)
     return analysis_nwb_file, units_object_id
+
+
+def _artifact_zero_ranges(valid_intervals_ind, n_samples):
+    """Frame ranges [start, stop) outside consolidated valid intervals.
+
+    Parameters
+    ----------
+    valid_intervals_ind : np.ndarray
+        Consolidated (start, stop) sample indices of valid intervals, inclusive,
+        as returned by _consolidate_intervals.
+    n_samples : int
+        Number of samples in the recording.
+
+    Returns
+    -------
+    np.ndarray
+        Sorted, disjoint (start, stop) ranges to zero, shape (n_ranges, 2).
+    """
+    valid_intervals_ind = np.asarray(valid_intervals_ind).reshape(-1, 2)
+    # Same samples as the per-sample trigger lists previously passed to
+    # sip.remove_artifacts, including the range after the last interval
+    starts = np.r_[
+        0, valid_intervals_ind[:-1, 1] + 1, valid_intervals_ind[-1, 1]
+    ]
+    stops = np.r_[valid_intervals_ind[:, 0], n_samples - 1]
+    zero_ranges = np.stack([starts, stops], axis=1).astype(np.int64)
+    return zero_ranges[zero_ranges[:, 1] > zero_ranges[:, 0]]
@@ -10,6 +10,7 @@ from functools import cached_property, lru_cache
 from hashlib import md5 as hash_md5
 from itertools import chain as iter_chain
 from pathlib import Path
+from threading import Lock
 from typing import Any, Dict, Iterable, List, Set, Tuple, Union
 
 import datajoint as dj
@@ -22,6 +23,7 @@ from datajoint.user_tables import TableMeta
 from datajoint.utils import get_master, to_camel_case
 from networkx import (
     DiGraph,
+    Graph,
     NetworkXNoPath,
     NodeNotFound,
     all_simple_paths,
@@ -65,6 +67,65 @@ def dj_topo_sort(graph: DiGraph) -> List[str]:
         return unite_master_parts(list(topological_sort(graph)))
 
 
+# Dependency graph snapshots per server and user: (version, graph, undirected)
+_GRAPH_SNAPSHOTS = dict()
+_GRAPH_SNAPSHOT_LOCK = Lock()
+
+
+def _schema_version(connection) -> tuple:
+    """Fingerprint of the tables in the connection's activated schemas.
+
+    Counts tables and sums a checksum of their names and creation times, so
+    declared, dropped or rebuilt tables change the version. Data changes do
+    not.
+    """
+    schemas = sorted(connection.schemas)
+    n_tables, checksum = connection.query(
+        "SELECT COUNT(*), SUM(CRC32(CONCAT_WS('.', table_schema, table_name,"
+        + " IFNULL(create_time, '')))) FROM information_schema.tables"
+        + " WHERE table_schema IN ('{}')".format("','".join(schemas))
+    ).fetchone()
+    return tuple(schemas), n_tables, checksum
+
+
+def get_graph_snapshot(connection) -> Tuple[DiGraph, Graph]:
+    """Return a shared snapshot of the connection's dependency graph.
+
+    The graph is loaded from the database once per schema version, see
+    _schema_version, instead of for every graph object. Callers must copy
+    the directed graph before setting node attributes.
+
+    Parameters
+    ----------
+    connection : datajoint.Connection
+        Connection whose dependencies to load.
+
+    Returns
+    -------
+    Tuple[DiGraph, Graph]
+        Dependency graph and its undirected version, shared across callers.
+    """
+    conn_info = connection.conn_info
+    snapshot_key = (conn_info["host"], conn_info.get("port"), conn_info["user"])
+    version = _schema_version(connection)
+    with _GRAPH_SNAPSHOT_LOCK:
+        snapshot = _GRAPH_SNAPSHOTS.get(snapshot_key)
+        if snapshot is not None and snapshot[0] == version:
+            return snapshot[1], snapshot[2]
+
+        # Deepcopy graph to avoid later `load()` resetting the snapshot
+        dependencies = connection.dependencies
+        dependencies.load()
+        orig_conn = dependencies._conn  # Cannot deepcopy connection
+        dependencies._conn = None
+        graph = deepcopy(dependencies)
+        dependencies._conn = orig_conn
+
+        undirect_graph = graph.to_undirected()
+        _GRAPH_SNAPSHOTS[snapshot_key] = (version, graph, undirect_graph)
+        return graph, undirect_graph
+
+
 class Direction(Enum):
     """Cascade direction enum. Calling Up returns True. Inverting flips."""
 
@@ -114,7 +175,13 @@ class AbstractGraph(ABC):
         child classes. Used in TableChain.
     """
 
-    def __init__(self, seed_table: Table, verbose: bool = False, **kwargs):
+    def __init__(
+        self,
+        seed_table: Table,
+        verbose: bool = False,
+        bridge_cache: dict = None,
+        **kwargs,
+    ):
         """Initialize graph and connection.
 
         Parameters
@@ -123,20 +190,18 @@ class AbstractGraph(ABC):
             Table to use to establish connection and graph
         verbose : bool, optional
             Whether to print verbose output. Default False
+        bridge_cache : dict, optional
+            Memo of bridged restrictions and existence checks, shared with
+            other graphs cascading at the same time. Default None, new memo.
         """
         self.seed_table = seed_table
         self.connection = seed_table.connection
 
-        # Deepcopy graph to avoid seed `load()` resetting custom attributes
-        seed_table.connection.dependencies.load()
-        graph = seed_table.connection.dependencies
-        orig_conn = graph._conn  # Cannot deepcopy connection
-        graph._conn = None
-        self.graph = deepcopy(graph)
-        graph._conn = orig_conn
-
-        # undirect not needed in all cases but need to do before adding ft nodes
-        self.undirect_graph = self.graph.to_undirected()
+        # Copy shared snapshot so node attributes stay local to this graph.
+        # Node and edge dicts are copied, values are shared and never mutated.
+        graph, self.undirect_graph = get_graph_snapshot(self.connection)
+        self.graph = graph.copy()
+        self.graph._loaded = True  # Copy has no connection to load from
 
         self.verbose = verbose
         self.leaves = set()
@@ -145,6 +210,9 @@ class AbstractGraph(ABC):
         self.no_visit = set()
         self.cascaded = False
 
+        self._shared_cache = bridge_cache is not None
+        self._bridge_cache = bridge_cache if self._shared_cache else dict()
+
     # --------------------------- Abstract Methods ---------------------------
 
     @abstractmethod
@@ -405,6 +473,29 @@ class AbstractGraph(ABC):
 
     # ---------------------------- Graph Traversal -----------------------------
 
+    @staticmethod
+    def _restr_hash(restr: Any) -> str:
+        """Hash a restriction, using the SQL of QueryExpressions."""
+        if isinstance(restr, QueryExpression):
+            restr = restr.make_sql()
+        return hash_md5(str(restr).encode()).hexdigest()
+
+    def _reset_memo(self) -> None:
+        """Clear memoized bridges and existence checks before a new cascade.
+
+        Memos are only valid within one cascade, so later inserts are seen by
+        long-lived graphs. A memo shared with a parent graph is left to it.
+        """
+        if not self._shared_cache:
+            self._bridge_cache.clear()
+
+    def _exists(self, table: str, restr: Any = True) -> bool:
+        """Memoized check for rows in table with restriction applied."""
+        key = ("exists", table, self._restr_hash(restr))
+        if (exists := self._bridge_cache.get(key)) is None:
+            exists = self._bridge_cache[key] = bool(self._get_ft(table) & restr)
+        return exists
+
     def _bridge_restr(
         self,
         table1: str,
@@ -450,14 +541,27 @@ class AbstractGraph(ABC):
             direction = "up" if dir_bool else "down"
             attr_map = edge.get("attr_map")
 
+        cache_key = (
+            "bridge",
+            table1,
+            table2,
+            self._restr_hash(restr),
+            str(direction),
+            tuple(sorted(attr_map.items())),
+        )
+        if not self.verbose and cache_key in self._bridge_cache:
+            return self._bridge_cache[cache_key]
+
         # May return empty table if outside imported and outside spyglass
         ft1 = self._get_ft(table1) & restr
         ft2 = self._get_ft(table2)
 
         path = f"{self._camel(table1)} -> {self._camel(table2)}"
 
-        if not (bool(ft1) and bool(ft2)):
+        # Existence of unrestricted table2 is shared by all restrictions
+        if not (self._exists(table1, restr) and self._exists(table2)):
             self._log_truncate(f"Bridge Link: {path}: result EMPTY INPUT")
+            self._bridge_cache[cache_key] = ["False"]
             return ["False"]
 
         if bool(set(attr_map.values()) - set(ft1.heading.names)):
@@ -475,6 +579,7 @@ class AbstractGraph(ABC):
             self._log_truncate(f"Bridge Link: {path}: result {result}")
             logger.debug(ret)
 
+        self._bridge_cache[cache_key] = ret
         return ret
 
     def _get_adjacent_path_item(
@@ -805,7 +910,7 @@ class RestrGraph(AbstractGraph):
         verbose : bool, optional
             Whether to print verbose output. Default False
         """
-        super().__init__(seed_table, verbose=verbose)
+        super().__init__(seed_table, verbose=verbose, **kwargs)
         self.include_files = include_files
 
         self.add_leaves(leaves)
@@ -949,10 +1054,20 @@ class RestrGraph(AbstractGraph):
     def cascade(self, show_progress=None, direction="up", warn=True) -> None:
         """Cascade all restrictions up the graph.
 
+        With multiple leaves, each leaf is cascaded in its own graph and the
+        results are combined with OR logic. Leaf graphs share one memo of
+        bridged restrictions and existence checks, so an edge reached from
+        several leaves with the same restriction is queried once. Each leaf
+        still walks the graph on its own.
+
         Parameters
         ----------
         show_progress : bool, optional
             Show tqdm progress bar. Default to verbose setting.
+        direction : str, optional
+            Direction to cascade. Default 'up'
+        warn : bool, optional
+            Log if already cascaded. Default True
         """
         if self.cascaded:
             if warn:
@@ -967,6 +1082,8 @@ class RestrGraph(AbstractGraph):
             self.cascaded = True
             return
 
+        self._reset_memo()
+
         if len(to_visit) == 1:
             table = to_visit.pop()
             restr = self._get_restr(table)
@@ -998,6 +1115,7 @@ class RestrGraph(AbstractGraph):
                     direction=direction,
                     verbose=self.verbose,
                     cascade=True,
+                    bridge_cache=self._bridge_cache,
                 )
                 cascaded_leaves.append(leaf_graph)
             logger.debug("adding cascaded leaves")
@@ -1486,6 +1604,7 @@ class TableChain(RestrGraph):
         """Cascade restriction through graph to search for applicable table."""
         if self.cascaded:
             return
+        self._reset_memo()
         restriction, restr_attrs = self._get_find_restr(self.leaf)
         self.cascade1_search(
             table=self.leaf,
@@ -1657,6 +1776,7 @@ class TableChain(RestrGraph):
             return
 
         _ = self.path
+        self._reset_memo()
 
         direction = Direction(direction) or self.direction
         if direction == Direction.UP:
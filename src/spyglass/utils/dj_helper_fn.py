@@ -361,6 +361,10 @@ def fetch_nwb(query_expression, nwb_master, *attrs, **kwargs):
     """
     from spyglass.common.common_usage import ActivityLog
     from spyglass.utils.dj_mixin import SpyglassMixin
+    from spyglass.utils.mixins.fetch import (
+        _external_file_info,
+        _verified_filepath,
+    )
 
     ActivityLog().deprecate_log(
         name="fetch_nwb (helper function)",
@@ -382,8 +386,13 @@ def fetch_nwb(query_expression, nwb_master, *attrs, **kwargs):
         query_expression, tbl, attr_name, *attrs, **kwargs
     )
 
-    for file_name in nwb_files:
-        file_path = file_path_fn(file_name, from_schema=True)
+    file_info = _external_file_info(tbl, attr_name, nwb_files)
+    for file_name in set(nwb_files):
+        file_path = (
+            file_info[file_name]["path"]
+            if file_name in file_info
+            else file_path_fn(file_name, from_schema=True)
+        )
         if not os.path.exists(file_path):
             # get from kachery/dandi or recompute, store in cache
             get_nwb_file(file_path, query_expression)
@@ -397,8 +406,16 @@ def fetch_nwb(query_expression, nwb_master, *attrs, **kwargs):
     )
 
     rec_dicts = query_table.fetch(*attrs, **kwargs)
-    # get filepath for each. Use datajoint for checksum if local
+    verified = {
+        file_name: _verified_filepath(file_info.get(file_name))
+        for file_name in set(r[file_name_attr] for r in rec_dicts)
+    }
+    # get filepath for each. Use datajoint for checksum if not verified
     for rec_dict in rec_dicts:
+        if (file_path := verified[rec_dict[file_name_attr]]) is not None:
+            rec_dict["nwb2load_filepath"] = file_path
+            continue
+
         file_path = file_path_fn(rec_dict[file_name_attr])
         if file_from_dandi(file_path):
             # skip the filepath checksum if streamed from Dandi
@@ -1,4 +1,5 @@
 import re
+from concurrent.futures import ThreadPoolExecutor
 from inspect import getmodule
 from itertools import chain as iter_chain
 from pprint import pprint
@@ -539,43 +540,129 @@ class Merge(ExportMixin, dj.Manual):
         restriction = restriction or self.restriction or True
         merge_restriction = self.extract_merge_id(restriction)
 
-        sources = set(
-            (self & merge_restriction).fetch(
-                self._reserved_sk, log_export=False
+        sources = sorted(
+            set(
+                (self & merge_restriction).fetch(
+                    self._reserved_sk, log_export=False
+                )
             )
         )
-        nwb_list = []
-        merge_ids = []
+
+        # Queries share one connection, so run them in series
+        parents = []
         for source in sources:
             source_restr = (
                 self
                 & dj.AndList([{self._reserved_sk: source}, merge_restriction])
             ).fetch("KEY", log_export=False)
-            nwb_list.extend(
-                (self & source_restr)
-                .merge_restrict_class(
-                    restriction,
-                    permit_multiple_rows=True,
-                    add_invalid_restrict=False,
-                )
-                .fetch_nwb()
+            parent = (self & source_restr).merge_restrict_class(
+                restriction,
+                permit_multiple_rows=True,
+                add_invalid_restrict=False,
             )
+            parents.append((source, source_restr, parent))
+
+        self._open_parent_files([parent for _, _, parent in parents])
+
+        nwb_list, merge_ids = [], []
+        for source, source_restr, parent in parents:
+            files = parent.fetch_nwb()  # parent may override, e.g. annotations
+            nwb_list.extend(files)
             if return_merge_ids:
                 merge_ids.extend(
-                    [
-                        (
-                            self
-                            & dj.AndList(
-                                [self._merge_restrict_parts(file), source_restr]
-                            )
-                        ).fetch1(self._reserved_pk)
-                        for file in nwb_list
-                    ]
+                    self._merge_ids_from_files(source, source_restr, files)
                 )
+
         if return_merge_ids:
             return nwb_list, merge_ids
         return nwb_list
 
+    @staticmethod
+    def _open_parent_files(parents: list) -> None:
+        """Open local NWB files of all parents concurrently, into the cache.
+
+        Each parent's fetch_nwb then reads objects from the open files. File
+        names are queried in series, as queries share one connection. Missing
+        files are left to fetch_nwb to download or recompute.
+
+        Parameters
+        ----------
+        parents: list
+            Restricted parent tables, one per source.
+        """
+        from spyglass.utils.mixins.fetch import _external_file_info
+        from spyglass.utils.nwb_helper_fn import get_nwb_file
+
+        paths = set()
+        for parent in parents:
+            try:
+                table, tbl_attr = parent._nwb_table_tuple
+                nwb_files, _ = parent._get_nwb_files_and_path_fn(
+                    table, tbl_attr
+                )
+            except (AttributeError, NotImplementedError, ValueError):
+                continue  # parent without an NWB file table
+            file_info = _external_file_info(table, tbl_attr, nwb_files)
+            paths.update(
+                str(info["path"])
+                for info in file_info.values()
+                if info["path"].exists()
+            )
+
+        if len(paths) < 2:
+            return
+
+        with ThreadPoolExecutor() as pool:
+            _ = list(pool.map(get_nwb_file, sorted(paths)))
+
+    def _merge_ids_from_files(
+        self, source: str, source_restr: list, files: list
+    ) -> list:
+        """Return the merge_id of each file dict fetched from a source parent.
+
+        Fetches the source part once and matches files by the part's parent
+        key, rather than restricting the parts once per file.
+
+        Parameters
+        ----------
+        source: str
+            CamelCase name of the source part.
+        source_restr: list
+            Merge keys of this source.
+        files: list
+            Dicts fetched from the parent, with its primary key.
+
+        Returns
+        -------
+        list
+            Merge ids in the order of files.
+        """
+        part = getattr(self, source)() & source_restr
+        key_attrs = [a for a in part.heading.names if a != self._reserved_pk]
+        log_exp = (
+            dict(log_export=False) if isinstance(part, ExportMixin) else {}
+        )
+        rows = part.fetch(
+            self._reserved_pk, *key_attrs, as_dict=True, **log_exp
+        )
+        merge_id_lookup = {
+            tuple(row[a] for a in key_attrs): row[self._reserved_pk]
+            for row in rows
+        }
+
+        merge_ids = []
+        for file in files:
+            file_key = tuple(file.get(a) for a in key_attrs)
+            if (merge_id := merge_id_lookup.get(file_key)) is None:
+                merge_id = (  # e.g., parent key renamed in part
+                    self
+                    & dj.AndList(
+                        [self._merge_restrict_parts(file), source_restr]
+                    )
+                ).fetch1(self._reserved_pk)
+            merge_ids.append(merge_id)
+        return merge_ids
+
     @classmethod
     def merge_get_part(
         cls,
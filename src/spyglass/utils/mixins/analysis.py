@@ -1,10 +1,13 @@
+import hashlib
 import os
 import random
+import shutil
 import string
 import subprocess
+import time
 from functools import cached_property
 from pathlib import Path
-from typing import Dict, Optional, Union
+from typing import Dict, List, Optional, Union
 from uuid import uuid4
 
 import datajoint as dj
@@ -19,7 +22,11 @@ from pynwb.core import ScratchData
 
 from spyglass.utils.dj_helper_fn import get_child_tables
 from spyglass.utils.mixins.base import BaseMixin
-from spyglass.utils.nwb_hash import NwbfileHasher
+from spyglass.utils.nwb_hash import (
+    DEFAULT_HASH_VERSION,
+    NwbfileHasher,
+    get_hash_version,
+)
 from spyglass.utils.nwb_helper_fn import get_electrode_indices, get_nwb_file
 
 # Only differs from the common AnalysisNwbfile in adding 'Custom' to heading
@@ -54,6 +61,10 @@ NWB_KEEP_FIELDS = (
     "timestamps_reference_time",
 )
 
+# Subdirectory of temp_dir holding stripped copies of raw files, see create
+ANALYSIS_TEMPLATE_DIR = "analysis_templates"
+ANALYSIS_TEMPLATE_GRACE_S = 3600  # unused seconds before template removal
+
 HASH_ERROR_MSG = (
     "WHAT: The recomputed file contents don't match the expected hash.\n"
     "Expected hash: {hash}\n"
@@ -100,6 +111,7 @@ class AnalysisMixin(BaseMixin):
 
     _creation_times = {}
     _cached_analysis_dir = None
+    _use_analysis_template = True  # False to strip the raw file on each create
     _analysis_prefix: Optional[str] = None
 
     def get_prefix(self) -> str:
@@ -227,6 +239,57 @@ class AnalysisMixin(BaseMixin):
             The name of the new NWB file.
         """
         nwb_file_abspath = self._nwb_table.get_abs_path(nwb_file_name)
+
+        analysis_file_name = recompute_file_name or self.__get_new_file_name(
+            nwb_file_name
+        )
+
+        if not recompute_file_name:
+            self._info_msg(f"Writing new NWB file {analysis_file_name}")
+
+        analysis_file_abs_path = self.get_abs_path(
+            analysis_file_name, from_schema=bool(recompute_file_name)
+        )
+
+        if alternate_dir:  # override the default analysis_dir for recompute
+            relative = Path(analysis_file_abs_path).relative_to(
+                self._analysis_dir
+            )
+            analysis_file_abs_path = Path(alternate_dir) / relative
+
+        parent_path = Path(analysis_file_abs_path).parent
+        if not parent_path.exists():
+            parent_path.mkdir(parents=True)
+
+        if self._use_analysis_template:
+            self._copy_analysis_template(
+                nwb_file_abspath, analysis_file_abs_path
+            )
+        else:
+            self._write_stripped_copy(nwb_file_abspath, analysis_file_abs_path)
+
+        # create a new object id for the file
+        with h5py.File(analysis_file_abs_path, "a") as f:
+            f.attrs["object_id"] = str(uuid4())
+
+        # permissions: 0o644 (only owner write), 0o666 (open)
+        permissions = 0o644 if restrict_permission else 0o666
+        os.chmod(analysis_file_abs_path, permissions)
+
+        return analysis_file_name
+
+    def _write_stripped_copy(
+        self, nwb_file_abspath: str, out_path: Union[str, Path]
+    ) -> None:
+        """Export the raw NWB file without acquisition, processing or units.
+
+        Parameters
+        ----------
+        nwb_file_abspath : str
+            Absolute path of the raw NWB file.
+        out_path : Union[str, Path]
+            Path of the new file.
+        """
         alter_source_script = False
         with pynwb.NWBHDF5IO(
             path=nwb_file_abspath, mode="r", load_namespaces=True
@@ -258,45 +321,136 @@ class AnalysisMixin(BaseMixin):
             else:
                 alter_source_script = True
 
-            analysis_file_name = (
-                recompute_file_name or self.__get_new_file_name(nwb_file_name)
-            )
-
-            # write the new file
-            if not recompute_file_name:
-                self._info_msg(f"Writing new NWB file {analysis_file_name}")
-
-            analysis_file_abs_path = self.get_abs_path(
-                analysis_file_name, from_schema=bool(recompute_file_name)
-            )
-
-            if alternate_dir:  # override the default analysis_dir for recompute
-                relative = Path(analysis_file_abs_path).relative_to(
-                    self._analysis_dir
-                )
-                analysis_file_abs_path = Path(alternate_dir) / relative
-
             # export the new NWB file
-            parent_path = Path(analysis_file_abs_path).parent
-            if not parent_path.exists():
-                parent_path.mkdir(parents=True)
             with pynwb.NWBHDF5IO(
-                path=analysis_file_abs_path, mode="w", manager=io.manager
+                path=out_path, mode="w", manager=io.manager
             ) as export_io:
                 export_io.export(io, nwbf)
 
         if alter_source_script:
-            self._alter_spyglass_version(analysis_file_abs_path)
+            self._alter_spyglass_version(out_path)
 
-        # create a new object id for the file
-        with h5py.File(analysis_file_abs_path, "a") as f:
-            f.attrs["object_id"] = str(uuid4())
+    def _copy_analysis_template(
+        self, nwb_file_abspath: str, out_path: Union[str, Path]
+    ) -> None:
+        """Copy the stripped template of a raw file to out_path.
 
-        # permissions: 0o644 (only owner write), 0o666 (open)
-        permissions = 0o644 if restrict_permission else 0o666
-        os.chmod(analysis_file_abs_path, permissions)
+        Writes the stripped copy directly if the shared template directory
+        cannot be used, e.g., when another user owns it.
 
-        return analysis_file_name
+        Parameters
+        ----------
+        nwb_file_abspath : str
+            Absolute path of the raw NWB file.
+        out_path : Union[str, Path]
+            Path of the new file.
+        """
+        try:
+            try:
+                template_path = self._get_analysis_template(nwb_file_abspath)
+                shutil.copyfile(template_path, out_path)
+            except FileNotFoundError:  # removed by another process, rebuild
+                template_path = self._get_analysis_template(nwb_file_abspath)
+                shutil.copyfile(template_path, out_path)
+        except OSError as e:
+            self._logger.warning(
+                f"Analysis template unavailable, writing stripped copy: {e}"
+            )
+            self._write_stripped_copy(nwb_file_abspath, out_path)
+
+    @cached_property
+    def _analysis_template_dir(self) -> Path:
+        """Directory of stripped raw-file templates."""
+        from spyglass.settings import temp_dir
+
+        return Path(temp_dir) / ANALYSIS_TEMPLATE_DIR
+
+    def _analysis_template_path(self, nwb_file_abspath: str) -> Path:
+        """Return the template path for a raw file and this spyglass version.
+
+        The name carries a digest of the raw file's path, size and modification
+        time, and the spyglass version, so an edited raw file or an upgrade
+        maps to a new template.
+        """
+        raw_path = Path(nwb_file_abspath).resolve()
+        stat = raw_path.stat()
+        fingerprint = (
+            f"{raw_path}:{stat.st_size}:{stat.st_mtime_ns}:"
+            + f"{self._spyglass_version}"
+        )
+        digest = hashlib.md5(fingerprint.encode()).hexdigest()[:16]
+        return self._analysis_template_dir / f"{raw_path.stem}_{digest}.nwb"
+
+    def _get_analysis_template(self, nwb_file_abspath: str) -> Path:
+        """Return the stripped template of a raw file, writing it if needed.
+
+        Templates are touched on use where permitted, so their modification
+        time is the last use. When a new template is written, replaced templates of the same
+        raw file are removed once unused for ANALYSIS_TEMPLATE_GRACE_S, so
+        other processes are not copying them. The template is written to a
+        temporary name and moved into place, so concurrent creates never copy
+        a partial file.
+
+        Parameters
+        ----------
+        nwb_file_abspath : str
+            Absolute path of the raw NWB file.
+
+        Returns
+        -------
+        Path
+            Path of the template file.
+        """
+        template_path = self._analysis_template_path(nwb_file_abspath)
+        try:
+            os.utime(template_path)  # mark as in use
+            return template_path
+        except FileNotFoundError:
+            pass
+        except PermissionError:  # owned by another user, use as is
+            return template_path
+
+        template_dir = template_path.parent
+        template_dir.mkdir(parents=True, exist_ok=True)
+        stem = Path(nwb_file_abspath).stem
+        self._remove_old_templates(
+            template_dir.glob(f"{stem}_{'?' * 16}.nwb"),
+            ANALYSIS_TEMPLATE_GRACE_S,
+        )
+
+        temp_path = template_dir / f".{template_path.stem}_{uuid4().hex}.nwb"
+        try:
+            self._write_stripped_copy(nwb_file_abspath, temp_path)
+            os.replace(temp_path, template_path)
+        finally:
+            temp_path.unlink(missing_ok=True)
+
+        return template_path
+
+    def _remove_old_templates(
+        self, paths: List[Path], max_age_s: float, dry_run: bool = False
+    ) -> List[Path]:
+        """Remove template files not modified for max_age_s seconds.
+
+        Templates this user cannot remove are skipped.
+        """
+        cutoff = time.time() - max_age_s
+        removed = []
+        for path in paths:
+            try:
+                if path.stat().st_mtime > cutoff:
+                    continue
+            except FileNotFoundError:  # removed by another process
+                continue
+            if not dry_run:
+                try:
+                    path.unlink(missing_ok=True)
+                except PermissionError:  # owned by another user
+                    self._logger.debug(f"Cannot remove {path.name}, skipped")
+                    continue
+                self._logger.debug(f"Removed analysis template {path.name}")
+            removed.append(path)
+        return removed
 
     def _alter_spyglass_version(self, nwb_file_path: str) -> None:
         """Change the source script to the current version of spyglass"""
@@ -712,6 +866,7 @@ class AnalysisMixin(BaseMixin):
         from_schema: Optional[bool] = False,
         precision_lookup: Optional[Dict[str, int]] = None,
         return_hasher: Optional[bool] = False,
+        hash_version: Optional[int] = DEFAULT_HASH_VERSION,
     ) -> Union[str, NwbfileHasher]:
         """Return the hash of the file contents.
 
@@ -729,6 +884,8 @@ class AnalysisMixin(BaseMixin):
         return_hasher: bool, Optional
             If true, return the hasher object instead of the hash. Defaults to
             False.
+        hash_version : int, Optional
+            NwbfileHasher hash version. Defaults to 1. See HASH_VERSIONS.
 
         Returns
         -------
@@ -738,6 +895,7 @@ class AnalysisMixin(BaseMixin):
         hasher = NwbfileHasher(
             self.get_abs_path(analysis_file_name, from_schema=from_schema),
             precision_lookup=precision_lookup,
+            hash_version=hash_version,
         )
         return hasher if return_hasher else hasher.hash
 
@@ -753,7 +911,7 @@ class AnalysisMixin(BaseMixin):
         hash : str
             The hash of the file contents as calculated by NwbfileHasher.
             If the hash does not match the file contents, the file and
-            downstream entries are deleted.
+            downstream entries are deleted. Recomputed with the hash's version.
 
         Raises
         ------
@@ -762,7 +920,11 @@ class AnalysisMixin(BaseMixin):
             and a ValueError is raised.
         """
         file_path = self.get_abs_path(analysis_file_name, from_schema=True)
-        new_hash = self.get_hash(analysis_file_name, from_schema=True)
+        new_hash = self.get_hash(
+            analysis_file_name,
+            from_schema=True,
+            hash_version=get_hash_version(hash),
+        )
 
         if hash != new_hash:
             Path(file_path).unlink()  # remove mismatched file
@@ -1049,6 +1211,37 @@ class AnalysisMixin(BaseMixin):
             self._ext_tbl.delete(delete_external_files=delete_external_files)
         return unused
 
+    def cleanup_analysis_templates(
+        self, max_age_days: float = 7, dry_run: bool = False
+    ) -> List[Path]:
+        """Remove analysis templates unused for max_age_days.
+
+        Templates are rewritten from the raw file on the next create, so this
+        only frees temp_dir space. Includes partial templates left by
+        interrupted writes.
+
+        Parameters
+        ----------
+        max_age_days : float, optional
+            Remove templates not used for this many days. Default 7. Values
+            below ANALYSIS_TEMPLATE_GRACE_S are raised to it.
+        dry_run : bool, optional
+            If true, only return the templates without removing them.
+
+        Returns
+        -------
+        List[Path]
+            Templates removed, or to be removed if dry_run.
+        """
+        template_dir = self._analysis_template_dir
+        if not template_dir.exists():
+            return []
+        max_age_s = max(max_age_days * 86400, ANALYSIS_TEMPLATE_GRACE_S)
+        paths = list(template_dir.glob("*.nwb")) + list(
+            template_dir.glob(".*.nwb")
+        )
+        return self._remove_old_templates(paths, max_age_s, dry_run=dry_run)
+
     def get_orphans(self):
         """Clean up orphaned entries and external files."""
         return self - get_child_tables(self)
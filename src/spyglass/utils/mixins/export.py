@@ -3,8 +3,9 @@ from atexit import unregister as exit_unregister
 from collections import defaultdict
 from contextvars import ContextVar
 from functools import cached_property
-from inspect import stack as inspect_stack
+from logging import DEBUG
 from os import environ
+from sys import _getframe
 from typing import List
 
 from datajoint.condition import AndList, Top, make_condition
@@ -18,6 +19,53 @@ from spyglass.utils.sql_helper_fn import bash_escape_sql
 EXPORT_ENV_VAR = "SPYGLASS_EXPORT_ID"
 FETCH_LOG_FLAG = ContextVar("FETCH_LOG_FLAG", default=True)
 
+# Callers never reported by _called_funcs
+IGNORED_CALLERS = frozenset(
+    {
+        "__and__",  # caught by restrict
+        "__mul__",  # caught by join
+        "_called_funcs",  # run here
+        "_log_fetch",  # run here
+        "_log_fetch_nwb",  # run here
+        "<module>",
+        "_exec_file",
+        "_pseudo_sync_runner",
+        "_run_cell",
+        "_run_cmd_line_code",
+        "_run_with_log",
+        "execfile",
+        "init_code",
+        "initialize",
+        "inner",
+        "interact",
+        "launch_instance",
+        "mainloop",
+        "run",
+        "run_ast_nodes",
+        "run_cell",
+        "run_cell_async",
+        "run_code",
+        "run_line_magic",
+        "safe_execfile",
+        "start",
+        "start_ipython",
+    }
+)
+# If called by any of these, fetch is not logged
+BANNED_CALLERS = frozenset(
+    {
+        "head",  # Prevents on Table().head() call
+        "tail",  # Prevents on Table().tail() call
+        "preview",  # Prevents on Table() call
+        "_repr_html_",  # Prevents on Table() call in notebook
+        "cautious_delete",  # Prevents add on permission check during delete
+        # "get_abs_path",  # Assumes that fetch_nwb will catch file/table
+        "_check_delete_permission",  # Prevents on Table().delete()
+        "delete",  # Prevents on Table().delete()
+        "_load_admin",  # Prevents on permission check
+    }
+)
+
 
 class ExportMixin(FetchMixin):
     """Mixin for DataJoint tables to support export logging.
@@ -26,6 +74,8 @@ class ExportMixin(FetchMixin):
     """
 
     _export_cache = defaultdict(set)
+    _export_log_queue = []  # ExportSelection.Table rows pending insert
+    _export_log_batch_size = 500
 
     # ------------------------------ Version Info -----------------------------
 
@@ -101,6 +151,7 @@ class ExportMixin(FetchMixin):
 
     def _export_id_cleanup(self):
         """Cleanup export ID."""
+        self._flush_export_log()
         self._export_cache = dict()
         if environ.get(EXPORT_ENV_VAR):
             del environ[EXPORT_ENV_VAR]
@@ -193,39 +244,16 @@ class ExportMixin(FetchMixin):
     # ------------------------------- Log Fetch -------------------------------
 
     def _called_funcs(self):
-        """Get stack trace functions."""
-        ignore = {
-            "__and__",  # caught by restrict
-            "__mul__",  # caught by join
-            "_called_funcs",  # run here
-            "_log_fetch",  # run here
-            "_log_fetch_nwb",  # run here
-            "<module>",
-            "_exec_file",
-            "_pseudo_sync_runner",
-            "_run_cell",
-            "_run_cmd_line_code",
-            "_run_with_log",
-            "execfile",
-            "init_code",
-            "initialize",
-            "inner",
-            "interact",
-            "launch_instance",
-            "mainloop",
-            "run",
-            "run_ast_nodes",
-            "run_cell",
-            "run_cell_async",
-            "run_code",
-            "run_line_magic",
-            "safe_execfile",
-            "start",
-            "start_ipython",
-        }
+        """Get names of functions on the call stack.
 
-        ret = {i.function for i in inspect_stack()} - ignore
-        return ret
+        Walks frame objects directly, without the source lookup done by
+        inspect.stack, so it is cheap enough to run on every fetch.
+        """
+        funcs, frame = set(), _getframe(1)
+        while frame is not None:
+            funcs.add(frame.f_code.co_name)
+            frame = frame.f_back
+        return funcs - IGNORED_CALLERS
 
     def _log_fetch(self, restriction=None, *args, **kwargs):
         """Logs the fetch for export."""
@@ -241,18 +269,7 @@ class ExportMixin(FetchMixin):
                 "deterministic.\nUse a specific restriction, like a dict."
             )
 
-        banned = [
-            "head",  # Prevents on Table().head() call
-            "tail",  # Prevents on Table().tail() call
-            "preview",  # Prevents on Table() call
-            "_repr_html_",  # Prevents on Table() call in notebook
-            "cautious_delete",  # Prevents add on permission check during delete
-            # "get_abs_path",  # Assumes that fetch_nwb will catch file/table
-            "_check_delete_permission",  # Prevents on Table().delete()
-            "delete",  # Prevents on Table().delete()
-            "_load_admin",  # Prevents on permission check
-        ]  # if called by any in banned, return
-        if set(banned) & self._called_funcs():
+        if BANNED_CALLERS & self._called_funcs():
             return
 
         restr = restriction or self.restriction or True
@@ -344,7 +361,9 @@ class ExportMixin(FetchMixin):
             chunk_entries = entries[i * chunk_size : (i + 1) * chunk_size]
             if not chunk_entries:
                 break
-            self._insert_log(chunk_entries)
+            self._insert_log(
+                make_condition(self.undo_projection(), chunk_entries, set())
+            )
 
     def _insert_log(self, restr_str):
         """Executes insert log entry for export table and restriction."""
@@ -363,13 +382,16 @@ class ExportMixin(FetchMixin):
             return
         self._export_cache[self.full_table_name].add(restr_str)
 
-        self._export_table.Table.insert1(
+        self._export_log_queue.append(
             dict(
                 export_id=self.export_id,
                 table_name=self.full_table_name,
                 restriction=restr_str,
             )
         )
+        if len(self._export_log_queue) >= self._export_log_batch_size:
+            self._flush_export_log()
+
         restr_logline = restr_str.replace("AND", "\n\tAND").replace(
             "OR", "\n\tOR"
         )
@@ -377,6 +399,18 @@ class ExportMixin(FetchMixin):
             f"\nTable: {self.full_table_name}\nRestr: {restr_logline}"
         )
 
+    def _flush_export_log(self):
+        """Insert queued export log entries as one batch.
+
+        Runs when the queue is full and when an export stops or the process
+        exits, so ExportSelection.Table is complete once the export ends.
+        """
+        if not self._export_log_queue:
+            return
+        entries = list(self._export_log_queue)
+        self._export_log_queue.clear()
+        self._export_table.Table.insert(entries)
+
     @property
     def _custom_analysis_parent(self):
         """Check for custom AnalysisNwbfile parent table.
@@ -523,7 +557,8 @@ class ExportMixin(FetchMixin):
             else:
                 restr = kwargs.get("restriction")
                 self._log_fetch(restriction=restr)
-            self._logger.debug(f"Export: {self._called_funcs()}")
+            if self._logger.isEnabledFor(DEBUG):
+                self._logger.debug(f"Export: {self._called_funcs()}")
 
         return ret
 
@@ -1,11 +1,16 @@
 """Mixin class for fetching NWB files and pynapple objects."""
 
+import logging
 import os
 from functools import cached_property
-from typing import Tuple
+from pathlib import Path
+from typing import Dict, Iterable, Optional, Tuple
 
+import datajoint as dj
 import numpy as np
 from datajoint import Table
+from datajoint.errors import DataJointError
+from datajoint.hash import uuid_from_file
 
 from spyglass.utils.dj_helper_fn import instance_table
 from spyglass.utils.mixins.base import BaseMixin
@@ -17,6 +22,125 @@ except (ImportError, ModuleNotFoundError):
     pynapple = None
 
 
+def _external_file_info(tbl, attr_name: str, file_names: Iterable) -> dict:
+    """Fetch externals-table rows for many files in a single query.
+
+    Parameters
+    ----------
+    tbl : table or class
+        (Analysis)Nwbfile table holding the filepath attribute.
+    attr_name : str
+        Name of the filepath attribute, e.g. 'analysis_file_abs_path'.
+    file_names : Iterable
+        File names (primary key values of tbl) to look up.
+
+    Returns
+    -------
+    dict
+        File name -> dict of local 'path', 'size', 'contents_hash' and
+        'registered', the epoch time the file was registered. Files without an externals entry are omitted, as are all
+        files if the externals table cannot be resolved.
+    """
+    tbl_inst = instance_table(tbl)
+    file_name_attr = (
+        "analysis_file_name" if "analysis" in attr_name else "nwb_file_name"
+    )
+    file_names = list(set(file_names))
+    if not file_names:
+        return dict()
+
+    try:
+        ext_tbl = tbl_inst.external[
+            tbl_inst.heading.attributes[attr_name].store
+        ]
+        stage = Path(ext_tbl.spec["stage"]).absolute()
+        rows = (
+            (
+                tbl_inst.proj(hash=attr_name)
+                & [{file_name_attr: f} for f in file_names]
+            )
+            .join(
+                # epoch seconds, independent of the session time zone
+                ext_tbl.proj(
+                    "filepath",
+                    "size",
+                    "contents_hash",
+                    registered="UNIX_TIMESTAMP(timestamp)",
+                ),
+                semantic_check=False,
+            )
+            .fetch(
+                file_name_attr,
+                "filepath",
+                "size",
+                "contents_hash",
+                "registered",
+                as_dict=True,
+            )
+        )
+    except (DataJointError, KeyError) as e:  # fall back to per-row fetch1
+        from spyglass.utils import logger
+
+        logger.debug(f"Could not batch resolve filepaths: {e}")
+        return dict()
+
+    return {
+        row.pop(file_name_attr): dict(row, path=stage / row.pop("filepath"))
+        for row in rows
+    }
+
+
+def _verified_filepath(
+    info: Optional[dict], skip_unchanged: bool = False
+) -> Optional[str]:
+    """Return the local path if the file passes DataJoint's filepath checks.
+
+    Mirrors ``ExternalTable.download_filepath``: the file must exist with the
+    registered size, and is checksummed if below the configured
+    ``filepath_checksum_size_limit``.
+
+    Parameters
+    ----------
+    info : dict or None
+        Entry from _external_file_info.
+    skip_unchanged : bool, optional
+        If True, skip the checksum for files whose size matches and whose
+        modification time is no later than the externals-table timestamp.
+        Default False.
+
+    Returns
+    -------
+    str or None
+        Local path, or None if the file is missing or fails a check. Callers
+        should then defer to DataJoint, which downloads or raises as needed.
+    """
+    if not info:
+        return None
+    try:
+        stat = info["path"].stat()
+    except OSError:
+        return None
+    if stat.st_size != info["size"]:
+        return None
+
+    limit = dj.config.get("filepath_checksum_size_limit")
+    needs_checksum = limit is None or stat.st_size < limit
+    registered = info.get("registered")
+    if skip_unchanged and registered is not None:
+        needs_checksum &= stat.st_mtime > float(registered)
+    if needs_checksum and uuid_from_file(info["path"]) != info["contents_hash"]:
+        return None
+
+    return str(info["path"])
+
+
+def _session_query_count(connection) -> int:
+    """Number of statements run so far by this MySQL session."""
+    return int(
+        connection.query("SHOW SESSION STATUS LIKE 'Questions'").fetchone()[1]
+    )
+
+
 class FetchMixin(BaseMixin):
 
     @cached_property
@@ -154,7 +278,9 @@ class FetchMixin(BaseMixin):
 
         return nwb_files, file_path_fn
 
-    def _download_missing_files(self, nwb_files, file_path_fn):
+    def _download_missing_files(
+        self, nwb_files, file_path_fn, file_info: Optional[dict] = None
+    ):
         """Download missing NWB files from kachery/dandi or recompute.
 
         Parameters
@@ -163,14 +289,30 @@ class FetchMixin(BaseMixin):
             List of NWB file names.
         file_path_fn : function
             Function to get the absolute path to the NWB file.
+        file_info : dict, optional
+            Pre-fetched externals-table rows from _external_file_info. Files
+            found there skip the per-file path lookup.
         """
-        for file_name in nwb_files:
-            file_path = file_path_fn(file_name, from_schema=True)
+        file_info = file_info or dict()
+        for file_name in set(nwb_files):
+            if file_name in file_info:
+                file_path = file_info[file_name]["path"]
+            else:
+                file_path = file_path_fn(file_name, from_schema=True)
             if not os.path.exists(file_path):
                 # get from kachery/dandi or recompute, store in cache
                 get_nwb_file(file_path, self)
 
-    def _execute_nwb_query(self, tbl, attr_name, *attrs, **kwargs):
+    def _execute_nwb_query(
+        self,
+        tbl,
+        attr_name,
+        *attrs,
+        file_path_fn=None,
+        file_info: Optional[Dict[str, dict]] = None,
+        skip_unchanged_checksum: bool = False,
+        **kwargs,
+    ):
         """Execute join query and fetch records with NWB filepaths.
 
         Parameters
@@ -181,6 +323,15 @@ class FetchMixin(BaseMixin):
             Attribute name to fetch from the table.
         *attrs : list
             Attributes from normal DataJoint fetch call.
+        file_path_fn : function, optional
+            Function to get the absolute path to the NWB file. Looked up if
+            not provided.
+        file_info : dict, optional
+            Pre-fetched externals-table rows from _external_file_info. Fetched
+            if not provided.
+        skip_unchanged_checksum : bool, optional
+            Skip checksums of files whose size and mtime match the externals
+            table. Default False.
         **kwargs : dict
             Keyword arguments from normal DataJoint fetch call.
 
@@ -195,10 +346,10 @@ class FetchMixin(BaseMixin):
             "analysis_file_name" if "analysis" in attr_name else "nwb_file_name"
         )
 
-        # Get file names and path function
-        nwb_files, file_path_fn = self._get_nwb_files_and_path_fn(
-            tbl, attr_name, *attrs, **kwargs
-        )
+        if file_path_fn is None:
+            _, file_path_fn = self._get_nwb_files_and_path_fn(
+                tbl, attr_name, *attrs, **kwargs
+            )
 
         # logging arg only if instanced table inherits Mixin
         inst = instance_table(self)
@@ -216,8 +367,25 @@ class FetchMixin(BaseMixin):
         attrs = attrs or self.heading.names  # if not specified, fetch all
         rec_dicts = query_table.fetch(*attrs, **kwargs)
 
-        # get filepath for each. Use datajoint for checksum if local
+        file_names = [rec_dict[file_name_attr] for rec_dict in rec_dicts]
+        if file_info is None:
+            file_info = _external_file_info(tbl, attr_name, file_names)
+
+        # Verify each file once against the batch-fetched externals rows
+        verified = {
+            file_name: _verified_filepath(
+                file_info.get(file_name), skip_unchanged_checksum
+            )
+            for file_name in set(file_names)
+        }
+
+        # get filepath for each. Use datajoint for checksum if not verified
         for rec_dict in rec_dicts:
+            file_path = verified[rec_dict[file_name_attr]]
+            if file_path is not None:
+                rec_dict["nwb2load_filepath"] = file_path
+                continue
+
             file_path = file_path_fn(rec_dict[file_name_attr])
             if file_from_dandi(file_path):
                 # skip the filepath checksum if streamed from Dandi
@@ -293,6 +461,10 @@ class FetchMixin(BaseMixin):
         ----------
         *attrs : list
             Attributes from normal DataJoint fetch call.
+        skip_unchanged_checksum : bool, optional
+            If True, skip the checksum of files whose size matches the
+            externals table and whose modification time is no later than
+            their registration. Default False.
         **kwargs : dict
             Keyword arguments from normal DataJoint fetch call.
 
@@ -303,6 +475,11 @@ class FetchMixin(BaseMixin):
         """
         table, tbl_attr = self._nwb_table_tuple
 
+        skip_unchanged = kwargs.pop("skip_unchanged_checksum", False)
+        count_queries = self._logger.isEnabledFor(logging.DEBUG)
+        if count_queries:
+            n_queries = _session_query_count(self.connection)
+
         # Handle export logging
         log_export = kwargs.pop("log_export", True)
         is_export = log_export and self.export_id
@@ -327,10 +504,25 @@ class FetchMixin(BaseMixin):
         )
 
         # Download any missing files
-        self._download_missing_files(nwb_files, file_path_fn)
+        file_info = _external_file_info(table, tbl_attr, nwb_files)
+        self._download_missing_files(nwb_files, file_path_fn, file_info)
 
         # Execute query and get records
-        rec_dicts = self._execute_nwb_query(table, tbl_attr, *attrs, **kwargs)
+        rec_dicts = self._execute_nwb_query(
+            table,
+            tbl_attr,
+            *attrs,
+            file_path_fn=file_path_fn,
+            file_info=file_info,
+            skip_unchanged_checksum=skip_unchanged,
+            **kwargs,
+        )
+
+        if count_queries:  # minus one for the count query itself
+            n_queries = _session_query_count(self.connection) - n_queries - 1
+            self._logger.debug(
+                f"fetch_nwb: {len(rec_dicts)} rows, {n_queries} queries"
+            )
 
         # Process object_id fields if present
         return self._process_object_ids(rec_dicts, *attrs)
@@ -1,9 +1,10 @@
 import atexit
 import json
-from functools import cached_property
-from hashlib import md5
+from concurrent.futures import ThreadPoolExecutor
+from functools import cached_property, partial
+from hashlib import blake2b, md5
 from pathlib import Path
-from typing import Any, Dict, Union
+from typing import Any, Callable, Dict, Optional, Union
 
 import h5py
 import numpy as np
@@ -17,6 +18,64 @@ DEFAULT_BATCH_SIZE = 4095
 IGNORED_KEYS = ["version", "source_script"]
 PRECISION_LOOKUP = dict(ProcessedElectricalSeries=4)
 
+# Hash versions. Stored hashes are only comparable within a version.
+#   1: md5 of attributes and names; data serialized with astype(str)
+#   2: blake2b of attributes, names, and dataset contents as little-endian
+#      bytes, hashing datasets in parallel. Digests are tagged 'v2:' and
+#      truncated to fit existing varchar(32) hash columns
+HASH_VERSIONS = (1, 2)
+DEFAULT_HASH_VERSION = 1
+READ_BYTES = 2**26  # v2 dataset read size, 64 MB
+
+
+def get_digest_func(hash_version: int = DEFAULT_HASH_VERSION) -> Callable:
+    """Return the digest constructor for a hash version.
+
+    Both produce 32-character hex digests.
+    """
+    if hash_version not in HASH_VERSIONS:
+        raise ValueError(
+            f"Unknown hash_version {hash_version}, expected {HASH_VERSIONS}"
+        )
+    return md5 if hash_version == 1 else partial(blake2b, digest_size=16)
+
+
+def format_hash(digest: str, hash_version: int = DEFAULT_HASH_VERSION) -> str:
+    """Tag a hex digest with its hash version.
+
+    Version 1 digests are returned as-is, for compatibility with stored
+    hashes. Later versions are prefixed, e.g. 'v2:', and truncated to 32
+    characters.
+    """
+    if hash_version == 1:
+        return digest
+    prefix = f"v{hash_version}:"
+    return prefix + digest[: 32 - len(prefix)]
+
+
+def get_hash_version(hash: Optional[str]) -> int:
+    """Return the hash version of a stored hash. Untagged hashes are v1."""
+    if not hash or not hash.startswith("v") or ":" not in hash:
+        return 1
+    version = hash[1 : hash.index(":")]
+    return int(version) if version.isdigit() else 1
+
+
+def canonical_bytes(data: np.ndarray) -> bytes:
+    """Bytes of an array, independent of platform byte order.
+
+    Numeric data are cast to little-endian. Negative zero, e.g. left by
+    rounding, is hashed as zero. Other data are serialized as strings.
+    """
+    data = np.asarray(data)
+    if np.issubdtype(data.dtype, np.floating):
+        data = data + 0.0  # -0.0 to 0.0
+    if np.issubdtype(data.dtype, np.number) or data.dtype == bool:
+        return np.ascontiguousarray(
+            data, dtype=data.dtype.newbyteorder("<")
+        ).tobytes()
+    return "\0".join(map(str, data.ravel())).encode()
+
 
 def get_file_namespaces(file_path: Union[str, Path]) -> dict:
     """Get all namespace versions from an NWB file.
@@ -45,6 +104,8 @@ class DirectoryHasher:
         batch_size: int = DEFAULT_BATCH_SIZE,
         keep_obj_hash: bool = False,
         verbose: bool = False,
+        hash_version: int = DEFAULT_HASH_VERSION,
+        n_threads: Optional[int] = None,
     ):
         """Generate a hash of the contents of a directory, recursively.
 
@@ -68,6 +129,11 @@ class DirectoryHasher:
             Default false. If true, keep cache the hash of each file.
         verbose : bool, optional
             Display progress bar, by default False.
+        hash_version : int, optional
+            Hash version, by default 1. See HASH_VERSIONS. Version 2 hashes
+            files in parallel and tags the digest 'v2:'.
+        n_threads : int, optional
+            Threads for version 2 hashing. Default ThreadPoolExecutor default.
         """
         self.dir_path = Path(directory_path)
         if not self.dir_path.exists():
@@ -79,25 +145,38 @@ class DirectoryHasher:
         self.keep_obj_hash = bool(keep_obj_hash)
         self.cache = {}
         self.verbose = bool(verbose)
-        self.hashed = md5("".encode())
+        self.hash_version = hash_version
+        self.n_threads = n_threads
+        self.digest = get_digest_func(hash_version)
+        self.hashed = self.digest("".encode())
         self.hash = self.compute_hash()
 
+    def encode_file(self, file_path: Path) -> bytes:
+        """Encode the contents of a file for hashing, by file type."""
+        if file_path.suffix == ".nwb":
+            return NwbfileHasher(
+                file_path,
+                batch_size=self.batch_size,
+                hash_version=self.hash_version,
+                n_threads=self.n_threads,
+            ).hash.encode()
+        elif file_path.suffix in [".json", ".jsonl"]:
+            return self.json_encode(file_path)
+        elif file_path.suffix in [".npy", ".npz"]:
+            return self.npy_encode(file_path)
+        return self.chunk_encode(file_path)
+
     def compute_hash(self) -> str:
         """Hashes the contents of the directory, recursively."""
         all_files = [f for f in sorted(self.dir_path.rglob("*")) if f.is_file()]
 
-        for file_path in all_files:
-            if file_path.suffix == ".nwb":
-                this_hash = NwbfileHasher(
-                    file_path, batch_size=self.batch_size
-                ).hash.encode()
-            elif file_path.suffix in [".json", ".jsonl"]:
-                this_hash = self.json_encode(file_path)
-            elif file_path.suffix in [".npy", ".npz"]:
-                this_hash = self.npy_encode(file_path)
-            else:
-                this_hash = self.chunk_encode(file_path)
+        if self.hash_version == 1:
+            file_hashes = map(self.encode_file, all_files)
+        else:  # encode in parallel, combine in sorted order
+            with ThreadPoolExecutor(self.n_threads) as pool:
+                file_hashes = list(pool.map(self.encode_file, all_files))
 
+        for file_path, this_hash in zip(all_files, file_hashes):
             self.hashed.update(this_hash)
 
             # update with the rel path to for same file in diff dirs
@@ -107,18 +186,22 @@ class DirectoryHasher:
             if self.keep_obj_hash:
                 self.cache[rel_path] = this_hash
 
-        return self.hashed.hexdigest()  # Return the hex digest of the hash
+        return format_hash(self.hashed.hexdigest(), self.hash_version)
 
     def npy_encode(self, file_path: Path) -> str:
         """Encode the contents of a numpy file for hashing."""
-        data = np.load(file_path, allow_pickle=True).tobytes()
-        return md5(data).hexdigest().encode()
+        data = np.load(file_path, allow_pickle=True)
+        data = (
+            data.tobytes() if self.hash_version == 1 else canonical_bytes(data)
+        )
+        return self.digest(data).hexdigest().encode()
 
     def chunk_encode(self, file_path: Path) -> str:
         """Encode the contents of a file in chunks for hashing."""
-        this_hash = md5("".encode())
+        this_hash = self.digest("".encode())
+        read_size = self.batch_size if self.hash_version == 1 else READ_BYTES
         with file_path.open("rb") as f:
-            while chunk := f.read(self.batch_size):
+            while chunk := f.read(read_size):
                 this_hash.update(chunk)
         return this_hash.hexdigest().encode()
 
@@ -155,6 +238,8 @@ class NwbfileHasher:
         keep_obj_hash: bool = False,
         keep_file_open: bool = False,
         verbose: bool = False,
+        hash_version: int = DEFAULT_HASH_VERSION,
+        n_threads: Optional[int] = None,
     ):
         """Hashes the contents of an NWB file.
 
@@ -186,6 +271,13 @@ class NwbfileHasher:
             Keep the hash of each object in the NWB file, by default False.
         verbose : bool, optional
             Display progress bar, by default True.
+        hash_version : int, optional
+            Hash version, by default 1. See HASH_VERSIONS. Version 2 includes
+            dataset contents, rounded with NumPy and hashed as little-endian
+            bytes with blake2b, reading datasets across a thread pool. The
+            digest is tagged 'v2:'. See get_hash_version.
+        n_threads : int, optional
+            Threads for version 2 hashing. Default ThreadPoolExecutor default.
         """
         self.path = Path(path)
         self.file = h5py.File(path, "r")
@@ -200,8 +292,11 @@ class NwbfileHasher:
         self.batch_size = batch_size
         self.verbose = verbose
         self.keep_obj_hash = keep_obj_hash
+        self.hash_version = hash_version
+        self.n_threads = n_threads
+        self.digest = get_digest_func(hash_version)
         self.objs = {}
-        self.hashed = md5("".encode())
+        self.hashed = self.digest("".encode())
         self.hash = self.compute_hash()
 
         if not keep_file_open:
@@ -253,8 +348,11 @@ class NwbfileHasher:
         return isinstance(data, (float, int, np.number))
 
     def hash_dataset(self, dataset: h5py.Dataset):
+        """Return the digest of a dataset's contents."""
         if dataset.name in IGNORED_KEYS:
             return  # Ignore source script
+        if self.hash_version != 1:
+            return self._hash_dataset_contents(dataset)
 
         this_hash = md5(self.hash_shape_dtype(dataset))
 
@@ -279,6 +377,44 @@ class NwbfileHasher:
 
         return this_hash.hexdigest()
 
+    def _hash_dataset_contents(self, dataset: h5py.Dataset) -> str:
+        """Hash canonical bytes of dataset contents, rounded with NumPy.
+
+        Reads about READ_BYTES at a time. The digest does not depend on the
+        read size.
+        """
+        this_hash = self.digest(self.hash_shape_dtype(dataset))
+
+        if dataset.shape == ():
+            this_hash.update(canonical_bytes(dataset[()]))
+            return this_hash.hexdigest()
+
+        dataset_name = dataset.parent.name.split("/")[-1]
+        precision = self.precision.get(dataset_name, None)
+
+        size = dataset.shape[0]
+        row_bytes = max(dataset.dtype.itemsize, 1) * int(
+            np.prod(dataset.shape[1:])
+        )
+        n_rows = max(self.batch_size, READ_BYTES // max(row_bytes, 1))
+
+        for start in range(0, size, n_rows):
+            data = dataset[start : start + n_rows]
+            if precision and self.is_roundable(data):
+                data = np.round(data, precision)
+            this_hash.update(canonical_bytes(data))
+
+        return this_hash.hexdigest()
+
+    def _hash_all_datasets(self, items: list) -> Dict[str, str]:
+        """Hash dataset contents across a thread pool, keyed by name."""
+        datasets = [
+            (name, obj) for name, obj in items if isinstance(obj, h5py.Dataset)
+        ]
+        with ThreadPoolExecutor(self.n_threads) as pool:
+            digests = pool.map(self.hash_dataset, [obj for _, obj in datasets])
+            return {name: d for (name, _), d in zip(datasets, digests)}
+
     def hash_shape_dtype(self, obj: Union[h5py.Dataset, np.ndarray]) -> str:
         if not hasattr(obj, "shape") or not hasattr(obj, "dtype"):
             return "".encode()
@@ -308,12 +444,18 @@ class NwbfileHasher:
 
         self.add_to_cache("namespaces", self.namespaces, None)
 
+        items = self.collect_names(self.file)
+        # Version 1 digests never included dataset contents
+        data_digests = (
+            self._hash_all_datasets(items) if self.hash_version != 1 else {}
+        )
+
         for name, obj in tqdm(
-            self.collect_names(self.file),
+            items,
             desc=self.file.filename.split("/")[-1].split(".")[0],
             disable=not self.verbose,
         ):
-            this_hash = md5(name.encode())
+            this_hash = self.digest(name.encode())
 
             for attr_key in sorted(obj.attrs):
                 if attr_key in IGNORED_KEYS:
@@ -324,7 +466,8 @@ class NwbfileHasher:
                 this_hash.update(self.serialize_attr_value(attr_value))
 
             if isinstance(obj, h5py.Dataset):
-                _ = self.hash_dataset(obj)
+                if data_digest := data_digests.get(name):
+                    this_hash.update(data_digest.encode())
             elif isinstance(obj, h5py.SoftLink):
                 this_hash.update(obj.path.encode())
             elif isinstance(obj, h5py.Group):
@@ -333,7 +476,7 @@ class NwbfileHasher:
                     obj_value = self.serialize_attr_value(v)
                     this_hash.update(obj_value)
                     self.add_to_cache(
-                        f"{name}/k", v, md5(obj_value).hexdigest()
+                        f"{name}/k", v, self.digest(obj_value).hexdigest()
                     )
             else:
                 raise TypeError(
@@ -346,4 +489,4 @@ class NwbfileHasher:
 
             self.add_to_cache(name, obj, this_digest)
 
-        return self.hashed.hexdigest()
+        return format_hash(self.hashed.hexdigest(), self.hash_version)
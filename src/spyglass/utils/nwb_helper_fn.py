@@ -2,9 +2,12 @@
 
 import os
 import os.path
+import sys
+from collections import OrderedDict
+from threading import RLock
 from itertools import groupby
 from pathlib import Path
-from typing import List, Union
+from typing import Any, Callable, Hashable, List, Optional, Union
 
 import numpy as np
 import pynwb
@@ -12,11 +15,212 @@ import yaml
 
 from spyglass.utils.logging import logger
 
-# dict mapping file path to an open NWBHDF5IO object in read mode and its NWBFile
-__open_nwb_files = dict()
+NWB_CACHE_MAX_FILES = 64  # open NWB files kept in cache
+NWB_CACHE_MAX_BYTES = 4 * 1024**3  # approximate resident size of open files
+CONFIG_CACHE_MAX_ITEMS = 4096  # configs kept in cache
+NWB_OBJECT_OVERHEAD = 4096  # approximate bytes per loaded pynwb object
+
+
+class LRUCache:
+    """Least recently used cache, bounded by item count and approximate size.
+
+    Parameters
+    ----------
+    max_items : int, optional
+        Maximum number of items. None for no limit.
+    max_bytes : int, optional
+        Maximum approximate size of all items, per size_func. None for no
+        limit. The most recent item is kept even if it exceeds this limit.
+    size_func : Callable, optional
+        Returns the approximate size of a value in bytes. Default 0.
+    on_evict : Callable, optional
+        Called with (key, value) when an item is evicted.
+
+    Methods are thread-safe, so files can be loaded from worker threads.
+    """
+
+    def __init__(
+        self,
+        max_items: Optional[int] = None,
+        max_bytes: Optional[int] = None,
+        size_func: Optional[Callable[[Any], int]] = None,
+        on_evict: Optional[Callable[[Hashable, Any], None]] = None,
+    ):
+        self.max_items = max_items
+        self.max_bytes = max_bytes
+        self.size_func = size_func or (lambda _: 0)
+        self.on_evict = on_evict
+        self._data = OrderedDict()  # key -> (value, size)
+        self._lock = RLock()
+        self.n_bytes = 0
+        self.hits = self.misses = self.evictions = 0
+
+    def __contains__(self, key: Hashable) -> bool:
+        return key in self._data
+
+    def __len__(self) -> int:
+        return len(self._data)
+
+    def __setitem__(self, key: Hashable, value: Any) -> None:
+        size = self.size_func(value)
+        with self._lock:
+            self.pop(key)
+            self._data[key] = (value, size)
+            self.n_bytes += size
+            self._evict()
+
+    def get(self, key: Hashable, default: Any = None) -> Any:
+        """Return a cached value and mark it as most recently used."""
+        with self._lock:
+            if key not in self._data:
+                self.misses += 1
+                return default
+            self.hits += 1
+            self._data.move_to_end(key)
+            return self._data[key][0]
+
+    def peek(self, key: Hashable, default: Any = None) -> Any:
+        """Return a cached value without changing order or stats."""
+        return self._data.get(key, (default, 0))[0]
+
+    def pop(self, key: Hashable, default: Any = None) -> Any:
+        """Remove an item without calling on_evict."""
+        with self._lock:
+            value, size = self._data.pop(key, (default, 0))
+            self.n_bytes -= size
+            return value
+
+    def values(self) -> list:
+        """Cached values, least recently used first."""
+        with self._lock:
+            return [value for value, _ in self._data.values()]
+
+    def clear(self) -> None:
+        """Remove all items without calling on_evict."""
+        with self._lock:
+            self._data.clear()
+            self.n_bytes = 0
+
+    def set_limits(
+        self, max_items: Optional[int] = None, max_bytes: Optional[int] = None
+    ) -> None:
+        """Set new limits and evict items beyond them."""
+        with self._lock:
+            self.max_items, self.max_bytes = max_items, max_bytes
+            self._evict()
+
+    @property
+    def stats(self) -> dict:
+        """Hits, misses, evictions, and current usage of the cache."""
+        return dict(
+            hits=self.hits,
+            misses=self.misses,
+            evictions=self.evictions,
+            items=len(self._data),
+            bytes=self.n_bytes,
+            max_items=self.max_items,
+            max_bytes=self.max_bytes,
+        )
+
+    def _over_limit(self) -> bool:
+        if self.max_items is not None and len(self._data) > self.max_items:
+            return True
+        return (
+            self.max_bytes is not None
+            and self.n_bytes > self.max_bytes
+            and len(self._data) > 1
+        )
+
+    def _evict(self) -> None:
+        while self._data and self._over_limit():
+            self._evict_oldest()
+            self.evictions += 1
+
+    def _evict_oldest(self) -> None:
+        key, (value, size) = self._data.popitem(last=False)
+        self.n_bytes -= size
+        if self.on_evict is not None:
+            self.on_evict(key, value)
+
+
+def _nwb_file_size(value: tuple) -> int:
+    """Approximate resident size of an open file's pynwb object graph.
+
+    Counts a fixed overhead per object plus any in-memory numpy arrays.
+    Datasets left on disk are not counted.
+    """
+    _, nwbfile = value
+    try:
+        objects = nwbfile.objects.values()
+    except AttributeError:
+        return NWB_OBJECT_OVERHEAD
+    n_bytes = 0
+    for obj in objects:
+        n_bytes += NWB_OBJECT_OVERHEAD
+        for field in getattr(obj, "fields", {}).values():
+            if isinstance(field, np.ndarray):
+                n_bytes += field.nbytes
+    return n_bytes
+
+
+def _obj_size(obj: Any) -> int:
+    """Approximate size of nested builtin containers, e.g., a loaded config."""
+    if isinstance(obj, dict):
+        return sys.getsizeof(obj) + sum(
+            _obj_size(k) + _obj_size(v) for k, v in obj.items()
+        )
+    if isinstance(obj, (list, tuple, set)):
+        return sys.getsizeof(obj) + sum(_obj_size(v) for v in obj)
+    return sys.getsizeof(obj)
+
+
+def _release_evicted(nwb_file_path: str, value: tuple) -> None:
+    """Drop a file evicted from the cache without closing its handle.
+
+    Objects fetched earlier reach the io through NWBFile.read_io, so lazy
+    datasets stay readable while callers hold them. The io is closed when it
+    is garbage collected, or by close_nwb_files while it is cached.
+    """
+    logger.debug(f"Evicting {Path(nwb_file_path).name} from NWB file cache")
+
+
+# LRU cache mapping file path to an open NWBHDF5IO object in read mode and its
+# NWBFile. Evicted files are released, not closed.
+__open_nwb_files = LRUCache(
+    max_items=NWB_CACHE_MAX_FILES,
+    max_bytes=NWB_CACHE_MAX_BYTES,
+    size_func=_nwb_file_size,
+    on_evict=_release_evicted,
+)
+
+# LRU cache mapping NWB file path to config after it is loaded once
+__configs = LRUCache(max_items=CONFIG_CACHE_MAX_ITEMS, size_func=_obj_size)
+
+
+def set_cache_limits(
+    max_files: Optional[int] = NWB_CACHE_MAX_FILES,
+    max_bytes: Optional[int] = NWB_CACHE_MAX_BYTES,
+    max_configs: Optional[int] = CONFIG_CACHE_MAX_ITEMS,
+) -> None:
+    """Set limits of the open NWB file and config caches.
+
+    Parameters
+    ----------
+    max_files : int, optional
+        Maximum number of open NWB files. None for no limit.
+    max_bytes : int, optional
+        Maximum approximate resident size of open NWB files. None for no limit.
+    max_configs : int, optional
+        Maximum number of cached configs. None for no limit.
+    """
+    __open_nwb_files.set_limits(max_items=max_files, max_bytes=max_bytes)
+    __configs.set_limits(max_items=max_configs)
+
+
+def get_cache_stats() -> dict:
+    """Return hit, miss, and eviction stats of the NWB file and config caches."""
+    return dict(nwb_files=__open_nwb_files.stats, configs=__configs.stats)
 
-# dict mapping NWB file path to config after it is loaded once
-__configs = dict()
 
 global invalid_electrode_index
 invalid_electrode_index = 99999999
@@ -132,7 +336,7 @@ def file_from_dandi(filepath):
     """helper to determine if open file is streamed from Dandi"""
     if filepath not in __open_nwb_files:
         return False
-    build_keys = __open_nwb_files[filepath][0]._HDF5IO__built.keys()
+    build_keys = __open_nwb_files.peek(filepath)[0]._HDF5IO__built.keys()
     for k in build_keys:
         if "HTTPFileSystem" in k:
             return True
@@ -168,8 +372,8 @@ def get_config(nwb_file_path: str, calling_table: str = None) -> dict:
     dict
         Dictionary of configuration settings loaded from the YAML file
     """
-    if nwb_file_path in __configs:  # load from cache if exists
-        return __configs[nwb_file_path]
+    if (config := __configs.get(nwb_file_path)) is not None:
+        return config  # load from cache if exists
 
     obj_path = Path(nwb_file_path)
     # NOTE use stem[:-1] to remove the underscore that was added to the file
@@ -187,7 +391,7 @@ def get_config(nwb_file_path: str, calling_table: str = None) -> dict:
         __configs[nwb_file_path] = ret  # cache to avoid repeated null lookups
         return ret
     with open(config_path, "r") as stream:
-        config_dict = yaml.safe_load(stream)
+        config_dict = yaml.safe_load(stream) or dict()
 
     # TODO write a JSON schema for the yaml file and validate the yaml file
     __configs[nwb_file_path] = config_dict  # store in cache
@@ -1,4 +1,8 @@
 import numpy as np
+import pandas as pd
+
+# pandas interpolation methods that are linear in time on a sorted index
+LINEAR_INTERPOLATION_METHODS = ("linear", "time", "index", "values")
 
 
 def convert_to_pixels(data, frame_size=None, cm_to_pixels=1.0):
@@ -29,3 +33,88 @@ def fill_nan(variable, video_time, variable_time):
     filled_variable[video_ind] = variable
 
     return filled_variable
+
+
+def _nan_span_mask(
+    time: np.ndarray, is_nan: np.ndarray, new_time: np.ndarray
+) -> np.ndarray:
+    """Mask of new_time falling within a run of NaNs, ends inclusive."""
+    ind = np.searchsorted(time, new_time, side="right") - 1
+    after_start = ind >= 0
+    ind = np.clip(ind, 0, len(time) - 1)
+    next_is_nan = np.append(is_nan[1:], False)[ind]
+    return after_start & is_nan[ind] & (next_is_nan | (time[ind] == new_time))
+
+
+def interpolate_to_new_time(
+    df: pd.DataFrame,
+    new_time,
+    upsampling_interpolation_method: str = "linear",
+    nan_columns=None,
+) -> pd.DataFrame:
+    """Interpolate a time-indexed dataframe to new times.
+
+    Linear methods interpolate each column onto new_time with np.interp,
+    without building the union of old and new times. As with pandas
+    interpolate, NaNs are interpolated across, times before the first valid
+    sample are NaN and times after the last valid sample take its value.
+    Other methods interpolate with pandas on the union of old and new times.
+
+    Parameters
+    ----------
+    df : pd.DataFrame
+        Numeric data indexed by time.
+    new_time : array_like
+        Times to interpolate to.
+    upsampling_interpolation_method : str, optional
+        pandas method for interpolation, by default "linear"
+    nan_columns : list of str, optional
+        Columns that stay NaN within runs of NaNs in df, from the first to the
+        last NaN sample, rather than being interpolated across. Default None.
+
+    Returns
+    -------
+    pd.DataFrame
+        Interpolated data indexed by new_time.
+    """
+    if not df.index.is_monotonic_increasing:
+        df = df.sort_index()
+    time = df.index.to_numpy(dtype=float)
+    new_index = (
+        new_time
+        if isinstance(new_time, pd.Index)
+        else pd.Index(new_time, name=df.index.name)
+    )
+    new_time = new_index.to_numpy(dtype=float)
+
+    if upsampling_interpolation_method in LINEAR_INTERPOLATION_METHODS:
+        data = np.full((len(new_time), df.shape[1]), np.nan)
+        for ind, column in enumerate(df.columns):
+            values = df[column].to_numpy(dtype=float)
+            is_valid = ~np.isnan(values)
+            if not is_valid.any():
+                continue
+            valid_time = time[is_valid]
+            in_range = new_time >= valid_time[0]
+            data[in_range, ind] = np.interp(
+                new_time[in_range], valid_time, values[is_valid]
+            )
+        new_df = pd.DataFrame(
+            data, index=new_index, columns=df.columns, copy=False
+        )
+    else:
+        union_index = pd.Index(
+            np.unique(np.concatenate((time, new_time))), name=df.index.name
+        )
+        new_df = (
+            df.reindex(index=union_index)
+            .interpolate(method=upsampling_interpolation_method)
+            .reindex(index=new_index)
+        )
+
+    for column in [] if nan_columns is None else nan_columns:
+        is_nan = df[column].isna().to_numpy()
+        if is_nan.any():
+            new_df.loc[_nan_span_mask(time, is_nan, new_time), column] = np.nan
+
+    return new_df
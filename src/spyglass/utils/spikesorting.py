@@ -1,29 +1,219 @@
+from typing import Iterator, List, Optional, Tuple, Union
+
 import numpy as np
 from ripple_detection import get_multiunit_population_firing_rate
+from scipy.sparse import csr_matrix, issparse, spmatrix
+
+# Gaussian kernel truncation used by ripple_detection.gaussian_smooth
+SMOOTHING_TRUNCATE = 8
+
+
+def _spike_time_bins(spike_times: List[np.ndarray], time: np.ndarray) -> list:
+    """Time-bin index of each spike in range of time, per unit."""
+    min_time, max_time = time[[0, -1]]
+    spike_bins = []
+    for times in spike_times:
+        times = np.asarray(times)
+        times = times[np.logical_and(times >= min_time, times <= max_time)]
+        spike_bins.append(np.digitize(times, time[1:-1]))
+    return spike_bins
+
+
+def spike_indicator_from_times(
+    spike_times: List[np.ndarray],
+    time: np.ndarray,
+    sparse: bool = False,
+    dtype: np.dtype = np.float64,
+) -> Union[np.ndarray, csr_matrix]:
+    """Count spikes of each unit in the bins defined by time.
+
+    Parameters
+    ----------
+    spike_times : list of np.ndarray
+        Spike times for each unit.
+    time : np.ndarray
+        Time vector defining the bins.
+    sparse : bool, optional
+        If True, return a scipy.sparse CSR matrix that stores only nonzero
+        bins. Default False.
+    dtype : np.dtype, optional
+        Data type of the counts, by default float64. An integer type (e.g.,
+        np.uint16) reduces memory for dense output.
+
+    Returns
+    -------
+    np.ndarray or scipy.sparse.csr_matrix
+        Spike indicator with shape (len(time), n_units).
+    """
+    time = np.asarray(time)
+    spike_bins = _spike_time_bins(spike_times, time)
+    shape = (len(time), len(spike_bins))
+
+    if sparse:
+        rows = np.concatenate([np.zeros(0, dtype=int), *spike_bins])
+        cols = np.repeat(np.arange(shape[1]), [len(b) for b in spike_bins])
+        return csr_matrix(
+            (np.ones(len(rows), dtype=dtype), (rows, cols)), shape=shape
+        )
+
+    spike_indicator = np.zeros(shape, dtype=dtype)
+    for ind, unit_bins in enumerate(spike_bins):
+        spike_indicator[:, ind] = np.bincount(unit_bins, minlength=shape[0])
+    return spike_indicator
+
+
+def multiunit_count_from_times(
+    spike_times: List[np.ndarray], time: np.ndarray
+) -> np.ndarray:
+    """Count spikes across all units without a per-unit indicator.
+
+    Equivalent to spike_indicator_from_times(...).sum(axis=1, keepdims=True).
+
+    Parameters
+    ----------
+    spike_times : list of np.ndarray
+        Spike times for each unit.
+    time : np.ndarray
+        Time vector defining the bins.
+
+    Returns
+    -------
+    np.ndarray
+        Integer spike counts with shape (len(time), 1).
+    """
+    time = np.asarray(time)
+    spike_bins = _spike_time_bins(spike_times, time)
+    counts = np.bincount(
+        np.concatenate([np.zeros(0, dtype=int), *spike_bins]),
+        minlength=len(time),
+    )
+    return counts[:, np.newaxis]
+
+
+def _indicator_columns(
+    spike_indicator: Union[np.ndarray, spmatrix],
+) -> Iterator[np.ndarray]:
+    """Yield each unit of a dense or sparse indicator as a dense column."""
+    if not issparse(spike_indicator):
+        for indicator in spike_indicator.T:
+            yield indicator[:, np.newaxis]
+        return
+    spike_indicator = spike_indicator.tocsc()
+    for ind in range(spike_indicator.shape[1]):
+        yield spike_indicator[:, [ind]].toarray()
 
 
 def firing_rate_from_spike_indicator(
-    spike_indicator: np.ndarray,
+    spike_indicator: Union[np.ndarray, spmatrix],
     time: np.array,
     multiunit: bool = False,
     smoothing_sigma: float = 0.015,
+    sampling_frequency: Optional[float] = None,
 ):
-    """Calculate firing rate from spike indicator."""
+    """Calculate firing rate from a dense or sparse spike indicator.
+
+    Parameters
+    ----------
+    spike_indicator : np.ndarray or scipy.sparse matrix
+        Spike indicator with shape (len(time), n_units).
+    time : np.ndarray
+        Time vector of the spike indicator.
+    multiunit : bool, optional
+        If True, return the summed firing rate across units. Default False.
+    smoothing_sigma : float, optional
+        Standard deviation of the gaussian smoothing in seconds. Default 0.015.
+    sampling_frequency : float, optional
+        Sampling frequency of time. Calculated from time if not provided.
+
+    Returns
+    -------
+    np.ndarray
+        Firing rate with shape (len(time), n_units), or (len(time), 1) if
+        multiunit.
+    """
     if spike_indicator.ndim == 1:
         spike_indicator = spike_indicator[:, np.newaxis]
 
-    sampling_frequency = 1 / np.median(np.diff(time))
+    if sampling_frequency is None:
+        sampling_frequency = 1 / np.median(np.diff(time))
 
     if multiunit:
-        spike_indicator = spike_indicator.sum(axis=1, keepdims=True)
+        spike_indicator = (
+            np.asarray(spike_indicator.sum(axis=1))
+            if issparse(spike_indicator)
+            else spike_indicator.sum(axis=1, keepdims=True)
+        )
     return np.stack(
         [
             get_multiunit_population_firing_rate(
-                indicator[:, np.newaxis],
+                indicator,
                 sampling_frequency,
                 smoothing_sigma,
             )
-            for indicator in spike_indicator.T
+            for indicator in _indicator_columns(spike_indicator)
         ],
         axis=1,
     )
+
+
+def iter_firing_rate(
+    spike_indicator: Union[np.ndarray, spmatrix],
+    time: np.ndarray,
+    chunk_size: int = 100_000,
+    multiunit: bool = False,
+    smoothing_sigma: float = 0.015,
+) -> Iterator[Tuple[slice, np.ndarray]]:
+    """Yield firing rates in blocks of time.
+
+    Each block is smoothed with enough samples on either side to cover the
+    gaussian kernel, so concatenated blocks equal the output of
+    firing_rate_from_spike_indicator. Only one block is held in memory.
+
+    Parameters
+    ----------
+    spike_indicator : np.ndarray or scipy.sparse matrix
+        Spike indicator with shape (len(time), n_units). Sparse input is
+        densified one block at a time.
+    time : np.ndarray
+        Time vector of the spike indicator.
+    chunk_size : int, optional
+        Number of time samples per block. Default 100_000.
+    multiunit : bool, optional
+        If True, return the summed firing rate across units. Default False.
+    smoothing_sigma : float, optional
+        Standard deviation of the gaussian smoothing in seconds. Default 0.015.
+
+    Yields
+    ------
+    time_slice : slice
+        Indices of time covered by the block.
+    firing_rate : np.ndarray
+        Firing rate for the block, shape (n_block, n_units).
+    """
+    time = np.asarray(time)
+    if spike_indicator.ndim == 1:
+        spike_indicator = spike_indicator[:, np.newaxis]
+    if issparse(spike_indicator):
+        spike_indicator = spike_indicator.tocsr()
+
+    sampling_frequency = 1 / np.median(np.diff(time))
+    sigma_samples = smoothing_sigma * sampling_frequency
+    overlap = int(SMOOTHING_TRUNCATE * sigma_samples + 0.5) + 1
+
+    n_time = spike_indicator.shape[0]
+    for start in range(0, n_time, chunk_size):
+        stop = min(start + chunk_size, n_time)
+        pad_start = max(start - overlap, 0)
+        pad_stop = min(stop + overlap, n_time)
+        block = spike_indicator[pad_start:pad_stop]
+        if issparse(block):
+            block = block.toarray()
+        firing_rate = firing_rate_from_spike_indicator(
+            block,
+            time[pad_start:pad_stop],
+            multiunit=multiunit,
+            smoothing_sigma=smoothing_sigma,
+            sampling_frequency=sampling_frequency,
+        )
+        trim = slice(start - pad_start, stop - pad_start)
+        yield slice(start, stop), firing_rate[trim]
@@ -1,6 +1,36 @@
+import hashlib
+import json
+import os
+import shutil
+import socket
+import time
+from pathlib import Path
+from threading import RLock
+from typing import Any, Dict, Optional, Union
+from uuid import uuid4
+
 import numpy as np
 import spikeinterface as si
 
+from spyglass.utils.logging import logger
+
+WAVEFORM_STORE_DIR = "waveform_store"  # subdirectory of temp_dir
+WAVEFORM_STORE_MAX_BYTES = 100 * 1024**3  # evict unused entries beyond this
+WAVEFORM_LEASE_PREFIX = ".lease_"  # per-process marker of entries in use
+WAVEFORM_LEASE_MAX_AGE_S = 24 * 3600  # leases not refreshed since are stale
+# Extraction kwargs that change how, not what, waveforms are extracted
+WAVEFORM_JOB_KWARGS = (
+    "n_jobs",
+    "chunk_duration",
+    "chunk_size",
+    "chunk_memory",
+    "total_memory",
+    "progress_bar",
+    "verbose",
+    "mp_context",
+    "max_threads_per_process",
+)
+
 
 def _get_peak_amplitude(
     waveform_extractor: si.WaveformExtractor,
@@ -47,3 +77,298 @@ def _get_peak_amplitude(
         spike_peak_ind = waveforms.shape[1] // 2
 
     return waveforms[:, spike_peak_ind]
+
+
+def _update_hash(hasher, obj: Any) -> None:
+    """Add a nested extractor description to a hash, including array data."""
+    if isinstance(obj, dict):
+        hasher.update(b"{")
+        for key in sorted(obj, key=str):
+            hasher.update(str(key).encode())
+            _update_hash(hasher, obj[key])
+        hasher.update(b"}")
+    elif isinstance(obj, (list, tuple)):
+        hasher.update(b"[")
+        for item in obj:
+            _update_hash(hasher, item)
+        hasher.update(b"]")
+    elif isinstance(obj, np.ndarray):
+        hasher.update(f"{obj.dtype}{obj.shape}".encode())
+        hasher.update(np.ascontiguousarray(obj).tobytes())
+    else:
+        hasher.update(json.dumps(obj, default=str).encode())
+
+
+def waveform_key(
+    recording: si.BaseRecording,
+    sorting: si.BaseSorting,
+    waveform_params: dict,
+) -> str:
+    """Return a hash of the inputs that determine extracted waveforms.
+
+    The recording is hashed by its description, including preprocessing
+    steps and file paths. The sorting is hashed by its spike trains, so
+    in-memory sortings of the same spikes share a key. Job kwargs (e.g.,
+    n_jobs) are ignored.
+
+    Parameters
+    ----------
+    recording : si.BaseRecording
+        Recording to extract waveforms from.
+    sorting : si.BaseSorting
+        Sorting with the spike times of each unit.
+    waveform_params : dict
+        Keyword arguments for si.extract_waveforms.
+
+    Returns
+    -------
+    str
+        Hex digest identifying the extraction.
+    """
+    hasher = hashlib.md5()
+    _update_hash(hasher, recording.to_dict(recursive=True))
+    _update_hash(hasher, list(sorting.get_unit_ids()))
+    _update_hash(hasher, sorting.get_sampling_frequency())
+    _update_hash(hasher, sorting.to_spike_vector())
+    _update_hash(
+        hasher,
+        {
+            k: v
+            for k, v in waveform_params.items()
+            if k not in WAVEFORM_JOB_KWARGS
+        },
+    )
+    return hasher.hexdigest()
+
+
+def _pid_alive(pid: int) -> bool:
+    """Return True if a process with this id is running on this host."""
+    try:
+        os.kill(pid, 0)
+    except ProcessLookupError:
+        return False
+    except PermissionError:  # running, owned by another user
+        return True
+    return True
+
+
+class WaveformStore:
+    """Content-addressed store of extracted waveforms, shared across tables.
+
+    Each extraction is saved in a folder named by waveform_key, so tables
+    that extract the same waveforms from the same recording and sorting
+    reuse one folder. Folders are written under a temporary name and moved
+    into place when complete, so other processes only load finished
+    extractions.
+
+    Loaded extractors are reference counted within this process, and each
+    process holding references keeps a lease file in the folder. When the
+    store exceeds max_bytes, the least recently used folders without
+    references or live leases are removed. Leases are stale once their
+    process has exited, or, for other hosts, when not refreshed by get for
+    WAVEFORM_LEASE_MAX_AGE_S.
+
+    Parameters
+    ----------
+    base_dir : Union[str, Path], optional
+        Directory of the store. Default temp_dir/waveform_store.
+    max_bytes : int, optional
+        Approximate disk size above which unused entries are evicted.
+        Default WAVEFORM_STORE_MAX_BYTES. None for no limit.
+    """
+
+    def __init__(
+        self,
+        base_dir: Optional[Union[str, Path]] = None,
+        max_bytes: Optional[int] = WAVEFORM_STORE_MAX_BYTES,
+    ):
+        if base_dir is None:
+            from spyglass.settings import temp_dir
+
+            base_dir = Path(temp_dir) / WAVEFORM_STORE_DIR
+        self.base_dir = Path(base_dir)
+        self.max_bytes = max_bytes
+        self._ref_counts: Dict[str, int] = {}
+        self._lock = RLock()
+        self._lease_name = (
+            f"{WAVEFORM_LEASE_PREFIX}{socket.gethostname()}_{os.getpid()}"
+        )
+
+    def path(self, key: str) -> Path:
+        """Folder of a stored extraction."""
+        return self.base_dir / key
+
+    def get(
+        self,
+        recording: si.BaseRecording,
+        sorting: si.BaseSorting,
+        waveform_params: dict,
+        overwrite: bool = False,
+    ) -> si.WaveformExtractor:
+        """Load or extract waveforms and add a reference to them.
+
+        Call release with the returned extractor when it is no longer used.
+
+        Parameters
+        ----------
+        recording : si.BaseRecording
+            Recording to extract waveforms from.
+        sorting : si.BaseSorting
+            Sorting with the spike times of each unit.
+        waveform_params : dict
+            Keyword arguments for si.extract_waveforms.
+        overwrite : bool, optional
+            If True, extract again even if stored. Default False. Skipped
+            with a warning while the waveforms are in use.
+
+        Returns
+        -------
+        si.WaveformExtractor
+            Waveforms loaded from the store.
+        """
+        key = waveform_key(recording, sorting, waveform_params)
+        folder = self.path(key)
+
+        with self._lock:
+            if overwrite and folder.exists():
+                if self._in_use(folder):
+                    logger.warning(
+                        f"Waveforms {key} are in use, not overwriting. "
+                        + "Release them in all processes first."
+                    )
+                else:
+                    shutil.rmtree(folder)
+            if not folder.exists():
+                self._extract(folder, recording, sorting, waveform_params)
+            else:
+                folder.touch()  # mark as recently used for eviction
+            waveforms = si.load_waveforms(folder)
+            self._ref_counts[key] = self._ref_counts.get(key, 0) + 1
+            (folder / self._lease_name).touch()  # add or refresh lease
+
+        self.evict()
+        return waveforms
+
+    def _extract(
+        self,
+        folder: Path,
+        recording: si.BaseRecording,
+        sorting: si.BaseSorting,
+        waveform_params: dict,
+    ) -> None:
+        """Extract waveforms to a temporary folder and move it into place."""
+        self.base_dir.mkdir(parents=True, exist_ok=True)
+        temp_folder = self.base_dir / f".{folder.name}_{uuid4().hex}"
+        try:
+            si.extract_waveforms(
+                recording=recording,
+                sorting=sorting,
+                folder=temp_folder,
+                **waveform_params,
+            )
+            try:
+                temp_folder.rename(folder)
+            except OSError:  # another process stored it first
+                if not folder.exists():
+                    raise
+        finally:
+            if temp_folder.exists():
+                shutil.rmtree(temp_folder, ignore_errors=True)
+
+    def release(self, waveforms: Union[si.WaveformExtractor, str]) -> None:
+        """Remove a reference added by get.
+
+        Parameters
+        ----------
+        waveforms : Union[si.WaveformExtractor, str]
+            Extractor returned by get, or its key.
+        """
+        key = waveforms
+        if not isinstance(waveforms, str):
+            key = Path(waveforms.folder).name
+        with self._lock:
+            if self._ref_counts.get(key, 0) <= 1:
+                self._ref_counts.pop(key, None)
+                (self.path(key) / self._lease_name).unlink(missing_ok=True)
+            else:
+                self._ref_counts[key] -= 1
+
+    def _lease_is_live(self, lease: Path) -> bool:
+        """Return True if another process's lease is not stale."""
+        try:
+            age = time.time() - lease.stat().st_mtime
+        except FileNotFoundError:  # released meanwhile
+            return False
+        if age > WAVEFORM_LEASE_MAX_AGE_S:
+            return False
+        host, _, pid = lease.name[len(WAVEFORM_LEASE_PREFIX) :].rpartition("_")
+        if host != socket.gethostname() or not pid.isdigit() or os.name == "nt":
+            return True  # can only check processes on this host
+        return _pid_alive(int(pid))
+
+    def _in_use(self, folder: Path) -> bool:
+        """Return True if this or another process holds the waveforms."""
+        if self._ref_counts.get(folder.name):
+            return True
+        return any(
+            self._lease_is_live(lease)
+            for lease in folder.glob(f"{WAVEFORM_LEASE_PREFIX}*")
+            if lease.name != self._lease_name  # own lease follows ref counts
+        )
+
+    def _entries(self) -> list:
+        """Stored (mtime, size, folder) tuples, least recently used first."""
+        if not self.base_dir.exists():
+            return []
+        entries = []
+        for folder in self.base_dir.iterdir():
+            if not folder.is_dir() or folder.name.startswith("."):
+                continue
+            size = sum(
+                f.stat().st_size for f in folder.rglob("*") if f.is_file()
+            )
+            entries.append((folder.stat().st_mtime, size, folder))
+        return sorted(entries, key=lambda entry: entry[0])
+
+    def evict(self, max_bytes: Optional[int] = None) -> int:
+        """Remove unused entries, oldest first, until under max_bytes.
+
+        Parameters
+        ----------
+        max_bytes : int, optional
+            Size limit in bytes. Default self.max_bytes.
+
+        Returns
+        -------
+        int
+            Number of entries removed.
+        """
+        max_bytes = self.max_bytes if max_bytes is None else max_bytes
+        if max_bytes is None:
+            return 0
+
+        with self._lock:
+            entries = self._entries()
+            total = sum(size for _, size, _ in entries)
+            n_removed = 0
+            for _, size, folder in entries:
+                if total <= max_bytes:
+                    break
+                if self._in_use(folder):
+                    continue
+                logger.debug(f"Evicting waveforms {folder.name}")
+                shutil.rmtree(folder, ignore_errors=True)
+                total -= size
+                n_removed += 1
+        return n_removed
+
+
+_WAVEFORM_STORE = None
+
+
+def get_waveform_store() -> WaveformStore:
+    """Return the waveform store shared by all tables in this process."""
+    global _WAVEFORM_STORE
+    if _WAVEFORM_STORE is None:
+        _WAVEFORM_STORE = WaveformStore()
+    return _WAVEFORM_STORE
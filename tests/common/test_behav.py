@@ -47,6 +47,25 @@ def test_raw_position_fetch_nwb(common, mini_pos, mini_pos_interval_dict):
     assert fetched.equals(raw), "RawPosition fetch_nwb failed"
 
 
+def test_fetch_nwb_batch_filepaths(common, mini_pos_interval_dict):
+    """Test fetch_nwb resolves filepaths without a query per row"""
+    from spyglass.utils.mixins.fetch import _session_query_count
+
+    query = common.RawPosition.PosObject & mini_pos_interval_dict
+    table, attr = query._nwb_table_tuple
+    expected = (query * table().proj(path=attr)).fetch("path")
+
+    conn = query.connection
+    n_queries = _session_query_count(conn)
+    rec_dicts = query._execute_nwb_query(table, attr)
+    n_queries = _session_query_count(conn) - n_queries - 1
+
+    assert sorted(r["nwb2load_filepath"] for r in rec_dicts) == sorted(
+        expected
+    ), "fetch_nwb batch filepaths differ from datajoint fetch"
+    assert n_queries <= 4, f"fetch_nwb used {n_queries} queries"
+
+
 def test_raw_position_fetch1_df(common, mini_pos, mini_pos_interval_dict):
     """Test RawPosition fetch1 dataframe"""
     fetched = (common.RawPosition & mini_pos_interval_dict).fetch1_dataframe()
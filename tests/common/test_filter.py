@@ -1,3 +1,4 @@
+import numpy as np
 import pytest
 
 
@@ -77,3 +78,42 @@ def test_create_standard_filters(filter_parameters):
     assert filter_parameters & {
         "filter_name": "LFP 0-400 Hz"
     }, "create_standard_filters failed"
+
+
+def test_filter_data_iterator(filter_parameters, filter_coeff):
+    rng = np.random.default_rng(0)
+    timestamps = np.arange(2000) / 10
+    data = rng.normal(size=(len(timestamps), 4))
+    valid_times = np.array([[15, 60], [80, 180]])
+    electrodes, references = [0, 2, 3], [-1, 1, 0]
+
+    referenced = data[100:1900].copy()
+    referenced[:, 2] -= data[100:1900, 1]
+    referenced[:, 3] -= data[100:1900, 0]
+    expected, expected_ts = filter_parameters.filter_data(
+        timestamps[100:1900],
+        referenced,
+        filter_coeff,
+        valid_times,
+        electrodes,
+        decimation=2,
+    )
+
+    data_iterator, new_ts = filter_parameters.filter_data_iterator(
+        timestamps[100:1900],
+        data,
+        filter_coeff,
+        valid_times,
+        electrodes,
+        decimation=2,
+        reference_electrodes=references,
+        start_index=100,
+        buffer_shape=(128, 3),
+        chunk_shape=(64, 3),
+    )
+    streamed = np.empty(expected.shape, expected.dtype)
+    for chunk in data_iterator:
+        streamed[chunk.selection] = chunk.data
+
+    assert np.array_equal(new_ts, expected_ts), "Streamed timestamps differ"
+    assert np.allclose(streamed, expected), "Streamed filtering differs"
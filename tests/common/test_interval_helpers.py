@@ -448,3 +448,78 @@ def test_interval_from_inds(interval_obj, interval_list, expected_result):
     assert np.array_equal(
         interval_obj(interval_list, from_inds=True).times, expected_result
     ), "Problem with Interval(x, from_inds=True)"
+
+
+@pytest.fixture(scope="module")
+def random_intervals():
+    rng = np.random.default_rng(0)
+    starts = rng.integers(0, 500, 200)
+    intervals = np.column_stack([starts, starts + rng.integers(1, 20, 200)])
+    timestamps = rng.uniform(-10, 530, 2_000)
+    yield intervals.astype(float), timestamps
+
+
+def test_contains_matches_brute_force(interval_obj, random_intervals):
+    intervals, timestamps = random_intervals
+    obj = interval_obj(intervals, no_duplicates=False)
+    for ts in (timestamps, np.sort(timestamps)):  # unsorted and sorted
+        expected = np.concatenate(
+            [
+                np.flatnonzero((ts >= start) & (ts <= stop))
+                for start, stop in obj.times
+            ]
+        )
+        assert np.array_equal(
+            obj.contains(ts, as_indices=True), expected
+        ), "Problem with Interval.contains: mismatch with brute force"
+        assert np.array_equal(
+            obj.excludes(ts, as_indices=True),
+            np.setdiff1d(np.arange(len(ts)), expected),
+        ), "Problem with Interval.excludes: mismatch with brute force"
+
+
+def test_intersect_matches_brute_force(interval_obj, random_intervals):
+    intervals, _ = random_intervals
+    one = interval_obj(intervals).consolidate().times
+    two = interval_obj(intervals[::2] + 7.5).consolidate().times
+    expected = sorted(
+        [max(a[0], b[0]), min(a[1], b[1])]
+        for a in one
+        for b in two
+        if min(a[1], b[1]) > max(a[0], b[0])
+    )
+    assert np.array_equal(
+        interval_obj(one).intersect(two).times, np.array(expected)
+    ), "Problem with Interval.intersect: mismatch with brute force"
+
+
+@pytest.mark.slow
+def test_interval_wrappers_benchmark(common):
+    """Module-level wrappers on many intervals and 30 kHz timestamps."""
+    from time import perf_counter
+
+    ci = common.common_interval
+    rng = np.random.default_rng(0)
+    edges = np.cumsum(rng.uniform(0.01, 0.1, 2 * 20_000))
+    intervals = edges.reshape(-1, 2)  # 20k disjoint intervals, ~20 min
+    timestamps = np.arange(0, edges[-1], 1 / 30_000)
+
+    calls = {
+        "interval_list_contains_ind": (intervals, timestamps),
+        "interval_list_contains": (intervals, timestamps),
+        "interval_list_excludes_ind": (intervals, timestamps),
+        "interval_list_excludes": (intervals, timestamps),
+        "interval_list_intersect": (intervals, intervals[::3] + 0.005),
+        "interval_list_censor": (intervals, timestamps[timestamps < 30]),
+    }
+    durations = dict()
+    for func_name, args in calls.items():
+        func = getattr(ci, func_name)
+        if func_name == "interval_list_censor":
+            args = (np.array([[0, edges[-1]]]), args[1])
+        start = perf_counter()
+        func(*args)
+        durations[func_name] = perf_counter() - start
+
+    slow = {k: round(v, 2) for k, v in durations.items() if v > 10}
+    assert not slow, f"Interval wrappers slower than expected: {slow}"
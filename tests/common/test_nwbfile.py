@@ -33,3 +33,104 @@ def test_nwbfile_cleanup(common_nwbfile):
     common_nwbfile.Nwbfile.cleanup(delete_files=False)
     after = len(common_nwbfile.Nwbfile.fetch())
     assert before == after, "Nwbfile cleanup changed table entry count."
+
+
+def test_analysis_template(common_nwbfile, mini_copy_name, teardown):
+    import h5py
+
+    analysis = common_nwbfile.AnalysisNwbfile()
+    raw_path = common_nwbfile.Nwbfile.get_abs_path(mini_copy_name)
+    template_path = analysis._analysis_template_path(raw_path)
+
+    file_paths = [
+        analysis.get_abs_path(analysis.create(mini_copy_name)) for _ in range(2)
+    ]
+    assert template_path.exists(), "Analysis template not written."
+
+    object_ids = []
+    for file_path in file_paths:
+        with h5py.File(file_path, "r") as f:
+            object_ids.append(f.attrs["object_id"])
+            assert "acquisition" not in f or not len(f["acquisition"])
+        if teardown:
+            os.remove(file_path)
+    assert object_ids[0] != object_ids[1], "Template copies share object_id."
+
+
+def test_analysis_template_removed(
+    common_nwbfile, mini_copy_name, teardown, monkeypatch
+):
+    import time
+
+    analysis = common_nwbfile.AnalysisNwbfile()
+    raw_path = common_nwbfile.Nwbfile.get_abs_path(mini_copy_name)
+    get_template = type(analysis)._get_analysis_template
+
+    calls = []
+
+    def removed_after_get(self, nwb_file_abspath):
+        template_path = get_template(self, nwb_file_abspath)
+        if not calls:  # as if removed by another process before the copy
+            template_path.unlink()
+        calls.append(template_path)
+        return template_path
+
+    monkeypatch.setattr(
+        type(analysis), "_get_analysis_template", removed_after_get
+    )
+    file_path = analysis.get_abs_path(analysis.create(mini_copy_name))
+    monkeypatch.undo()
+
+    assert len(calls) == 2, "Removed template was not rebuilt."
+    assert os.path.exists(file_path), "Analysis file not created."
+    if teardown:
+        os.remove(file_path)
+
+    template_path = analysis._analysis_template_path(raw_path)
+    assert template_path not in analysis.cleanup_analysis_templates(
+        dry_run=True
+    ), "Recently used template marked for cleanup."
+
+    old = time.time() - 8 * 86400
+    os.utime(template_path, (old, old))
+    assert template_path in analysis.cleanup_analysis_templates(
+        dry_run=True
+    ), "Unused template not marked for cleanup."
+    os.utime(template_path)
+
+
+def test_analysis_template_read_only(
+    common_nwbfile, mini_copy_name, teardown, monkeypatch
+):
+    from pathlib import Path
+
+    from spyglass.utils.mixins import analysis as analysis_module
+
+    analysis = common_nwbfile.AnalysisNwbfile()
+    raw_path = common_nwbfile.Nwbfile.get_abs_path(mini_copy_name)
+    template_path = analysis._get_analysis_template(raw_path)
+
+    def denied(*args, **kwargs):
+        raise PermissionError("owned by another user")
+
+    file_paths = []
+    monkeypatch.setattr(analysis_module.os, "utime", denied)
+    file_paths.append(analysis.get_abs_path(analysis.create(mini_copy_name)))
+    monkeypatch.undo()
+
+    monkeypatch.setattr(
+        type(analysis), "_get_analysis_template", lambda *_: denied()
+    )
+    file_paths.append(analysis.get_abs_path(analysis.create(mini_copy_name)))
+    monkeypatch.undo()
+
+    for file_path in file_paths:
+        assert os.path.exists(file_path), "Analysis file not created."
+        if teardown:
+            os.remove(file_path)
+
+    monkeypatch.setattr(Path, "unlink", denied)
+    removed = analysis._remove_old_templates([template_path], max_age_s=0)
+    monkeypatch.undo()
+    assert not removed, "Template of another user reported removed."
+    assert template_path.exists(), "Template of another user removed."
@@ -114,6 +114,32 @@ def test_convert_to_pixels():
     assert np.array_equal(output, expect), "Failed to convert to pixels."
 
 
+def test_interpolate_to_new_time():
+    from spyglass.utils.position import interpolate_to_new_time
+
+    df = pd.DataFrame(
+        {"x": [np.nan, 1.0, 2.0, np.nan, np.nan, 5.0, np.nan]},
+        index=pd.Index([0.0, 1.0, 3.0, 4.0, 6.0, 7.0, 8.0], name="time"),
+    )
+    new_time = np.array([0.5, 1.0, 2.0, 3.5, 5.0, 6.5, 7.5, 9.0])
+    expect = pd.Index(new_time, name="time")
+
+    interp = interpolate_to_new_time(df, new_time)
+    assert interp.index.equals(expect), "Unexpected interpolated index"
+    assert np.allclose(
+        interp["x"],
+        [np.nan, 1.0, 1.5, 2.375, 3.5, 4.625, 5.0, 5.0],
+        equal_nan=True,
+    ), "Failed to interpolate linearly in time."
+
+    kept_nan = interpolate_to_new_time(df, new_time, nan_columns=["x"])
+    assert np.allclose(
+        kept_nan["x"],
+        [np.nan, 1.0, 1.5, 2.375, np.nan, 4.625, 5.0, 5.0],
+        equal_nan=True,
+    ), "Failed to keep NaN spans."
+
+
 @pytest.fixture(scope="session")
 def rename_default_cols(common_position):
     yield common_position._fix_col_names, ["xloc", "yloc", "xloc2", "yloc2"]
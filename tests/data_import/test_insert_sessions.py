@@ -38,3 +38,50 @@ def test_copy_link(mini_path, settings, mini_closed, copy_nwb_link_raw_ephys):
             with pytest.warns(BrokenLinkWarning):
                 nwb_acq = io.read().acquisition
     assert "e-series" not in nwb_acq, "Ephys link still exists after move"
+
+
+def test_insert_existing_sessions(mini_insert, mini_path, data_import):
+    """Existing sessions are skipped before any worker is started"""
+    with pytest.warns(UserWarning, match="already in Nwbfile table"):
+        ret = data_import.insert_sessions(
+            [mini_path.name, str(mini_path)], n_jobs=2
+        )
+    assert ret is None, "Unexpected errors for skipped sessions"
+
+
+def test_insert_worker_no_prompt(monkeypatch):
+    """Prompts in insert workers raise a clear error instead of reading stdin"""
+    import datajoint as dj
+
+    from spyglass.common.errors import PopulateException
+    from spyglass.data_import.insert_sessions import _init_insert_worker
+
+    monkeypatch.setattr(dj.utils, "user_choice", dj.utils.user_choice)
+    _init_insert_worker()
+    with pytest.raises(PopulateException, match="n_jobs=1"):
+        dj.utils.user_choice("Add device?")
+
+
+@pytest.mark.slow
+def test_insert_sessions_parallel(
+    mini_insert, mini_path, settings, data_import, dj_config, common
+):
+    """Sessions are inserted from worker processes with n_jobs > 1"""
+    from spyglass.utils.nwb_helper_fn import get_nwb_copy_filename
+
+    if dj_config != "dj_local_conf.json":
+        pytest.skip("Worker processes only read the default config file")
+
+    raw_names = [f"parallel{i}.nwb" for i in range(2)]
+    copy_names = [get_nwb_copy_filename(name) for name in raw_names]
+    for name in raw_names:
+        shutil.copy(mini_path, Path(settings.raw_dir) / name)
+
+    query = common.Nwbfile & [{"nwb_file_name": name} for name in copy_names]
+    try:
+        data_import.insert_sessions(raw_names, n_jobs=2)
+        assert len(query) == 2, "Sessions not inserted by worker processes"
+    finally:
+        query.delete(safemode=False)
+        for name in raw_names + copy_names:
+            (Path(settings.raw_dir) / name).unlink(missing_ok=True)
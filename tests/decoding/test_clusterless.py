@@ -11,6 +11,22 @@ def test_fetch_results(clusterless_pop, result_coordinates):
     ), "Incorrect coordinates in results"
 
 
+@pytest.mark.very_slow
+def test_fetch_results_slice(clusterless_pop):
+    times = clusterless_pop.fetch_results().time.values
+    time_range = [times[0], times[len(times) // 2]]
+    results = clusterless_pop.fetch_results(
+        time_slice=time_range, variables="acausal_posterior"
+    )
+    assert list(results.data_vars) == [
+        "acausal_posterior"
+    ], "Unexpected variables in sliced results"
+    assert (
+        results.time.min() >= time_range[0]
+        and results.time.max() <= time_range[1]
+    ), "Sliced results out of time range"
+
+
 @pytest.mark.skip(reason="JAX issues")
 def test_fetch_model(clusterless_pop):
     from non_local_detector.models.base import ClusterlessDetector
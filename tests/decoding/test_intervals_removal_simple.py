@@ -10,6 +10,7 @@ These are fast unit tests with no database dependencies.
 import logging
 
 import numpy as np
+import pandas as pd
 import pytest
 import xarray as xr
 
@@ -408,6 +409,102 @@ class TestGetValidKwargs:
         assert "custom_fit_param" not in caplog.text.split("will be ignored")[0]
 
 
+# ============================================================================
+# Tests for predict_intervals
+# ============================================================================
+
+
+@pytest.fixture
+def predict_intervals():
+    """Import predict_intervals inside fixture to defer database connection."""
+    from spyglass.decoding.v1.utils import predict_intervals
+
+    return predict_intervals
+
+
+class MockPredictClassifier:
+    """Mock fitted classifier returning the predicted time points."""
+
+    def predict(self, position_time, position, spike_times, time):
+        """Mock predict returning position at each time."""
+        return xr.Dataset(
+            {"posterior": (["time"], position[:, 0] + len(spike_times))},
+            coords={"time": time},
+        )
+
+
+class TestPredictIntervals:
+    """Tests for the predict_intervals function."""
+
+    @pytest.fixture
+    def position_info(self):
+        import pandas as pd
+
+        time = np.arange(0, 10, 0.5)
+        return pd.DataFrame({"x": np.arange(time.size)}, index=time)
+
+    @pytest.mark.parametrize("n_jobs", [1, 3])
+    def test_results_in_interval_order(
+        self, predict_intervals, position_info, n_jobs
+    ):
+        """Parallel results match serial results, skipping empty intervals."""
+        intervals = np.array([[6.0, 8.0], [0.0, 2.0], [20.0, 21.0], [3.0, 4.0]])
+        results = predict_intervals(
+            MockPredictClassifier(),
+            position_info,
+            ["x"],
+            intervals,
+            {},
+            logging.getLogger("test"),
+            n_jobs=n_jobs,
+            spike_times=[np.array([1.0])],
+        )
+        assert len(results) == 3, "Empty interval not skipped"
+        for result, (start, end) in zip(results, intervals[[0, 1, 3]]):
+            expected = position_info.loc[start:end]
+            assert np.array_equal(result.time, expected.index)
+            assert np.array_equal(result.posterior, expected["x"] + 1)
+
+    def test_invalid_executor(self, predict_intervals, position_info):
+        """Unknown executors should raise ValueError."""
+        with pytest.raises(ValueError, match="executor"):
+            predict_intervals(
+                MockPredictClassifier(),
+                position_info,
+                ["x"],
+                np.array([[0.0, 1.0]]),
+                {},
+                logging.getLogger("test"),
+                executor="dask",
+                spike_times=[],
+            )
+
+
+def test_save_decoding_results_roundtrip(tmp_path):
+    """Chunked, compressed results load with the state_bins multiindex."""
+    pytest.importorskip("netCDF4")
+    from spyglass.decoding.v1.utils import save_decoding_results
+
+    state_bins = pd.MultiIndex.from_arrays(
+        [["Local"] * 3 + ["Non-Local"] * 3, np.tile(np.arange(3.0), 2)],
+        names=("state", "position"),
+    )
+    results = xr.Dataset(
+        {"acausal_posterior": (["time", "state_bins"], np.random.rand(50, 6))},
+        coords={"time": np.arange(50) / 10, "state_bins": state_bins},
+    )
+    path = tmp_path / "results.nc"
+    save_decoding_results(results, path, chunk_bytes=6 * 8 * 10)
+
+    loaded = xr.open_dataset(path)
+    assert loaded.acausal_posterior.encoding["chunksizes"] == (10, 6)
+    loaded = loaded.set_index(state_bins=list(loaded["state_bins"].coords))
+    assert loaded.indexes["state_bins"].equals(state_bins), "Index changed"
+    assert np.array_equal(
+        loaded.acausal_posterior, results.acausal_posterior
+    ), "Results changed by save"
+
+
 # ============================================================================
 # Tests for empty middle interval handling
 # ============================================================================
@@ -115,3 +115,77 @@ def test_pop_imported_lfp(lfp, common, mini_dict):
     # check that rerunning doesn't add duplicates
     lfp.lfp_imported.ImportedLFP().make(mini_dict)
     assert len(lfp.lfp_imported.ImportedLFP()) == 1
+
+
+def test_mad_artifact_helpers():
+    import numpy as np
+
+    from spyglass.lfp.v1.lfp_artifact_MAD_detection import (
+        _count_above_mad_thresh,
+        _extend_array_by_window,
+        _get_time_intervals_from_bool_array,
+    )
+
+    is_artifact = np.array([0, 1, 1, 0, 0, 0, 1, 0, 0, 0], dtype=bool)
+    timestamps = np.arange(10) / 10.0
+
+    assert _get_time_intervals_from_bool_array(is_artifact, timestamps) == [
+        [0.1, 0.2],
+        [0.6, 0.6],
+    ], "Unexpected artifact intervals"
+    assert _get_time_intervals_from_bool_array(~is_artifact, timestamps)[
+        -1
+    ] == [0.7, 0.9], "Unexpected valid interval at end of array"
+    assert np.array_equal(
+        _extend_array_by_window(is_artifact, 1),
+        np.array([1, 1, 1, 1, 0, 1, 1, 1, 0, 0], dtype=bool),
+    ), "Unexpected extended artifact array"
+
+    lfps = np.random.default_rng(0).normal(size=(1000, 4))
+    lfps[500] = 100
+    assert np.array_equal(
+        _count_above_mad_thresh(lfps, 6.0),
+        _count_above_mad_thresh(lfps, 6.0, chunk_bytes=8),
+    ), "MAD threshold count depends on chunk size"
+
+    from types import SimpleNamespace
+
+    from spyglass.lfp.v1.lfp_artifact_MAD_detection import (
+        mad_artifact_detector,
+    )
+
+    stamps = np.arange(1000) / 1000.0
+    from_eseries = mad_artifact_detector(
+        SimpleNamespace(data=lfps, timestamps=stamps)
+    )
+    from_loaded = mad_artifact_detector(  # data=None: must use lfp_data
+        SimpleNamespace(data=None, timestamps=stamps), lfp_data=lfps
+    )
+    assert all(
+        np.array_equal(a, b) for a, b in zip(from_eseries, from_loaded)
+    ), "MAD detection differs with preloaded lfp_data"
+
+
+def test_difference_artifact_helpers():
+    import numpy as np
+
+    from spyglass.lfp.v1.lfp_artifact_difference_detection import (
+        _local_range_above_thresh,
+        _valid_times_from_kept_inds,
+    )
+    from spyglass.utils.nwb_helper_fn import get_valid_intervals
+
+    recording = np.zeros((100, 2))
+    recording[50, 0] = 10
+    above = _local_range_above_thresh(recording, np.array([2, 48, 60]), 5, 1)
+    assert np.array_equal(
+        above, [[False, False], [True, False], [False, False]]
+    ), "Unexpected local range threshold crossings"
+
+    timestamps = np.arange(100) / 1000.0
+    kept_inds = np.array([[0, 20], [30, 100]])
+    kept_timestamps = np.concatenate([timestamps[:20], timestamps[30:]])
+    assert np.array_equal(
+        _valid_times_from_kept_inds(timestamps, kept_inds, 1000.0, 1.5),
+        get_valid_intervals(kept_timestamps, 1000.0, 1.5),
+    ), "Valid times differ from get_valid_intervals on kept timestamps"
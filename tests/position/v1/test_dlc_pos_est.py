@@ -61,6 +61,18 @@ def test_pose_est_dataframe(populate_pose_estimation):
             assert col in pose_cols, f"PoseEstimation df missing column {col}."
 
 
+def test_pose_est_dataframe_subset(populate_pose_estimation):
+    full_df = populate_pose_estimation.fetch_dataframe()
+    bodyparts, columns = ["tailTip", "tailBase"], ["x", "likelihood"]
+    sub_df = populate_pose_estimation.fetch_dataframe(
+        bodyparts=bodyparts, columns=columns
+    )
+    assert list(sub_df.columns) == [
+        (bp, col) for bp in bodyparts for col in columns
+    ], "Unexpected subset columns"
+    assert sub_df.equals(full_df[sub_df.columns]), "Subset values differ"
+
+
 @skip_if_no_dlc
 def test_fetch_video_path(sgp):
     pose_tbl = sgp.v1.position_dlc_pose_estimation.DLCPoseEstimation()
@@ -198,3 +198,194 @@ def test_nan_inds_covers_isnan_branch(sgp, dlc_df_with_nans):
     assert bad_mask[2]
     assert not np.isnan(dlc_out.iloc[1]["x"])
     assert not np.isnan(dlc_out.iloc[1]["y"])
+
+
+def _loop_span_start_stop(indices):
+    """Per-group span finder that get_span_start_stop replaced."""
+    from itertools import groupby
+    from operator import itemgetter
+
+    span_inds = []
+    for _, g in groupby(enumerate(indices), lambda x: x[1] - x[0]):
+        group = list(map(itemgetter(1), g))
+        span_inds.append((group[0], group[-1]))
+    return span_inds
+
+
+def _loop_good_spans(bad_inds_mask, inds_to_span):
+    """Pairwise span merge that get_good_spans replaced."""
+    good = _loop_span_start_stop(np.arange(len(bad_inds_mask))[~bad_inds_mask])
+    if len(good) < 1:
+        return None, good
+    elif len(good) == 1:
+        return good, good
+
+    modified_spans = []
+    for (start1, stop1), (start2, stop2) in zip(good[:-1], good[1:]):
+        check_existing = [
+            entry
+            for entry in modified_spans
+            if start1 in range(entry[0] - inds_to_span, entry[1] + inds_to_span)
+        ]
+        if len(check_existing) > 0:
+            modify_ind = modified_spans.index(check_existing[0])
+            if (start2 - stop1) <= inds_to_span:
+                modified_spans[modify_ind] = (check_existing[0][0], stop2)
+            else:
+                modified_spans[modify_ind] = (check_existing[0][0], stop1)
+                modified_spans.append((start2, stop2))
+            continue
+        if (start2 - stop1) <= inds_to_span:
+            modified_spans.append((start1, stop2))
+        else:
+            modified_spans.append((start1, stop1))
+            modified_spans.append((start2, stop2))
+    # With inds_to_span=0, the loop repeated single-frame spans
+    return good, list(dict.fromkeys(modified_spans))
+
+
+def _loop_nan_inds(dlc_df, max_dist_between, likelihood_thresh, inds_to_span):
+    """Quadratic jump screen that nan_inds replaced."""
+    idx = pd.IndexSlice
+    subthresh_inds = sorted(
+        set(np.flatnonzero(dlc_df["likelihood"] < likelihood_thresh))
+        | set(np.flatnonzero(np.isnan(dlc_df["x"])))
+    )
+    dlc_df.loc[idx[dlc_df.index[subthresh_inds]], idx[("x", "y")]] = np.nan
+
+    subthresh_inds_mask = np.zeros(len(dlc_df), dtype=bool)
+    subthresh_inds_mask[subthresh_inds] = True
+    jump_inds_mask = np.zeros(len(dlc_df), dtype=bool)
+    _, good_spans = _loop_good_spans(subthresh_inds_mask, inds_to_span)
+    if len(good_spans) == 0:
+        raise ValueError("No good spans found in the data")
+
+    def is_jump(ind, last_good_ind):
+        good_x, good_y = dlc_df.loc[
+            idx[dlc_df.index[last_good_ind]], ["x", "y"]
+        ]
+        return (
+            (dlc_df.y.iloc[ind] < int(good_y - max_dist_between))
+            | (dlc_df.y.iloc[ind] > int(good_y + max_dist_between))
+        ) | (
+            (dlc_df.x.iloc[ind] < int(good_x - max_dist_between))
+            | (dlc_df.x.iloc[ind] > int(good_x + max_dist_between))
+        )
+
+    for span in good_spans[::-1]:
+        nan_mask = np.isnan(dlc_df.iloc[span[0] : span[-1]].x)
+        if np.sum(nan_mask) > 0:
+            good_start = np.arange(span[0], span[1])[~nan_mask]
+            start_point = good_start[int(len(good_start) // 2)]
+        else:
+            start_point = span[0] + int((span[-1] - span[0]) // 2)
+
+        for ind in range(start_point, span[0], -1):
+            if subthresh_inds_mask[ind]:
+                continue
+            previous_good_inds = np.where(
+                np.logical_and(
+                    ~np.isnan(dlc_df.iloc[ind + 1 : start_point].x),
+                    ~jump_inds_mask[ind + 1 : start_point],
+                    ~subthresh_inds_mask[ind + 1 : start_point],
+                )
+            )[0]
+            last_good_ind = (
+                ind + 1 + np.min(previous_good_inds)
+                if len(previous_good_inds) > 0
+                else start_point
+            )
+            jump_inds_mask[ind] |= is_jump(ind, last_good_ind)
+        for ind in range(start_point, span[-1], 1):
+            if subthresh_inds_mask[ind]:
+                continue
+            previous_good_inds = np.where(
+                np.logical_and(
+                    ~np.isnan(dlc_df.iloc[start_point:ind].x),
+                    ~jump_inds_mask[start_point:ind],
+                    ~subthresh_inds_mask[start_point:ind],
+                )
+            )[0]
+            last_good_ind = (
+                start_point + np.max(previous_good_inds)
+                if len(previous_good_inds) > 0
+                else start_point
+            )
+            jump_inds_mask[ind] |= is_jump(ind, last_good_ind)
+        bad_inds_mask = np.logical_or(jump_inds_mask, subthresh_inds_mask)
+        dlc_df.loc[bad_inds_mask, idx[("x", "y")]] = np.nan
+    return dlc_df, bad_inds_mask
+
+
+_rng = np.random.default_rng(0)
+
+
+@pytest.mark.parametrize(
+    "bad_inds_mask",
+    [
+        np.zeros(0, dtype=bool),  # empty
+        np.ones(8, dtype=bool),  # all bad
+        np.zeros(8, dtype=bool),  # single span
+        np.array([False, True, False, True, False]),  # single-frame spans
+        *[_rng.random(200) < p for p in (0.1, 0.5, 0.9)],
+    ],
+)
+@pytest.mark.parametrize("inds_to_span", [0, 1, 3, 50])
+def test_good_spans_match_loop(sgp, bad_inds_mask, inds_to_span):
+    span_start_stop = sgp.v1.dlc_utils.get_span_start_stop
+    get_good_spans = sgp.v1.position_dlc_position.get_good_spans
+
+    good_inds = np.flatnonzero(~bad_inds_mask)
+    assert span_start_stop(good_inds) == _loop_span_start_stop(
+        good_inds
+    ), "Spans differ from loop"
+    assert get_good_spans(bad_inds_mask, inds_to_span) == _loop_good_spans(
+        bad_inds_mask, inds_to_span
+    ), "Merged spans differ from loop"
+
+
+def _random_dlc_df(n, seed, jump_first=False, jump_last=False, nan_frac=0.05):
+    rng = np.random.default_rng(seed)
+    x = rng.normal(0, 1, n).cumsum()
+    y = rng.normal(0, 1, n).cumsum()
+    jumps = rng.random(n) < 0.1
+    x[jumps] += rng.choice([-50, 50], jumps.sum())
+    if jump_first:
+        x[0] += 100
+    if jump_last:
+        y[-1] -= 100
+    x[rng.random(n) < nan_frac] = np.nan
+    return pd.DataFrame(
+        dict(x=x, y=y, likelihood=rng.random(n)), index=np.arange(n) / 30.0
+    )
+
+
+@pytest.mark.parametrize(
+    "dlc_df",
+    [
+        _random_dlc_df(1, 0, nan_frac=0),  # single sample
+        _random_dlc_df(20, 1, nan_frac=0).assign(likelihood=1.0),  # one span
+        _random_dlc_df(50, 2, jump_first=True, jump_last=True),
+        _random_dlc_df(50, 3, jump_first=True).assign(likelihood=1.0),
+        _random_dlc_df(50, 4, jump_last=True).assign(likelihood=1.0),
+        *[_random_dlc_df(300, seed) for seed in range(5, 10)],
+    ],
+)
+@pytest.mark.parametrize("inds_to_span", [0, 2, 20])
+def test_nan_inds_match_loop(sgp, dlc_df, inds_to_span):
+    nan_inds = sgp.v1.position_dlc_position.nan_inds
+    args = (5.0, 0.3, inds_to_span)
+
+    expected_df, expected_mask = _loop_nan_inds(dlc_df.copy(), *args)
+    result_df, result_mask = nan_inds(dlc_df.copy(), *args)
+
+    np.testing.assert_array_equal(result_mask, expected_mask)
+    pd.testing.assert_frame_equal(result_df, expected_df)
+
+
+def test_nan_inds_all_nan_match_loop(sgp):
+    dlc_df = _random_dlc_df(20, 0).assign(x=np.nan)
+    with pytest.raises(ValueError):
+        _loop_nan_inds(dlc_df.copy(), 5.0, 0.3, 2)
+    with pytest.raises(ValueError):
+        sgp.v1.position_dlc_position.nan_inds(dlc_df.copy(), 5.0, 0.3, 2)
@@ -0,0 +1,74 @@
+from types import SimpleNamespace
+
+import numpy as np
+import pandas as pd
+import pytest
+
+
+@pytest.fixture(scope="module")
+def ripple_v1(common):
+    from spyglass.ripple.v1 import ripple
+
+    ripple.RippleParameters().insert_default()
+
+    yield ripple
+
+
+def test_ripple_inputs_invalidation(ripple_v1, monkeypatch):
+    """Cached inputs are reloaded when the upstream hash changes."""
+    from spyglass.utils.nwb_helper_fn import LRUCache
+
+    table = ripple_v1.RippleTimesV1
+    key = {name: None for name in table().primary_key}
+    key["ripple_param_name"] = "default"
+
+    upstream = dict(hash="first")
+    loads = []
+
+    def load(cls, key, ripple_params):
+        loads.append(key)
+        return SimpleNamespace(key=key)
+
+    monkeypatch.setattr(table, "_inputs_cache", LRUCache(max_items=2))
+    monkeypatch.setattr(
+        table, "_upstream_hash", staticmethod(lambda *_: upstream["hash"])
+    )
+    monkeypatch.setattr(table, "_load_ripple_inputs", classmethod(load))
+
+    first = table.get_ripple_inputs(key)
+    assert table.get_ripple_inputs(key) is first, "Cached inputs not reused"
+
+    upstream["hash"] = "second"  # e.g., LFP band recomputed to a new file
+    assert table.get_ripple_inputs(key) is not first, "Stale inputs reused"
+    assert len(loads) == 2, "Unexpected number of input loads"
+
+
+def test_ripple_inputs_join(ripple_v1, monkeypatch):
+    """Joined LFPs match the valid intervals and are not kept."""
+    timestamps = np.arange(0, 10, 0.5)
+    data = np.arange(len(timestamps) * 3, dtype=float).reshape(-1, 3)
+    monkeypatch.setattr(
+        ripple_v1.RippleInputs,
+        "lfp_band",
+        SimpleNamespace(timestamps=timestamps, data=data),
+    )
+    inputs = ripple_v1.RippleInputs(
+        key=dict(),
+        ripple_params=dict(speed_name="speed"),
+        electrode_columns=np.array([0, 2]),
+        sampling_frequency=2.0,
+        speed=pd.DataFrame(
+            dict(speed=np.arange(10.0)), index=pd.Index(np.arange(10.0))
+        ),
+        valid_times=np.array([[1.0, 2.0], [5.0, 6.0]]),
+    )
+    attrs = set(vars(inputs))
+
+    speed, lfps = inputs.join()
+    in_valid = ((timestamps >= 1) & (timestamps <= 2)) | (
+        (timestamps >= 5) & (timestamps <= 6)
+    )
+    assert np.array_equal(lfps.index, timestamps[in_valid]), "Unexpected time"
+    assert np.array_equal(lfps.to_numpy(), data[in_valid][:, [0, 2]])
+    assert np.allclose(speed.to_numpy(), timestamps[in_valid])
+    assert set(vars(inputs)) == attrs, "Joined LFPs kept on memoized inputs"
@@ -137,3 +137,35 @@ def test_calculate_isi_violation(
     assert np.isclose(
         result, expected_result
     ), f"Expected {expected_result}, got {result}"
+
+
+def test_pair_metric_matrices(calc_ca, calc_isi):
+    from itertools import permutations
+
+    from scipy.stats import pearsonr
+
+    from spyglass.spikesorting.utils_burst import (
+        correlogram_asymmetry_matrix,
+        isi_violation_matrix,
+        waveform_similarity_matrix,
+    )
+
+    rng = np.random.default_rng(0)
+    waves = rng.normal(size=(4, 40))
+    times = [np.sort(rng.uniform(0, 1, n)) for n in (0, 50, 80, 120)]
+    bins = np.linspace(-50, 50, 21)
+    ccgs = rng.integers(0, 4, size=(4, 4, 21)).astype(float)
+
+    wf_sim = waveform_similarity_matrix(waves)
+    isi = isi_violation_matrix(times)
+    ca = correlogram_asymmetry_matrix(bins, ccgs)
+    for u1, u2 in permutations(range(4), 2):
+        assert np.isclose(
+            wf_sim[u1, u2], pearsonr(waves[u1], waves[u2]).statistic
+        ), "Waveform similarity differs from pearsonr"
+        assert isi[u1, u2] == calc_isi(
+            times[u1], times[u2]
+        ), "ISI violation differs from pairwise calculation"
+        assert np.isclose(
+            ca[u1, u2], calc_ca(bins, ccgs[u1, u2])
+        ), "Correlogram asymmetry differs from pairwise calculation"
@@ -1,3 +1,19 @@
 def test_metric_curation(spike_v1, pop_curation_metric):
     ret = spike_v1.CurationV1 & pop_curation_metric & "description LIKE 'a%'"
     assert len(ret) == 1, "CurationV1.insert_curation failed to insert a record"
+
+
+def test_parallel_metrics(spike_v1, pop_metric):
+    tbl = spike_v1.MetricCuration()
+    waveforms = tbl.get_waveforms(pop_metric)
+    metric_params = {
+        "isi_violation": {},
+        "num_spikes": {},
+        "peak_channel": {"peak_sign": "neg"},
+    }
+    serial = tbl._compute_metrics(waveforms, metric_params, n_jobs=1)
+    parallel = tbl._compute_metrics(waveforms, metric_params, n_jobs=4)
+    assert serial == parallel, "Parallel metrics differ from serial metrics"
+    assert set(serial["num_spikes"]) == set(
+        waveforms.sorting.get_unit_ids()
+    ), "Metric missing units"
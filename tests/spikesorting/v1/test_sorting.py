@@ -1,4 +1,6 @@
+import numpy as np
 import pytest
+import spikeinterface as si
 
 
 @pytest.mark.slow
@@ -12,3 +14,28 @@ def test_sorting(spike_v1, pop_sort):
     """
     n_sorts = len(spike_v1.SpikeSorting & pop_sort)
     assert n_sorts >= 1, "SpikeSorting population failed"
+
+
+def test_artifact_zero_ranges(spike_v1):
+    import spikeinterface.preprocessing as sip
+
+    from spyglass.spikesorting.v1.sorting import _artifact_zero_ranges
+
+    traces = np.ones((100, 2), dtype=np.float32)
+    zero_ranges = _artifact_zero_ranges(np.array([[5, 39], [60, 99]]), 100)
+    assert zero_ranges.tolist() == [[0, 5], [40, 60]], "Unexpected ranges"
+
+    recording = sip.silence_periods(
+        si.NumpyRecording(traces, sampling_frequency=1000.0),
+        list_periods=[zero_ranges.tolist()],
+        mode="zeros",
+    )
+    expected = traces.copy()
+    expected[0:5] = expected[40:60] = 0
+
+    assert np.array_equal(
+        recording.get_traces(), expected
+    ), "Zeroed ranges differ"
+    assert np.array_equal(
+        recording.get_traces(start_frame=50, end_frame=70), expected[50:70]
+    ), "Zeroed ranges differ within a trace window"
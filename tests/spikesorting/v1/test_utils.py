@@ -65,3 +65,54 @@ def test_fetch_data(
     assert all(flat_tuple >= rng[0]) and all(
         flat_tuple <= rng[1]
     ), "Out of range"
+
+
+@pytest.fixture(scope="module")
+def group_time(spike_v1_group, pop_spikes_group):
+    spike_times = spike_v1_group.SortedSpikesGroup().fetch_spike_data(
+        pop_spikes_group
+    )
+    flat_spikes = np.concatenate(spike_times)
+    yield np.arange(flat_spikes.min(), flat_spikes.max(), 1 / 500)
+
+
+def test_sparse_spike_indicator(spike_v1_group, pop_spikes_group, group_time):
+    group = spike_v1_group.SortedSpikesGroup()
+    dense = group.get_spike_indicator(pop_spikes_group, group_time)
+    sparse = group.get_spike_indicator(
+        pop_spikes_group, group_time, sparse=True
+    )
+    counts = group.get_spike_indicator(
+        pop_spikes_group, group_time, dtype=np.uint16
+    )
+    assert np.array_equal(dense, sparse.toarray()), "Sparse indicator differs"
+    assert np.array_equal(dense, counts), "Integer indicator differs"
+
+    multiunit = group.get_multiunit_spike_count(pop_spikes_group, group_time)
+    assert np.array_equal(
+        dense.sum(axis=1, keepdims=True), multiunit
+    ), "Multiunit count differs from summed indicator"
+
+
+@pytest.mark.parametrize("multiunit", [False, True])
+def test_iter_firing_rate(
+    spike_v1_group, pop_spikes_group, group_time, multiunit
+):
+    group = spike_v1_group.SortedSpikesGroup()
+    full = group.get_firing_rate(
+        pop_spikes_group, group_time, multiunit=multiunit
+    )
+    chunks = list(
+        group.iter_firing_rate(
+            pop_spikes_group,
+            group_time,
+            chunk_size=len(group_time) // 3,
+            multiunit=multiunit,
+        )
+    )
+    assert np.array_equal(
+        np.concatenate([t for t, _ in chunks]), group_time
+    ), "Chunked firing rate times differ"
+    assert np.allclose(
+        np.concatenate([r for _, r in chunks]), full
+    ), "Chunked firing rate differs from full firing rate"
@@ -48,6 +48,14 @@ def test_chain_getitem(chain):
     assert by_int == by_str, "Getitem by int and str not equal."
 
 
+def test_chain_memo_reset(chain):
+    """Test that a reused chain does not keep memos across queries."""
+    stale_key = ("exists", chain.parent, "stale")
+    chain._bridge_cache[stale_key] = True
+    chain.cascade()
+    assert stale_key not in chain._bridge_cache, "Stale memo kept by chain."
+
+
 def test_nolink_join(no_link_chain):
     assert no_link_chain.cascade() is None, "Unexpected join of no link chain."
 
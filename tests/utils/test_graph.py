@@ -119,6 +119,30 @@ def test_rg_add_list(add_graph_rgs, add_graph_tables):
     ), "Unexpected child restricted table length for union of rg_1 and rg_2."
 
 
+def test_rg_multi_leaf(add_graph_tables):
+    """Test multi-leaf cascade returns the union of per-leaf cascades."""
+    from spyglass.utils.dj_graph import RestrGraph
+
+    tables = add_graph_tables
+    rg = RestrGraph(
+        seed_table=tables["B1"],
+        leaves=[
+            {
+                "table_name": tables["B1"].full_table_name,
+                "restriction": "a_id<2",
+            },
+            {
+                "table_name": tables["B2"].full_table_name,
+                "restriction": "a_id=3",
+            },
+        ],
+        cascade=True,
+        verbose=False,
+    )
+    a_ids = rg._get_ft(tables["A"].full_table_name, with_restr=True)
+    assert set(a_ids.fetch("a_id")) == {0, 1, 3}, "Unexpected multi-leaf union"
+
+
 def test_rg_repr(restr_graph, leaf):
     """Test that the repr of a RestrGraph object is as expected."""
     repr_got = repr(restr_graph)
@@ -128,6 +152,21 @@ def test_rg_repr(restr_graph, leaf):
     assert to_camel_case(leaf.table_name) in repr_got, "Table name not in repr."
 
 
+def test_rg_graph_snapshot(restr_graph, leaf):
+    """Test that graphs share one snapshot without sharing node attributes."""
+    from spyglass.utils.dj_graph import RestrGraph, get_graph_snapshot
+
+    snapshot, undirect_graph = get_graph_snapshot(leaf.connection)
+    new_graph = RestrGraph(seed_table=leaf, verbose=False)
+
+    assert new_graph.undirect_graph is undirect_graph, "Snapshot not reused."
+    assert new_graph.graph is not snapshot, "Snapshot not copied."
+    assert restr_graph.restr_ft, "Expected restricted nodes in RestrGraph."
+    assert not any(
+        "restr" in node for node in snapshot.nodes.values()
+    ), "Node attributes leaked into snapshot."
+
+
 def test_rg_len(restr_graph):
     assert len(restr_graph) == len(
         restr_graph.restr_ft
@@ -88,3 +88,31 @@ def test_nwb_hasher(nwb_hasher):
 
     skipped_obj = SimpleNamespace(name="version")
     assert nwb_hasher.hash_dataset(skipped_obj) is None
+
+
+@pytest.mark.slow
+def test_nwb_hasher_v2(mini_path, nwb_hasher):
+    from spyglass.utils.nwb_hash import NwbfileHasher
+
+    hashes = [
+        NwbfileHasher(
+            mini_path, precision_lookup=5, hash_version=2, n_threads=n
+        ).hash
+        for n in (1, 4)
+    ]
+    assert len(hashes[0]) == 32, "Unexpected v2 hash length"
+    assert hashes[0].startswith("v2:"), "v2 hash not tagged"
+    assert hashes[0] == hashes[1], "v2 hash depends on thread count"
+    assert hashes[0] != nwb_hasher.hash, "v2 hash should differ from v1"
+
+
+def test_hash_version_tag():
+    from spyglass.utils.nwb_hash import format_hash, get_hash_version
+
+    digest = "0123456789abcdef" * 2
+    assert format_hash(digest, 1) == digest, "v1 hash should be untagged"
+    assert get_hash_version(digest) == 1, "Untagged hash should be v1"
+
+    tagged = format_hash(digest, 2)
+    assert len(tagged) == 32, "Tagged hash should fit varchar(32)"
+    assert get_hash_version(tagged) == 2, "Tagged hash version not read"
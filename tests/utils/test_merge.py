@@ -91,3 +91,39 @@ def test_merge_get_class(merge_table):
 def test_merge_get_class_invalid(spike_merge, pop_spike_merge):
     ret = spike_merge.merge_get_parent_class("bad")
     assert ret is None, "Should return None for invalid part name."
+
+
+def test_fetch_nwb_merge_ids(pos_merge):
+    nwb_list, merge_ids = pos_merge.fetch_nwb(return_merge_ids=True)
+    assert len(nwb_list) == len(merge_ids), "Merge ids not aligned with files."
+    assert set(merge_ids) == set(
+        pos_merge.fetch("merge_id")
+    ), "Merge ids differ from master rows."
+
+
+def test_fetch_nwb_parent_override(spike_merge, imported_spike, mini_dict):
+    """Test merge fetch_nwb keeps ImportedSpikeSorting annotations."""
+    imported = imported_spike.ImportedSpikeSorting()
+    query = imported & mini_dict
+    if not query:
+        pytest.skip("No imported spike sorting for test file")
+
+    key = query.fetch1("KEY")
+    unit_id = int(query.fetch_nwb()[0]["object_id"].index[0])
+    imported.add_annotation(
+        key,
+        id=unit_id,
+        label="merge_test",
+        annotations=dict(merge_test_metric=1.0),
+        merge_annotations=True,
+    )
+    try:
+        merge_keys = (spike_merge.ImportedSpikeSorting & key).fetch(
+            "merge_id", as_dict=True
+        )
+        units = (spike_merge & merge_keys).fetch_nwb()[0]["object_id"]
+        assert (
+            "merge_test_metric" in units.columns
+        ), "Parent fetch_nwb annotations lost through merge table."
+    finally:
+        (imported.Annotations & key).delete_quick()
@@ -113,6 +113,15 @@ def test_compare_versions(common):
     compare_func("0.1.0", "0.1.1")
 
 
+def test_called_funcs(common):
+    def head():  # banned caller for export logging
+        return common.Nwbfile()._called_funcs()
+
+    funcs = head()
+    assert {"head", "test_called_funcs"} <= funcs, "Callers not found"
+    assert "_called_funcs" not in funcs, "Ignored caller reported"
+
+
 @pytest.fixture
 def custom_table():
     """Custom table on user prefix for testing load_shared_schemas."""
@@ -194,3 +203,24 @@ def test_test_mode_property_uses_settings(schema_test, Mixin):
     assert (
         test_mode_value is True
     ), "_test_mode should be True in test environment"
+
+
+def test_verified_filepath_skip_unchanged(tmp_path):
+    from uuid import uuid4
+
+    from spyglass.utils.mixins.fetch import _verified_filepath
+
+    path = tmp_path / "file.nwb"
+    path.write_bytes(b"changed contents")
+    mtime = path.stat().st_mtime
+    info = dict(path=path, size=path.stat().st_size, contents_hash=uuid4())
+
+    assert _verified_filepath(dict(info, registered=mtime + 60), True) == str(
+        path
+    ), "Checksum not skipped for file unchanged since registration"
+    assert (
+        _verified_filepath(dict(info, registered=mtime - 60), True) is None
+    ), "Checksum skipped for file modified after registration"
+    assert (
+        _verified_filepath(dict(info, registered=mtime + 60)) is None
+    ), "Checksum skipped without skip_unchanged"
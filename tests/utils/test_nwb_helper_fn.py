@@ -145,3 +145,67 @@ def test_get_pos_dict_with_timestamps():
         np.array([[-1e-7, 3.3 + 1e-7]]),
         atol=1e-9,
     )
+
+
+def test_lru_cache():
+    from spyglass.utils.nwb_helper_fn import LRUCache
+
+    evicted = []
+    cache = LRUCache(
+        max_items=2,
+        max_bytes=10,
+        size_func=len,
+        on_evict=lambda key, _: evicted.append(key),
+    )
+    cache["a"], cache["b"] = "aaa", "bbb"
+    assert cache.get("a") == "aaa", "Unexpected cached value"
+    cache["c"] = "ccc"  # over max_items, evicts least recently used
+    assert evicted == ["b"], "Expected least recently used item evicted"
+
+    cache["d"] = "dddddddd"  # over max_bytes
+    assert evicted == ["b", "a", "c"], "Expected eviction by size"
+    assert cache.get("b") is None, "Evicted item still cached"
+
+    stats = cache.stats
+    assert (stats["hits"], stats["misses"], stats["evictions"]) == (1, 1, 3)
+    assert (stats["items"], stats["bytes"]) == (1, 8), "Unexpected usage"
+
+
+def test_nwb_cache_evict_keeps_file_open(tmp_path):
+    from spyglass.utils.nwb_helper_fn import (
+        NWB_CACHE_MAX_BYTES,
+        NWB_CACHE_MAX_FILES,
+        _open_nwb_file,
+        get_cache_stats,
+        get_nwb_file,
+        set_cache_limits,
+    )
+
+    paths = []
+    for name in ("first", "second"):
+        nwbfile = pynwb.NWBFile(
+            session_description=name,
+            identifier=name,
+            session_start_time=datetime.datetime.now(datetime.timezone.utc),
+        )
+        nwbfile.add_acquisition(
+            pynwb.TimeSeries(
+                name="series", data=np.arange(10.0), unit="m", rate=1.0
+            )
+        )
+        paths.append(str(tmp_path / f"{name}.nwb"))
+        with pynwb.NWBHDF5IO(paths[-1], "w") as io:
+            io.write(nwbfile)
+
+    set_cache_limits(max_files=1)
+    try:
+        series = get_nwb_file(paths[0]).acquisition["series"]
+        evictions = get_cache_stats()["nwb_files"]["evictions"]
+
+        _ = _open_nwb_file(paths[1])  # evicts the first file
+        assert (
+            get_cache_stats()["nwb_files"]["evictions"] == evictions + 1
+        ), "Expected first file evicted"
+        np.testing.assert_array_equal(series.data[:], np.arange(10.0))
+    finally:
+        set_cache_limits(NWB_CACHE_MAX_FILES, NWB_CACHE_MAX_BYTES)
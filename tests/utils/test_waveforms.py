@@ -0,0 +1,70 @@
+from pathlib import Path
+
+import pytest
+
+
+@pytest.fixture(scope="module")
+def rec_sort():
+    import spikeinterface as si
+
+    recording, sorting = si.generate_ground_truth_recording(
+        durations=[2.0], num_channels=4, num_units=3, seed=0
+    )
+    yield recording, sorting
+
+
+def test_waveform_store(base_dir, rec_sort):
+    from spyglass.utils.waveforms import WaveformStore, waveform_key
+
+    recording, sorting = rec_sort
+    params = dict(ms_before=1.0, ms_after=1.0, sparse=False)
+    store = WaveformStore(base_dir=base_dir / "tmp" / "test_waveform_store")
+
+    assert waveform_key(recording, sorting, params) == waveform_key(
+        recording, sorting, dict(params, n_jobs=4)
+    ), "Job kwargs changed waveform key"
+
+    waves1 = store.get(recording, sorting, params)
+    waves2 = store.get(recording, sorting, dict(params, n_jobs=1))
+    assert waves1.folder == waves2.folder, "Identical extraction not reused"
+    assert len(store._entries()) == 1, "Unexpected number of stored entries"
+
+    assert store.evict(max_bytes=0) == 0, "Evicted waveforms in use"
+    store.release(waves1)
+    store.release(waves2)
+    assert store.evict(max_bytes=0) == 1, "Unused waveforms not evicted"
+
+
+def test_waveform_store_leases(base_dir, rec_sort, monkeypatch):
+    import os
+    import socket
+    import subprocess
+    import sys
+
+    from spyglass.utils import waveforms as waveforms_module
+    from spyglass.utils.waveforms import WAVEFORM_LEASE_PREFIX, WaveformStore
+
+    recording, sorting = rec_sort
+    params = dict(ms_before=1.0, ms_after=1.0, sparse=False)
+    store = WaveformStore(base_dir=base_dir / "tmp" / "test_waveform_leases")
+
+    waves = store.get(recording, sorting, params)
+    folder = Path(waves.folder)
+    store.release(waves)
+
+    # Lease held by a running process on this host, e.g. the parent
+    host = socket.gethostname()
+    lease = folder / f"{WAVEFORM_LEASE_PREFIX}{host}_{os.getppid()}"
+    lease.touch()
+    assert store.evict(max_bytes=0) == 0, "Evicted waveforms leased elsewhere"
+
+    warnings = []
+    monkeypatch.setattr(waveforms_module.logger, "warning", warnings.append)
+    store.release(store.get(recording, sorting, params, overwrite=True))
+    assert warnings, "No warning for skipped overwrite"
+
+    # Lease left by a process that has exited
+    proc = subprocess.Popen([sys.executable, "-c", "pass"])
+    proc.wait()
+    lease.rename(folder / f"{WAVEFORM_LEASE_PREFIX}{host}_{proc.pid}")
+    assert store.evict(max_bytes=0) == 1, "Stale lease blocked eviction"